@@ -20,6 +20,7 @@ from coolbox.utils import (  # noqa: E402
     clear_local_host_cache,
     clear_http_cache,
     clear_ping_cache,
+    clear_rtt_cache,
     ports_as_range,
     parse_ports,
     parse_hosts,
@@ -213,6 +214,7 @@ async def main(argv: Sequence[str] | None = None) -> None:
         clear_local_host_cache()
         clear_http_cache()
         clear_ping_cache()
+        clear_rtt_cache()
 
     if args.top is not None:
         port_list = TOP_PORTS[: max(1, min(args.top, len(TOP_PORTS)))]
@@ -96,6 +96,17 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=int(os.getenv("FORCE_QUIT_MAX", "20")),
         help="Maximum number of processes to display",
     )
+    parser.add_argument(
+        "--sampler",
+        choices=["auto", "procfs", "psutil"],
+        default=os.getenv("FORCE_QUIT_SAMPLER", "auto").lower(),
+        help="Process sampling backend",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Time the /proc sampler against psutil and exit",
+    )
     return parser.parse_args(argv)
 
 
@@ -115,7 +126,24 @@ def make_table(snapshot: dict[int, ProcessEntry], limit: int) -> Table:
     return table
 
 
+def run_benchmark(console: Console | None = None, rounds: int = 5) -> dict[str, float]:
+    from coolbox.utils.processes.procfs import benchmark_samplers
+
+    result = benchmark_samplers(rounds)
+    table = Table(title=f"Process sampling ({int(result['processes'])} processes)")
+    table.add_column("Backend")
+    table.add_column("ms/sweep", justify="right")
+    table.add_row("psutil", f"{result['psutil'] * 1000:.2f}")
+    table.add_row("procfs", f"{result['procfs'] * 1000:.2f}")
+    table.caption = f"speedup {result['speedup']:.1f}x"
+    (console or Console()).print(table)
+    return result
+
+
 def run_cli(args: argparse.Namespace) -> None:
+    if getattr(args, "benchmark", False):
+        run_benchmark()
+        return
     q: Queue = Queue()
     watcher = ProcessWatcher(
         q,
@@ -131,6 +159,7 @@ def run_cli(args: argparse.Namespace) -> None:
         max_worker_limit=args.max_workers,
         limit=args.limit,
         ignore_names={n.strip().lower() for n in args.ignore_names.split(',') if n.strip()},
+        sampler=getattr(args, "sampler", "auto"),
     )
     watcher.start()
     console = Console()
@@ -50,6 +50,10 @@ _add_exports(
     [
         "CacheItem",
         "CacheManager",
+        "CacheBackend",
+        "JsonFileBackend",
+        "LogStructuredBackend",
+        "SQLiteBackend",
     ],
 )
 
@@ -140,6 +144,9 @@ _add_exports(
         "async_scan_targets_list",
         "async_auto_scan_iter",
         "async_auto_scan",
+        "async_auto_scan_diff_iter",
+        "async_auto_scan_diff",
+        "ScanDelta",
         "async_scan_hosts_iter",
         "async_scan_hosts_detailed",
         "async_get_http_info",
@@ -159,6 +166,7 @@ _add_exports(
         "async_get_hostname",
         "auto_scan_info_to_dict",
         "auto_scan_results_to_dict",
+        "auto_scan_info_from_dict",
         "clear_dns_cache",
         "clear_local_host_cache",
         "parse_port_range",
@@ -169,7 +177,11 @@ _add_exports(
         "clear_host_cache",
         "clear_http_cache",
         "clear_ping_cache",
+        "clear_rtt_cache",
+        "clear_auto_scan_state",
         "clear_arp_cache",
+        "host_rtt_estimate",
+        "warm_rtt_estimates",
         "TOP_PORTS",
         "PortInfo",
     ],
@@ -1,7 +1,15 @@
 """File-system helpers, cache utilities, and related abstractions."""
 from __future__ import annotations
 
-from .cache import CacheItem, CacheManager
+from .cache import (
+    CacheBackend,
+    CacheItem,
+    CacheManager,
+    JsonFileBackend,
+    LogStructuredBackend,
+    SQLiteBackend,
+    make_backend,
+)
 from .file_manager import (
     FileManagerError,
     atomic_write,
@@ -27,8 +35,13 @@ from .file_manager import (
 )
 
 __all__ = [
+    "CacheBackend",
     "CacheItem",
     "CacheManager",
+    "JsonFileBackend",
+    "LogStructuredBackend",
+    "SQLiteBackend",
+    "make_backend",
     "FileManagerError",
     "atomic_write",
     "atomic_write_bytes",
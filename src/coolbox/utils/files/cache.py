@@ -5,9 +5,13 @@ from pathlib import Path
 from typing import Dict, Generic, TypeVar, Iterable, Callable
 
 from .file_manager import atomic_write
+import atexit
 import json
+import os
+import sqlite3
 import time
 import threading
+import weakref
 
 T = TypeVar("T")
 
@@ -21,68 +25,941 @@ class CacheItem(Generic[T]):
     value: T
 
 
-class CacheManager(Generic[T]):
-    """Thread-safe disk-backed cache with TTL support.
+def _expired(item: CacheItem[T], now: float) -> bool:
+    """Return ``True`` when *item* has a positive TTL that elapsed."""
+
+    return item.ttl > 0 and now - item.timestamp >= item.ttl
+
 
-    The manager tracks the modification time of the backing file so
-    updates written by other processes are picked up automatically. A
-    lock guards internal state so the cache can be safely used from
-    multiple threads.
+class CacheBackend(Generic[T]):
+    """Storage engine used by :class:`CacheManager` to persist entries.
+
+    The manager owns the in-memory mapping and hands every mutation to the
+    backend individually so each engine can decide how much I/O a change
+    costs. All methods are called with the manager's lock held.
+    """
+
+    def load(self) -> Dict[str, CacheItem[T]]:
+        """Return all entries currently persisted."""
+
+        raise NotImplementedError
+
+    def refresh(self, cache: Dict[str, CacheItem[T]]) -> bool:
+        """Apply changes written by other processes to *cache*.
+
+        Returns ``True`` when *cache* was modified.
+        """
+
+        return False
+
+    def put(self, key: str, item: CacheItem[T], cache: Dict[str, CacheItem[T]]) -> None:
+        """Persist *item* under *key*; *cache* already contains it."""
+
+        raise NotImplementedError
+
+    def delete(self, keys: Iterable[str], cache: Dict[str, CacheItem[T]]) -> None:
+        """Persist removal of *keys*; they are already gone from *cache*."""
+
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop all persisted entries."""
+
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Force buffered writes to stable storage."""
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+        self.flush()
+
+
+class JsonFileBackend(CacheBackend[T]):
+    """Persist the whole cache as a single JSON document.
+
+    Every mutation rewrites the file atomically, which keeps the format easy
+    to inspect by hand at the cost of O(n) I/O per write.
     """
 
     def __init__(self, file: Path) -> None:
         self.file = file
-        self._cache: Dict[str, CacheItem[T]] = self._load()
-        self._mtime: float = self.file.stat().st_mtime if self.file.exists() else 0.0
-        self.hits = 0
-        self.misses = 0
-        self._lock = threading.RLock()
+        self._sig: tuple[int, int, int] | None = self._stat()
 
-    # -- persistence helpers -------------------------------------------------
-    def _load(self) -> Dict[str, CacheItem[T]]:
+    def _stat(self) -> tuple[int, int, int] | None:
+        try:
+            st = self.file.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def load(self) -> Dict[str, CacheItem[T]]:
+        self._sig = self._stat()
         try:
             raw = json.loads(self.file.read_text())
+            data: Dict[str, CacheItem[T]] = {}
+            for k, v in raw.items():
+                data[k] = CacheItem(
+                    float(v.get("timestamp", 0)),
+                    float(v.get("ttl", 0)),
+                    v.get("value"),
+                )
         except Exception:
             return {}
+        return data
+
+    def refresh(self, cache: Dict[str, CacheItem[T]]) -> bool:
+        sig = self._stat()
+        if sig == self._sig:
+            return False
+        if sig is None:
+            self._sig = None
+            if not cache:
+                return False
+            cache.clear()
+            return True
+        loaded = self.load()
+        cache.clear()
+        cache.update(loaded)
+        return True
 
-        data: Dict[str, CacheItem[T]] = {}
-        for k, v in raw.items():
-            data[k] = CacheItem(
-                float(v.get("timestamp", 0)),
-                float(v.get("ttl", 0)),
-                v.get("value"),
+    def _save(self, cache: Dict[str, CacheItem[T]]) -> None:
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        raw = {
+            k: {"timestamp": c.timestamp, "ttl": c.ttl, "value": c.value}
+            for k, c in cache.items()
+        }
+        try:
+            atomic_write(self.file, json.dumps(raw))
+        except Exception:
+            return
+        self._sig = self._stat()
+
+    def put(self, key: str, item: CacheItem[T], cache: Dict[str, CacheItem[T]]) -> None:
+        self._save(cache)
+
+    def delete(self, keys: Iterable[str], cache: Dict[str, CacheItem[T]]) -> None:
+        self._save(cache)
+
+    def clear(self) -> None:
+        try:
+            self.file.unlink()
+        except FileNotFoundError:
+            pass
+        self._sig = None
+
+
+# Log-structured backends still holding unsynced records at interpreter exit.
+_OPEN_LOGS: "weakref.WeakSet[LogStructuredBackend]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_logs() -> None:  # pragma: no cover - interpreter shutdown
+    for backend in list(_OPEN_LOGS):
+        try:
+            backend.close()
+        except Exception:
+            pass
+
+
+class LogStructuredBackend(CacheBackend[T]):
+    """Append-only record log with background compaction.
+
+    Each ``put``/``delete`` appends one JSON line to the file through an
+    ``O_APPEND`` descriptor, so writes cost O(1) regardless of cache size.
+    ``fsync`` is batched: it runs once *fsync_batch* records are pending or
+    *fsync_interval* seconds have passed since the last sync. When the log
+    holds more than *compact_ratio* records per live entry (and at least
+    *compact_min* records) a snapshot of the live entries is rewritten to a
+    fresh file on a background thread; records appended meanwhile are carried
+    over before the new file is swapped in.
+
+    Other processes appending to the same file are picked up by reading only
+    the bytes past the last known offset. A changed inode or a shrinking file
+    means another writer compacted or cleared the log and triggers a full
+    reload. Files in the legacy single-document JSON format are converted on
+    first load.
+    """
+
+    def __init__(
+        self,
+        file: Path,
+        *,
+        fsync_interval: float = 1.0,
+        fsync_batch: int = 256,
+        compact_ratio: float = 4.0,
+        compact_min: int = 1024,
+        background: bool = True,
+    ) -> None:
+        self.file = file
+        self.fsync_interval = fsync_interval
+        self.fsync_batch = fsync_batch
+        self.compact_ratio = compact_ratio
+        self.compact_min = compact_min
+        self.background = background
+        self._lock = threading.RLock()
+        self._fd: int | None = None
+        self._ino: int | None = None
+        self._offset = 0
+        self._records = 0
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._generation = 0
+        self._compacting = False
+        self._tail: list[bytes] | None = None
+        self._compact_thread: threading.Thread | None = None
+        _OPEN_LOGS.add(self)
+
+    # -- record encoding ---------------------------------------------------
+    @staticmethod
+    def _encode_put(key: str, item: CacheItem[T]) -> bytes:
+        rec = {"k": key, "t": item.timestamp, "l": item.ttl, "v": item.value}
+        return (json.dumps(rec, separators=(",", ":")) + "\n").encode()
+
+    @staticmethod
+    def _encode_delete(key: str) -> bytes:
+        return (json.dumps({"k": key, "d": 1}, separators=(",", ":")) + "\n").encode()
+
+    @staticmethod
+    def _apply(lines: Iterable[bytes], cache: Dict[str, CacheItem[T]]) -> int:
+        """Apply encoded records to *cache* and return how many were valid."""
+
+        count = 0
+        for line in lines:
+            try:
+                rec = json.loads(line)
+                key = rec["k"]
+            except Exception:
+                continue
+            count += 1
+            if rec.get("d"):
+                cache.pop(key, None)
+            else:
+                cache[key] = CacheItem(
+                    float(rec.get("t", 0)), float(rec.get("l", 0)), rec.get("v")
+                )
+        return count
+
+    @staticmethod
+    def _parse_legacy(data: bytes) -> Dict[str, CacheItem[T]] | None:
+        """Return entries if *data* is a single-document JSON cache."""
+
+        try:
+            raw = json.loads(data)
+        except Exception:
+            return None
+        if not isinstance(raw, dict) or not all(isinstance(v, dict) for v in raw.values()):
+            return None
+        return {
+            k: CacheItem(
+                float(v.get("timestamp", 0)), float(v.get("ttl", 0)), v.get("value")
             )
-        return data
+            for k, v in raw.items()
+        }
 
-    def _check_reload(self) -> None:
-        """Reload the cache from disk if the file changed."""
+    # -- file handling -----------------------------------------------------
+    def _close_fd(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            if self._pending:
+                os.fsync(self._fd)
+        except OSError:
+            pass
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+        self._fd = None
+        self._pending = 0
+
+    def _open(self) -> int:
+        if self._fd is None:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            st = os.fstat(self._fd)
+            self._ino = st.st_ino
+        return self._fd
+
+    def _append(self, data: bytes, cache: Dict[str, CacheItem[T]]) -> None:
         with self._lock:
             try:
-                mtime = self.file.stat().st_mtime
+                fd = self._open()
+                os.write(fd, data)
+                size = os.fstat(fd).st_size
+            except OSError:
+                return
+            # Only advance when nobody else appended in between; otherwise the
+            # next refresh replays the foreign records together with ours.
+            if size == self._offset + len(data):
+                self._offset = size
+            self._records += 1
+            if self._tail is not None:
+                self._tail.append(data)
+            self._pending += 1
+            now = time.monotonic()
+            if self._pending >= self.fsync_batch or now - self._last_sync >= self.fsync_interval:
+                self._sync(now)
+            self._maybe_compact(cache)
+
+    def _sync(self, now: float | None = None) -> None:
+        if self._fd is not None and self._pending:
+            try:
+                os.fsync(self._fd)
+            except OSError:
+                pass
+        self._pending = 0
+        self._last_sync = time.monotonic() if now is None else now
+
+    # -- CacheBackend API --------------------------------------------------
+    def load(self) -> Dict[str, CacheItem[T]]:
+        with self._lock:
+            self._generation += 1
+            self._tail = None
+            self._close_fd()
+            try:
+                data = self.file.read_bytes()
+                self._ino = self.file.stat().st_ino
+            except OSError:
+                self._ino = None
+                self._offset = 0
+                self._records = 0
+                return {}
+            legacy = self._parse_legacy(data) if data.lstrip()[:1] == b"{" else None
+            if legacy is not None:
+                self._offset = len(data)
+                self._rewrite(legacy, [])
+                return legacy
+            cache: Dict[str, CacheItem[T]] = {}
+            end = data.rfind(b"\n") + 1
+            self._records = self._apply(data[:end].splitlines(), cache)
+            self._offset = end
+            return cache
+
+    def refresh(self, cache: Dict[str, CacheItem[T]]) -> bool:
+        with self._lock:
+            try:
+                st = self.file.stat()
+            except FileNotFoundError:
+                if self._ino is None and not cache:
+                    return False
+                self._generation += 1
+                self._tail = None
+                self._close_fd()
+                self._ino = None
+                self._offset = 0
+                self._records = 0
+                changed = bool(cache)
+                cache.clear()
+                return changed
+            except OSError:
+                return False
+
+            if st.st_ino != self._ino or st.st_size < self._offset:
+                loaded = self.load()
+                cache.clear()
+                cache.update(loaded)
+                return True
+            if st.st_size == self._offset:
+                return False
+            try:
+                with open(self.file, "rb") as fh:
+                    fh.seek(self._offset)
+                    chunk = fh.read(st.st_size - self._offset)
+            except OSError:
+                return False
+            end = chunk.rfind(b"\n") + 1
+            if not end:
+                return False
+            lines = chunk[:end].splitlines(keepends=True)
+            self._records += self._apply(lines, cache)
+            self._offset += end
+            if self._tail is not None:
+                self._tail.extend(lines)
+            return True
+
+    def put(self, key: str, item: CacheItem[T], cache: Dict[str, CacheItem[T]]) -> None:
+        self._append(self._encode_put(key, item), cache)
+
+    def delete(self, keys: Iterable[str], cache: Dict[str, CacheItem[T]]) -> None:
+        data = b"".join(self._encode_delete(k) for k in keys)
+        if data:
+            self._append(data, cache)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._tail = None
+            self._close_fd()
+            try:
+                self.file.unlink()
             except FileNotFoundError:
-                if self._cache:
-                    self._cache.clear()
-                self._mtime = 0.0
+                pass
+            except OSError:
+                pass
+            self._ino = None
+            self._offset = 0
+            self._records = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        thread = self._compact_thread
+        if thread is not None and thread.is_alive():
+            thread.join()
+        with self._lock:
+            self._close_fd()
+
+    # -- compaction --------------------------------------------------------
+    def _maybe_compact(self, cache: Dict[str, CacheItem[T]]) -> None:
+        if self._compacting or self._records < self.compact_min:
+            return
+        if self._records <= self.compact_ratio * max(len(cache), 1):
+            return
+        self.compact(cache, wait=not self.background)
+
+    def compact(self, cache: Dict[str, CacheItem[T]], *, wait: bool = True) -> None:
+        """Rewrite the log so it only holds live entries from *cache*.
+
+        The snapshot is taken immediately; serialization and the file swap run
+        on a background thread unless *wait* is true.
+        """
+
+        with self._lock:
+            if self._compacting:
                 return
+            now = time.time()
+            snapshot = {k: c for k, c in cache.items() if not _expired(c, now)}
+            self._compacting = True
+            self._tail = []
+            generation = self._generation
+        if wait:
+            self._compact(snapshot, generation)
+            return
+        thread = threading.Thread(
+            target=self._compact, args=(snapshot, generation), daemon=True
+        )
+        self._compact_thread = thread
+        thread.start()
 
-            if mtime > self._mtime:
-                self._cache = self._load()
-                self._mtime = mtime
+    def _compact(self, snapshot: Dict[str, CacheItem[T]], generation: int) -> None:
+        body = b"".join(self._encode_put(k, c) for k, c in snapshot.items())
+        try:
+            with self._lock:
+                if generation != self._generation or self._tail is None:
+                    return
+                self._rewrite(snapshot, self._tail, body=body)
+        finally:
+            with self._lock:
+                self._compacting = False
+                self._tail = None
+
+    def _rewrite(
+        self,
+        entries: Dict[str, CacheItem[T]],
+        tail: list[bytes],
+        *,
+        body: bytes | None = None,
+    ) -> None:
+        """Replace the log with *entries* followed by *tail* records.
+
+        Must be called with the lock held. Bytes appended by other processes
+        past the known offset are copied over and left unread so the next
+        refresh applies them.
+        """
+
+        if body is None:
+            body = b"".join(self._encode_put(k, c) for k, c in entries.items())
+        known = body + b"".join(tail)
+        foreign = b""
+        try:
+            with open(self.file, "rb") as fh:
+                fh.seek(self._offset)
+                foreign = fh.read()
+        except OSError:
+            pass
+        foreign = foreign[: foreign.rfind(b"\n") + 1]
+        tmp = self.file.with_name(f".{self.file.name}.{os.getpid()}.compact")
+        try:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as fh:
+                fh.write(known)
+                fh.write(foreign)
+                fh.flush()
+                os.fsync(fh.fileno())
+            self._close_fd()
+            os.replace(tmp, self.file)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return
+        self._offset = len(known)
+        self._records = len(entries) + len(tail)
+        self._open()
+
+
+class SQLiteBackend(CacheBackend[T]):
+    """Cache table shared between processes through SQLite in WAL mode.
+
+    Every row carries a sequence number taken from a counter bumped by each
+    write transaction, so a reader only fetches rows newer than the last
+    sequence it applied instead of reloading the whole cache. Whether another
+    connection committed at all is answered by ``PRAGMA data_version``
+    without touching the tables. Deletes are written as tombstones so other
+    processes drop the same keys; tombstones older than *tombstone_ttl* are
+    purged and readers that fell behind the purge reload fully.
+    """
+
+    def __init__(self, file: Path, *, tombstone_ttl: float = 3600.0) -> None:
+        self.file = file
+        self.tombstone_ttl = tombstone_ttl
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._data_version = -1
+        self._seq = 0
+        self._epoch = 0
+        self._tombstones = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.file, timeout=10.0, isolation_level=None, check_same_thread=False
+            )
+            conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    timestamp REAL NOT NULL,
+                    ttl REAL NOT NULL,
+                    value TEXT,
+                    deleted INTEGER NOT NULL DEFAULT 0,
+                    seq INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_cache_entries_seq
+                    ON cache_entries(seq);
+                CREATE TABLE IF NOT EXISTS cache_meta (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO cache_meta(name, value)
+                    VALUES ('seq', 0), ('epoch', 0), ('floor', 0);
+                """
+            )
+            self._conn = conn
+        return self._conn
+
+    def _meta(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        rows = conn.execute("SELECT name, value FROM cache_meta")
+        return {name: int(value) for name, value in rows}
+
+    def _write(self, rows: list[tuple[str, float, float, str | None, int]]) -> None:
+        """Upsert *rows* in one transaction, each tagged with a fresh sequence."""
+
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(
+                        "UPDATE cache_meta SET value = value + ? WHERE name = 'seq'",
+                        (len(rows),),
+                    )
+                    (last,) = conn.execute(
+                        "SELECT value FROM cache_meta WHERE name = 'seq'"
+                    ).fetchone()
+                    first = int(last) - len(rows) + 1
+                    conn.executemany(
+                        """
+                        INSERT INTO cache_entries(key, timestamp, ttl, value, deleted, seq)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(key) DO UPDATE SET
+                            timestamp = excluded.timestamp,
+                            ttl = excluded.ttl,
+                            value = excluded.value,
+                            deleted = excluded.deleted,
+                            seq = excluded.seq
+                        """,
+                        [(*row, first + n) for n, row in enumerate(rows)],
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error:
+                return
+            # Only advance when no other writer slipped in; otherwise the next
+            # refresh replays their rows together with ours.
+            if first == self._seq + 1:
+                self._seq = int(last)
+
+    def _purge_tombstones(self) -> None:
+        conn = self._connect()
+        cutoff = time.time() - self.tombstone_ttl
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT MAX(seq) FROM cache_entries WHERE deleted = 1 AND timestamp < ?",
+                (cutoff,),
+            ).fetchone()
+            if row and row[0] is not None:
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE deleted = 1 AND seq <= ?", (row[0],)
+                )
+                conn.execute(
+                    "UPDATE cache_meta SET value = MAX(value, ?) WHERE name = 'floor'",
+                    (row[0],),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._tombstones = 0
+
+    def load(self) -> Dict[str, CacheItem[T]]:
+        with self._lock:
+            data: Dict[str, CacheItem[T]] = {}
+            try:
+                conn = self._connect()
+                self._purge_tombstones()
+                conn.execute("BEGIN")
+                try:
+                    meta = self._meta(conn)
+                    rows = conn.execute(
+                        "SELECT key, timestamp, ttl, value FROM cache_entries WHERE deleted = 0"
+                    ).fetchall()
+                finally:
+                    conn.execute("COMMIT")
+                (self._data_version,) = conn.execute("PRAGMA data_version").fetchone()
+            except sqlite3.Error:
+                return data
+            self._seq = meta.get("seq", 0)
+            self._epoch = meta.get("epoch", 0)
+            for key, ts, ttl, value in rows:
+                try:
+                    data[key] = CacheItem(float(ts), float(ttl), json.loads(value))
+                except (TypeError, ValueError):
+                    continue
+            return data
+
+    def refresh(self, cache: Dict[str, CacheItem[T]]) -> bool:
+        with self._lock:
+            try:
+                conn = self._connect()
+                (version,) = conn.execute("PRAGMA data_version").fetchone()
+                if version == self._data_version:
+                    return False
+                self._data_version = version
+                conn.execute("BEGIN")
+                try:
+                    meta = self._meta(conn)
+                    stale = (
+                        meta.get("epoch", 0) != self._epoch
+                        or meta.get("floor", 0) > self._seq
+                    )
+                    rows = [] if stale else conn.execute(
+                        "SELECT key, timestamp, ttl, value, deleted, seq FROM cache_entries"
+                        " WHERE seq > ? ORDER BY seq",
+                        (self._seq,),
+                    ).fetchall()
+                finally:
+                    conn.execute("COMMIT")
+            except sqlite3.Error:
+                return False
+            if stale:
+                loaded = self.load()
+                cache.clear()
+                cache.update(loaded)
+                return True
+            for key, ts, ttl, value, deleted, seq in rows:
+                self._seq = max(self._seq, int(seq))
+                if deleted:
+                    cache.pop(key, None)
+                    continue
+                try:
+                    cache[key] = CacheItem(float(ts), float(ttl), json.loads(value))
+                except (TypeError, ValueError):
+                    cache.pop(key, None)
+            return bool(rows)
+
+    def put(self, key: str, item: CacheItem[T], cache: Dict[str, CacheItem[T]]) -> None:
+        try:
+            value = json.dumps(item.value)
+        except (TypeError, ValueError):
+            return
+        self._write([(key, item.timestamp, item.ttl, value, 0)])
+
+    def delete(self, keys: Iterable[str], cache: Dict[str, CacheItem[T]]) -> None:
+        now = time.time()
+        rows = [(key, now, 0.0, None, 1) for key in keys]
+        if not rows:
+            return
+        self._write(rows)
+        self._tombstones += len(rows)
+        if self._tombstones >= 1024:
+            try:
+                with self._lock:
+                    self._purge_tombstones()
+            except sqlite3.Error:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute("DELETE FROM cache_entries")
+                    conn.execute(
+                        "UPDATE cache_meta SET value = value + 1 WHERE name = 'epoch'"
+                    )
+                    meta = self._meta(conn)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error:
+                return
+            self._epoch = meta.get("epoch", 0)
+            self._seq = meta.get("seq", 0)
+            self._tombstones = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._data_version = -1
+
+
+def make_backend(kind: str | CacheBackend[T] | None, file: Path) -> CacheBackend[T]:
+    """Return a storage backend for *file*.
+
+    *kind* may be an existing backend, ``None``/``"json"`` for the single
+    document format, ``"log"`` for :class:`LogStructuredBackend` or
+    ``"sqlite"`` for :class:`SQLiteBackend`. The SQLite database lives next
+    to *file* with a ``.db`` suffix.
+    """
+
+    if isinstance(kind, CacheBackend):
+        return kind
+    name = (kind or "json").lower()
+    if name == "json":
+        return JsonFileBackend(file)
+    if name == "log":
+        return LogStructuredBackend(file)
+    if name == "sqlite":
+        return SQLiteBackend(file.with_suffix(".db"))
+    raise ValueError(f"Unknown cache backend: {kind}")
+
+
+def _estimate_size(obj: object) -> int:
+    """Return an approximate serialized size of *obj* in bytes.
+
+    Mirrors the JSON encoding closely enough to budget memory and disk
+    usage without actually serializing the value.
+    """
+
+    if obj is None or isinstance(obj, bool):
+        return 4
+    if isinstance(obj, (int, float)):
+        return 8
+    if isinstance(obj, str):
+        return len(obj) + 2
+    if isinstance(obj, (bytes, bytearray)):
+        return len(obj)
+    if isinstance(obj, dict):
+        return 2 + sum(_estimate_size(k) + _estimate_size(v) + 2 for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return 2 + sum(_estimate_size(v) + 1 for v in obj)
+    return len(repr(obj))
+
+
+class _LFUIndex:
+    """Frequency buckets giving O(1) least-frequently-used victim lookup."""
+
+    def __init__(self) -> None:
+        self._freq: Dict[str, int] = {}
+        self._buckets: Dict[int, Dict[str, None]] = {}
+        self._min = 0
+
+    def touch(self, key: str) -> None:
+        freq = self._freq.get(key, 0)
+        if freq:
+            bucket = self._buckets[freq]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[freq]
+                if self._min == freq:
+                    self._min = freq + 1
+        else:
+            self._min = 1
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, {})[key] = None
+
+    def discard(self, key: str) -> None:
+        freq = self._freq.pop(key, 0)
+        if not freq:
+            return
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min == freq:
+                self._min = min(self._buckets, default=0)
+
+    def victim(self) -> str | None:
+        bucket = self._buckets.get(self._min)
+        if not bucket:
+            return None
+        return next(iter(bucket))
+
+    def clear(self) -> None:
+        self._freq.clear()
+        self._buckets.clear()
+        self._min = 0
+
+
+class CacheManager(Generic[T]):
+    """Thread-safe disk-backed cache with TTL support.
+
+    The manager tracks changes to the backing file so updates written by
+    other processes are picked up automatically. A lock guards internal
+    state so the cache can be safely used from multiple threads. Persistence
+    is delegated to a :class:`CacheBackend`; the default rewrites a single
+    JSON document while ``backend="log"`` appends one record per mutation.
+
+    *max_entries* and *max_bytes* bound the cache; once either limit is
+    exceeded entries are evicted least-recently-used first, or
+    least-frequently-used first when *eviction* is ``"lfu"``. Entry sizes
+    are estimated from the value structure rather than measured exactly.
+    """
+
+    def __init__(
+        self,
+        file: Path,
+        backend: CacheBackend[T] | str | None = None,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        eviction: str = "lru",
+    ) -> None:
+        if eviction not in {"lru", "lfu"}:
+            raise ValueError(f"Unknown eviction policy: {eviction}")
+        self.file = file
+        self.max_entries = max_entries or None
+        self.max_bytes = max_bytes or None
+        self.eviction = eviction
+        self._backend: CacheBackend[T] = make_backend(backend, file)
+        self._cache: Dict[str, CacheItem[T]] = self._backend.load()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._sizes: Dict[str, tuple[CacheItem[T], int]] = {}
+        self._lfu = _LFUIndex()
+        self._lock = threading.RLock()
+        with self._lock:
+            self._reconcile()
+            self._enforce_limits()
+
+    @property
+    def backend(self) -> CacheBackend[T]:
+        """Return the storage backend used by this cache."""
+
+        return self._backend
+
+    # -- accounting helpers --------------------------------------------------
+    def _account(self, key: str, item: CacheItem[T]) -> None:
+        """Record the estimated size of *item* stored under *key*."""
+
+        size = len(key) + _estimate_size(item.value) + 32
+        old = self._sizes.get(key)
+        if old is not None:
+            self.bytes -= old[1]
+        self._sizes[key] = (item, size)
+        self.bytes += size
+
+    def _forget(self, key: str) -> None:
+        old = self._sizes.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._lfu.discard(key)
+
+    def _discard(self, key: str) -> bool:
+        """Remove *key* from memory; return ``True`` if it was present."""
+
+        self._forget(key)
+        return self._cache.pop(key, None) is not None
+
+    def _touch(self, key: str) -> None:
+        """Mark *key* as used for the eviction policy."""
+
+        if self.eviction == "lfu":
+            self._lfu.touch(key)
+        elif self.max_entries or self.max_bytes:
+            self._cache[key] = self._cache.pop(key)
+
+    def _reconcile(self) -> None:
+        """Bring size accounting in line after the backend changed entries."""
+
+        for key in [k for k in self._sizes if k not in self._cache]:
+            self._forget(key)
+        for key, item in self._cache.items():
+            known = self._sizes.get(key)
+            if known is None or known[0] is not item:
+                self._account(key, item)
+                if known is None and self.eviction == "lfu":
+                    self._lfu.touch(key)
+
+    def _over_limit(self) -> bool:
+        return bool(
+            (self.max_entries and len(self._cache) > self.max_entries)
+            or (self.max_bytes and self.bytes > self.max_bytes)
+        )
+
+    def _enforce_limits(self) -> None:
+        """Evict entries until the cache fits its configured limits."""
+
+        evicted: list[str] = []
+        while self._cache and self._over_limit():
+            victim = self._lfu.victim() if self.eviction == "lfu" else None
+            if victim is None or victim not in self._cache:
+                victim = next(iter(self._cache))
+            self._discard(victim)
+            evicted.append(victim)
+        if evicted:
+            self.evictions += len(evicted)
+            self._backend.delete(evicted, self._cache)
+
+    # -- persistence helpers -------------------------------------------------
+    def _check_reload(self) -> None:
+        """Apply changes made to the backing store by other writers."""
+        with self._lock:
+            if self._backend.refresh(self._cache):
+                self._reconcile()
+                self._enforce_limits()
 
     def refresh(self) -> None:
         """Public method to reload the cache if the file changed."""
         self._check_reload()
 
-    def _save(self) -> None:
-        self.file.parent.mkdir(parents=True, exist_ok=True)
-        raw = {
-            k: {"timestamp": c.timestamp, "ttl": c.ttl, "value": c.value}
-            for k, c in self._cache.items()
-        }
-        try:
-            atomic_write(self.file, json.dumps(raw))
-        except Exception:
-            pass
+    def flush(self) -> None:
+        """Force pending writes of the backend to disk."""
+        with self._lock:
+            self._backend.flush()
+
+    def close(self) -> None:
+        """Flush and release the backend."""
+        with self._lock:
+            self._backend.close()
 
     # -- public API ----------------------------------------------------------
     def get(self, key: str, ttl: float | None = None) -> T | None:
@@ -100,44 +977,51 @@ class CacheManager(Generic[T]):
 
             if time.time() - item.timestamp < effective_ttl:
                 self.hits += 1
+                self._touch(key)
                 return item.value
 
-            self._cache.pop(key, None)
-            self._save()
+            self._discard(key)
+            self._backend.delete([key], self._cache)
             self.misses += 1
             return None
 
     def set(self, key: str, value: T, ttl: float) -> None:
         self._check_reload()
         with self._lock:
-            self._cache[key] = CacheItem(time.time(), ttl, value)
-            self._save()
+            item = CacheItem(time.time(), ttl, value)
+            existed = self._cache.pop(key, None) is not None
+            self._cache[key] = item
+            self._account(key, item)
+            if existed and self.eviction == "lfu":
+                self._lfu.touch(key)
+            self._backend.put(key, item, self._cache)
+            # New entries join the LFU index only after eviction so they
+            # cannot be chosen as their own victim with a count of one.
+            self._enforce_limits()
+            if not existed and self.eviction == "lfu" and key in self._cache:
+                self._lfu.touch(key)
 
     def clear(self) -> None:
         self._check_reload()
         with self._lock:
             self._cache.clear()
-            try:
-                self.file.unlink()
-            except FileNotFoundError:
-                pass
-            self._mtime = 0.0
+            self._sizes.clear()
+            self._lfu.clear()
+            self._backend.clear()
             self.hits = 0
             self.misses = 0
+            self.evictions = 0
+            self.bytes = 0
 
     def prune(self) -> None:
         self._check_reload()
         with self._lock:
             now = time.time()
-            to_delete = [
-                k
-                for k, c in self._cache.items()
-                if c.ttl > 0 and now - c.timestamp >= c.ttl
-            ]
+            to_delete = [k for k, c in self._cache.items() if _expired(c, now)]
             for k in to_delete:
-                self._cache.pop(k, None)
+                self._discard(k)
             if to_delete:
-                self._save()
+                self._backend.delete(to_delete, self._cache)
 
     def __len__(self) -> int:  # pragma: no cover - trivial
         self._check_reload()
@@ -145,18 +1029,30 @@ class CacheManager(Generic[T]):
             return len(self._cache)
 
     def stats(self) -> Dict[str, int]:  # pragma: no cover - simple
-        """Return cache hit/miss statistics."""
+        """Return cache hit/miss/eviction counters and size usage."""
         with self._lock:
-            return {"hits": self.hits, "misses": self.misses}
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._cache),
+                "bytes": self.bytes,
+            }
 
     def reset_stats(self) -> None:
-        """Reset hit/miss counters to zero."""
+        """Reset hit/miss/eviction counters to zero."""
         with self._lock:
             self.hits = 0
             self.misses = 0
+            self.evictions = 0
 
     def get_many(self, keys: Iterable[str], ttl: float | None = None) -> Dict[str, T]:
         """Return mapping of keys to cached values, dropping expired ones."""
+        return self._get_many(keys, ttl)
+
+    def _get_many(
+        self, keys: Iterable[str], ttl: float | None, touch: bool = True
+    ) -> Dict[str, T]:
         self._check_reload()
         now = time.time()
         results: Dict[str, T] = {}
@@ -171,13 +1067,15 @@ class CacheManager(Generic[T]):
                 if effective_ttl > 0 and now - item.timestamp < effective_ttl:
                     results[key] = item.value
                     self.hits += 1
+                    if touch:
+                        self._touch(key)
                 else:
                     expired.append(key)
                     self.misses += 1
             for key in expired:
-                self._cache.pop(key, None)
+                self._discard(key)
             if expired:
-                self._save()
+                self._backend.delete(expired, self._cache)
         return results
 
     def exists(self, key: str, ttl: float | None = None) -> bool:
@@ -201,32 +1099,31 @@ class CacheManager(Generic[T]):
         """Remove *key* from the cache if present."""
         self._check_reload()
         with self._lock:
-            if key in self._cache:
-                self._cache.pop(key, None)
-                self._save()
+            if self._discard(key):
+                self._backend.delete([key], self._cache)
 
     def pop(self, key: str, ttl: float | None = None) -> T | None:
         """Remove and return the cached value for *key* if present."""
         value = self.get(key, ttl)
         if value is not None:
             with self._lock:
-                self._cache.pop(key, None)
-                self._save()
+                if self._discard(key):
+                    self._backend.delete([key], self._cache)
         return value
 
     def keys(self, ttl: float | None = None) -> list[str]:
         """Return a list of valid keys, dropping expired ones."""
-        data = self.get_many(list(self._cache.keys()), ttl)
+        data = self._get_many(list(self._cache.keys()), ttl, touch=False)
         return list(data.keys())
 
     def values(self, ttl: float | None = None) -> list[T]:
         """Return a list of cached values, ignoring expired entries."""
-        data = self.get_many(list(self._cache.keys()), ttl)
+        data = self._get_many(list(self._cache.keys()), ttl, touch=False)
         return list(data.values())
 
     def items(self, ttl: float | None = None) -> list[tuple[str, T]]:
         """Return ``(key, value)`` pairs for valid entries."""
-        data = self.get_many(list(self._cache.keys()), ttl)
+        data = self._get_many(list(self._cache.keys()), ttl, touch=False)
         return list(data.items())
 
     def __iter__(self):  # pragma: no cover - simple
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import hashlib
 import math
 import os
+import random
 import socket
 import subprocess
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import shutil
 import ssl
 import re
@@ -19,6 +21,7 @@ from typing import (
     List,
     Dict,
     Iterable,
+    Mapping,
     Any,
     AsyncIterator,
     Awaitable,
@@ -39,6 +42,8 @@ except ImportError:  # pragma: no cover - runtime dependency check
 
     psutil = ensure_psutil()
 from coolbox.utils.files.cache import CacheManager
+from .discovery import ping_host as _socket_ping
+from .engine import ProbeScheduler, RttEstimator, connect_scan
 
 
 def _run(cmd, **kwargs):
@@ -57,7 +62,30 @@ _DEFAULT_META_CONCURRENCY = int(
 _DEFAULT_PING_CONCURRENCY = int(
     os.environ.get("PING_WORKERS", _DEFAULT_CONCURRENCY)
 )
+# ``raw`` drives bare non-blocking sockets from the event loop's selector (see
+# :mod:`coolbox.utils.network.engine`); ``stream`` uses ``open_connection``.
+_DEFAULT_SCAN_ENGINE = os.environ.get("NET_SCAN_ENGINE", "raw")
+# The raw engine is cheap per probe, so it keeps far more connects in flight.
+_DEFAULT_RAW_CONCURRENCY = int(os.environ.get("NET_SCAN_RAW_WORKERS", 1000))
+_DEFAULT_MIN_TIMEOUT = float(os.environ.get("NET_SCAN_MIN_TIMEOUT", 0.05))
+# Timeout bursts back a host's connect timeout off up to this ceiling so slow
+# links still answer, and shrink its probe window no lower than the floor.
+_DEFAULT_MAX_TIMEOUT = float(os.environ.get("NET_SCAN_MAX_TIMEOUT", 2.0))
+_DEFAULT_MIN_WINDOW = int(os.environ.get("NET_SCAN_MIN_WINDOW", 4))
+# Multi-host raw scans share one scheduler: a global socket budget, a per-host
+# cap and the number of consecutive silent probes after which a host is dead.
+_DEFAULT_MAX_INFLIGHT = int(os.environ.get("NET_SCAN_MAX_INFLIGHT", 2000))
+_DEFAULT_HOST_INFLIGHT = int(os.environ.get("NET_SCAN_HOST_INFLIGHT", 256))
+_DEFAULT_DEAD_AFTER = int(os.environ.get("NET_SCAN_DEAD_AFTER", 128))
 _PING_CACHE_TTL = float(os.environ.get("PING_CACHE_TTL", 30.0))
+# ``auto`` sends ICMP echo over a shared socket (see
+# :mod:`coolbox.utils.network.discovery`) and falls back to TCP connect probes
+# when ICMP sockets are not permitted; ``icmp`` and ``tcp`` force one of them
+# and ``subprocess`` runs the system ``ping`` per host.
+_PING_ENGINE = os.environ.get("NET_PING_ENGINE", "auto")
+# One socket serves every in-flight echo, so far more hosts can be pinged at
+# once than with a process per host.
+_DEFAULT_SOCKET_PING_CONCURRENCY = int(os.environ.get("NET_PING_WORKERS", 2048))
 _PING_PROCESS_GRACE = float(os.environ.get("PING_PROCESS_GRACE", 1.5))
 _PING_KILL_GRACE = float(os.environ.get("PING_KILL_GRACE", 0.5))
 
@@ -77,8 +105,26 @@ _CACHE_FILE = Path(
     )
 )
 
+# Storage engine for the scan caches below. ``log`` appends one record per
+# update instead of rewriting the whole file, which keeps large auto scans from
+# spending their time serializing JSON. ``sqlite`` shares one WAL database
+# between the CLI, GUI and plugin workers and syncs changes per key. Set
+# ``NETWORK_CACHE_BACKEND=json`` to keep the single-document format.
+_CACHE_BACKEND = os.environ.get("NETWORK_CACHE_BACKEND", "log")
+
+# Size limits applied to each scan cache so long-running scan boxes don't grow
+# without bound. ``0`` disables a limit; ``NETWORK_CACHE_EVICTION`` selects
+# ``lru`` or ``lfu`` eviction once a limit is hit.
+_CACHE_LIMITS: dict[str, Any] = {
+    "max_entries": int(os.environ.get("NETWORK_CACHE_MAX_ENTRIES", 0)),
+    "max_bytes": int(os.environ.get("NETWORK_CACHE_MAX_BYTES", 32 * 1024 * 1024)),
+    "eviction": os.environ.get("NETWORK_CACHE_EVICTION", "lru"),
+}
+
 # Cache manager instance used by both sync and async scanners
-PORT_CACHE: CacheManager[List[int]] = CacheManager[List[int]](_CACHE_FILE)
+PORT_CACHE: CacheManager[List[int]] = CacheManager[List[int]](
+    _CACHE_FILE, backend=_CACHE_BACKEND, **_CACHE_LIMITS
+)
 
 # Cache of discovered local hosts to avoid recomputing interface networks on
 # every auto scan. The TTL can be configured via the ``LOCAL_HOST_CACHE_TTL``
@@ -92,7 +138,9 @@ _LOCAL_HOST_CACHE_FILE = Path(
 )
 _LOCAL_HOST_CACHE: list[str] | None = None
 _LOCAL_HOST_CACHE_TS: float = 0.0
-LOCAL_HOST_CACHE: CacheManager[list[str]] = CacheManager(_LOCAL_HOST_CACHE_FILE)
+LOCAL_HOST_CACHE: CacheManager[list[str]] = CacheManager(
+    _LOCAL_HOST_CACHE_FILE, backend=_CACHE_BACKEND, **_CACHE_LIMITS
+)
 
 # Disk-backed cache for reverse DNS lookups so hostname resolution doesn't
 # block repeated scans. TTL is configurable via ``DNS_CACHE_TTL``.
@@ -103,7 +151,9 @@ _DNS_CACHE_FILE = Path(
     )
 )
 _DNS_CACHE_TTL = float(os.environ.get("DNS_CACHE_TTL", 3600.0))
-DNS_CACHE: CacheManager[str] = CacheManager[str](_DNS_CACHE_FILE)
+DNS_CACHE: CacheManager[str] = CacheManager[str](
+    _DNS_CACHE_FILE, backend=_CACHE_BACKEND, **_CACHE_LIMITS
+)
 
 # Disk-backed cache for HTTP metadata lookups. TTL is configurable via
 # ``HTTP_CACHE_TTL`` and the location via ``HTTP_CACHE_FILE``.
@@ -114,7 +164,40 @@ _HTTP_CACHE_FILE = Path(
     )
 )
 _HTTP_CACHE_TTL = float(os.environ.get("HTTP_CACHE_TTL", 3600.0))
-HTTP_CACHE: CacheManager[dict] = CacheManager(_HTTP_CACHE_FILE)
+HTTP_CACHE: CacheManager[dict] = CacheManager(
+    _HTTP_CACHE_FILE, backend=_CACHE_BACKEND, **_CACHE_LIMITS
+)
+
+# Per-host round-trip estimates (``[srtt, rttvar]``) kept between scans so a
+# rescan starts from the last known timeout instead of ``NET_SCAN_TIMEOUT``.
+_RTT_CACHE_FILE = Path(
+    os.environ.get(
+        "RTT_CACHE_FILE",
+        str(Path.home() / ".coolbox" / "cache" / "rtt_cache.json"),
+    )
+)
+_RTT_CACHE_TTL = float(os.environ.get("RTT_CACHE_TTL", 3600.0))
+RTT_CACHE: CacheManager[list[float]] = CacheManager[list[float]](
+    _RTT_CACHE_FILE, backend=_CACHE_BACKEND, **_CACHE_LIMITS
+)
+
+# Last result per host of differential auto scans (see
+# :func:`async_auto_scan_diff_iter`), keyed by port set and option flags.
+_AUTO_SCAN_STATE_FILE = Path(
+    os.environ.get(
+        "AUTO_SCAN_STATE_FILE",
+        str(Path.home() / ".coolbox" / "cache" / "auto_scan_state.json"),
+    )
+)
+_AUTO_SCAN_STATE_TTL = float(os.environ.get("AUTO_SCAN_STATE_TTL", 7 * 86400.0))
+# Differential sweeps fully rescan a known host once its last full scan is
+# older than this, and otherwise cover the port range over this many sweeps.
+_AUTO_SCAN_REFRESH = float(os.environ.get("AUTO_SCAN_REFRESH", 3600.0))
+_AUTO_SCAN_ROTATE = int(os.environ.get("AUTO_SCAN_ROTATE", 8))
+_AUTO_SCAN_SAMPLE = float(os.environ.get("AUTO_SCAN_SAMPLE", 0.05))
+AUTO_SCAN_STATE: CacheManager[dict] = CacheManager(
+    _AUTO_SCAN_STATE_FILE, backend=_CACHE_BACKEND, **_CACHE_LIMITS
+)
 
 # Precompiled regex to parse TTL or hop limit from ping output. This captures
 # values in forms like ``ttl=64`` or ``hlim:64`` and is case-insensitive.
@@ -277,7 +360,8 @@ class AutoScanInfo:
 
     ``ports`` holds the open port results while optional metadata like
     ``hostname`` or ``mac`` may be included when requested. ``vendor`` is a
-    best-effort lookup based on the MAC address prefix.
+    best-effort lookup based on the MAC address prefix. ``rtt`` and
+    ``rtt_var`` hold the smoothed connect round-trip estimate for the host.
     """
 
     ports: PortResult
@@ -290,6 +374,8 @@ class AutoScanInfo:
     vendor: str | None = None
     http_info: Dict[int, HTTPInfo] | None = None
     device_type: str | None = None
+    rtt: float | None = None
+    rtt_var: float | None = None
     _risk_score: int | None = field(default=None, init=False, repr=False)
 
     @property
@@ -315,6 +401,26 @@ PortResult = List[int] | Dict[int, str] | Dict[int, PortInfo]
 AutoScanResult = PortResult | AutoScanInfo
 
 
+@dataclass
+class ScanDelta:
+    """Change for one host reported by :func:`async_auto_scan_diff_iter`.
+
+    ``kind`` is ``"added"``, ``"removed"`` or ``"changed"``. ``opened`` and
+    ``closed`` list port changes since the previous sweep and ``fields`` names
+    the :class:`AutoScanInfo` attributes whose values differ. ``result`` is
+    the host's current result (``None`` once removed) and ``previous`` the
+    stored one (``None`` for new hosts).
+    """
+
+    host: str
+    kind: str
+    opened: List[int] = field(default_factory=list)
+    closed: List[int] = field(default_factory=list)
+    fields: List[str] = field(default_factory=list)
+    result: AutoScanResult | None = None
+    previous: AutoScanResult | None = None
+
+
 def _get_service_name(port: int) -> str:
     """Return the service name for ``port`` if known."""
     name = _SERVICE_CACHE.get(port)
@@ -496,6 +602,18 @@ def clear_ping_cache() -> None:
     _PING_CACHE.clear()
 
 
+def clear_auto_scan_state() -> None:
+    """Forget the stored sweeps used by differential auto scans."""
+
+    AUTO_SCAN_STATE.clear()
+
+
+def clear_rtt_cache() -> None:
+    """Forget the per-host round-trip estimates used to warm scans."""
+
+    RTT_CACHE.clear()
+
+
 def clear_local_host_cache() -> None:
     """Clear cached local host discovery results."""
 
@@ -1304,7 +1422,10 @@ async def _async_ping_host(
     return_ttl: bool = False,
     return_latency: bool = False,
 ) -> PingResult:
-    """Asynchronously ping ``host`` and optionally return the TTL and latency."""
+    """Asynchronously ping ``host`` and optionally return the TTL and latency.
+
+    The probe method follows ``NET_PING_ENGINE``; only ICMP replies carry a TTL.
+    """
 
     cached = _PING_CACHE.get(host)
     if cached and time.time() - cached[3] < _PING_CACHE_TTL:
@@ -1317,16 +1438,22 @@ async def _async_ping_host(
             return ok, lat_val
         return ok
 
-    cmd, proc_timeout = _build_ping_command(host, timeout)
-    start_ts = time.perf_counter() if return_latency else 0.0
-    out, code = await _run_async_ex(cmd, timeout=proc_timeout, capture=return_ttl)
-    ok = isinstance(code, int) and code == 0
-    latency_val = None
-    if return_latency and ok:
-        latency_val = time.perf_counter() - start_ts
-    ttl_val = None
-    if return_ttl and ok and out:
-        ttl_val = _extract_ttl_from_ping(out)
+    if _PING_ENGINE == "subprocess":
+        cmd, proc_timeout = _build_ping_command(host, timeout)
+        start_ts = time.perf_counter() if return_latency else 0.0
+        out, code = await _run_async_ex(cmd, timeout=proc_timeout, capture=return_ttl)
+        ok = isinstance(code, int) and code == 0
+        latency_val = None
+        if return_latency and ok:
+            latency_val = time.perf_counter() - start_ts
+        ttl_val = None
+        if return_ttl and ok and out:
+            ttl_val = _extract_ttl_from_ping(out)
+    else:
+        addr, family = await _async_resolve_host(host)
+        ok, ttl_val, latency_val = await _socket_ping(
+            addr, family, timeout=timeout, engine=_PING_ENGINE
+        )
     _PING_CACHE[host] = (ok, ttl_val, latency_val, time.time())
     if return_ttl and return_latency:
         return ok, ttl_val, latency_val
@@ -1350,6 +1477,8 @@ async def async_filter_active_hosts(
     """Return active hosts with optional TTL/latency details."""
 
     host_list = list(hosts)
+    if concurrency == _DEFAULT_PING_CONCURRENCY and _PING_ENGINE != "subprocess":
+        concurrency = _DEFAULT_SOCKET_PING_CONCURRENCY
     active_list: list[str] = []
     active_map: Dict[str, object] = {}
     total = len(host_list)
@@ -1578,6 +1707,7 @@ async def async_auto_scan_iter(
             return host, result_ports
 
         info = AutoScanInfo(result_ports)
+        _apply_rtt(info, host)
         tasks: dict[str, asyncio.Task] = {}
         if with_hostname:
             tasks["hostname"] = asyncio.create_task(async_get_hostname(host))
@@ -1755,6 +1885,399 @@ async def async_auto_scan(
     return results
 
 
+# Metadata compared between sweeps, keyed by ``auto_scan_info_to_dict`` name.
+# Volatile measurements (latencies, RTT, connection counts) are not deltas.
+_DIFF_FIELDS = {
+    "hostname": "hostname",
+    "mac": "mac",
+    "vendor": "vendor",
+    "os": "os_guess",
+    "ttl": "ttl",
+    "http": "http_info",
+    "device": "device_type",
+    "risk": "risk_score",
+}
+
+
+def _result_ports(result: AutoScanResult | None) -> set[int]:
+    if result is None:
+        return set()
+    ports = result.ports if isinstance(result, AutoScanInfo) else result
+    return {int(p) for p in ports}
+
+
+def _auto_scan_profile(port_list: list[int], *flags: bool) -> str:
+    """Return the state key prefix for a port set and result flags."""
+
+    digest = hashlib.sha1(",".join(map(str, port_list)).encode())
+    digest.update("".join(str(int(f)) for f in flags).encode())
+    return digest.hexdigest()[:16]
+
+
+def _scan_delta(
+    host: str, previous: AutoScanInfo | None, current: AutoScanInfo | None
+) -> ScanDelta | None:
+    """Return the :class:`ScanDelta` between two sweeps or ``None``."""
+
+    before = _result_ports(previous)
+    after = _result_ports(current)
+    if previous is None:
+        return ScanDelta(host, "added", sorted(after), result=current)
+    if current is None:
+        return ScanDelta(host, "removed", closed=sorted(before), previous=previous)
+    old = auto_scan_info_to_dict(previous)
+    new = auto_scan_info_to_dict(current)
+    changed = [attr for key, attr in _DIFF_FIELDS.items() if old.get(key) != new.get(key)]
+    if before == after and old["ports"] != new["ports"]:
+        changed.insert(0, "ports")
+    opened = sorted(after - before)
+    closed = sorted(before - after)
+    if not (opened or closed or changed):
+        return None
+    return ScanDelta(host, "changed", opened, closed, changed, current, previous)
+
+
+def _merge_ports(
+    previous: PortResult, probed: Iterable[int], found: PortResult
+) -> PortResult:
+    """Return ``previous`` updated with a rescan of only the ``probed`` ports."""
+
+    probed_set = set(probed)
+    if isinstance(previous, dict) or isinstance(found, dict):
+        prev_map = previous if isinstance(previous, dict) else {}
+        found_map = found if isinstance(found, dict) else {}
+        merged: Dict[int, Any] = {
+            p: v for p, v in prev_map.items() if p not in probed_set
+        }
+        merged.update(found_map)
+        return dict(sorted(merged.items()))
+    kept = {p for p in previous if p not in probed_set}
+    return sorted(kept | set(found))
+
+
+async def async_auto_scan_diff_iter(
+    start: int,
+    end: int,
+    progress: Callable[[float | None], None] | None = None,
+    concurrency: int = _DEFAULT_CONCURRENCY,
+    host_concurrency: int = _DEFAULT_HOST_CONCURRENCY,
+    *,
+    ports: Iterable[int] | None = None,
+    family: int | None = None,
+    timeout: float = _DEFAULT_TIMEOUT,
+    ping_concurrency: int | None = None,
+    ping_timeout: float | None = None,
+    with_services: bool = False,
+    with_banner: bool = False,
+    with_latency: bool = False,
+    with_mac: bool = False,
+    with_hostname: bool = False,
+    with_connections: bool = False,
+    with_os: bool = False,
+    with_ttl: bool = False,
+    with_ping_latency: bool = False,
+    with_vendor: bool = False,
+    with_http_info: bool = False,
+    with_device_type: bool = False,
+    with_risk_score: bool = False,
+    http_concurrency: int = _DEFAULT_HTTP_CONCURRENCY,
+    include_arp: bool = True,
+    cancel_event: Any | None = None,
+    refresh_after: float = _AUTO_SCAN_REFRESH,
+    rotate: int = _AUTO_SCAN_ROTATE,
+    sample: float = _AUTO_SCAN_SAMPLE,
+    churn_sweeps: int = 3,
+    engine: str | None = None,
+) -> AsyncIterator[ScanDelta]:
+    """Run a differential auto scan and yield what changed since the last one.
+
+    Options match :func:`async_auto_scan`. The previous sweep is kept in
+    ``AUTO_SCAN_STATE`` per port set and result flags. New hosts, hosts that
+    changed within the last ``churn_sweeps`` sweeps, hosts whose last full
+    scan is older than ``refresh_after`` seconds and a random ``sample``
+    fraction of the rest are scanned in full. Every other host re-probes only
+    its known open ports plus a rotating ``1/rotate`` slice of the remaining
+    ports and keeps its stored metadata, so a stable network is re-covered
+    every ``rotate`` sweeps. Hosts that are no longer discovered are reported
+    as removed; unchanged hosts produce no delta.
+    """
+
+    port_list = (
+        sorted(set(int(p) for p in ports))
+        if ports is not None
+        else list(range(start, end + 1))
+    )
+    detailed = (
+        with_mac
+        or with_hostname
+        or with_connections
+        or with_os
+        or with_ttl
+        or with_ping_latency
+        or with_vendor
+        or with_http_info
+        or with_device_type
+        or with_risk_score
+    )
+    prefix = (
+        _auto_scan_profile(
+            port_list,
+            with_services,
+            with_banner,
+            with_latency,
+            with_mac,
+            with_hostname,
+            with_os,
+            with_ttl,
+            with_vendor,
+            with_http_info,
+            with_device_type,
+            with_risk_score,
+        )
+        + "|"
+    )
+    previous: Dict[str, dict] = {
+        key[len(prefix) :]: entry
+        for key, entry in AUTO_SCAN_STATE.items(_AUTO_SCAN_STATE_TTL)
+        if key.startswith(prefix)
+    }
+    sweep = int(previous.pop("", {}).get("sweep", 0)) + 1
+    rotate = max(1, rotate)
+    detect_weight = 0.5
+
+    det_prog: Callable[[float | None], None] | None = None
+    if progress is not None:
+
+        def _det_prog(val: float | None) -> None:
+            progress(detect_weight if val is None else val * detect_weight)
+
+        det_prog = _det_prog
+
+    filter_result = await async_detect_local_hosts(
+        progress=det_prog,
+        concurrency=ping_concurrency or concurrency,
+        timeout=ping_timeout or timeout,
+        include_arp=include_arp,
+        return_ttl=with_os or with_ttl,
+        return_latency=with_ping_latency,
+        cancel_event=cancel_event,
+    )
+    if _cancelled(cancel_event):
+        if progress is not None:
+            progress(1.0)
+        return
+
+    host_ttls: Dict[str, int | None] = {}
+    host_lat: Dict[str, float | None] = {}
+    if with_os or with_ping_latency or with_ttl:
+        if with_ping_latency and (with_os or with_ttl):
+            host_ttls = {h: t for h, (t, _) in filter_result.items()}  # type: ignore[union-attr]
+            host_lat = {h: l for h, (_, l) in filter_result.items()}  # type: ignore[union-attr]
+        elif with_os or with_ttl:
+            host_ttls = dict(filter_result)  # type: ignore[arg-type]
+        else:
+            host_lat = dict(filter_result)  # type: ignore[arg-type]
+    hosts = list(dict.fromkeys(filter_result))
+
+    now = time.time()
+    full_hosts: list[str] = []
+    partial: Dict[str, list[int]] = {}
+    for host in hosts:
+        entry = previous.get(host)
+        if (
+            entry is None
+            or entry.get("churn", 0) > 0
+            or now - entry.get("full", 0.0) >= refresh_after
+            or random.random() < sample
+        ):
+            full_hosts.append(host)
+            continue
+        known = _result_ports(auto_scan_info_from_dict(entry["info"]))
+        partial[host] = sorted(
+            known.union(
+                p for i, p in enumerate(port_list) if i % rotate == sweep % rotate
+            )
+        )
+
+    progress_map: Dict[str, float] = {h: 0.0 for h in hosts}
+
+    def update_scan() -> None:
+        if progress is not None and progress_map:
+            progress(
+                detect_weight
+                + sum(progress_map.values()) / len(progress_map) * (1 - detect_weight)
+            )
+
+    def full_prog(val: float | None) -> None:
+        for h in full_hosts:
+            progress_map[h] = 1.0 if val is None else val
+        update_scan()
+
+    out_q: asyncio.Queue[tuple[str, AutoScanResult | None, bool] | None] = (
+        asyncio.Queue()
+    )
+    scheduler = _shared_scheduler(engine, concurrency)
+    host_q: asyncio.Queue[str] = asyncio.Queue()
+    for h in partial:
+        host_q.put_nowait(h)
+
+    async def scan_full() -> None:
+        if not full_hosts:
+            return
+        # OS, TTL and latency come from discovery; device type and risk are
+        # derived afterwards so they see them.
+        async for host, res in async_scan_hosts_iter(
+            full_hosts,
+            start,
+            end,
+            full_prog,
+            concurrency,
+            host_concurrency,
+            ports=port_list,
+            cache_ttl=0,
+            family=family,
+            timeout=timeout,
+            with_services=with_services,
+            with_banner=with_banner,
+            with_latency=with_latency,
+            with_mac=with_mac,
+            with_hostname=with_hostname,
+            with_connections=with_connections,
+            with_vendor=with_vendor,
+            with_http_info=with_http_info,
+            http_concurrency=http_concurrency,
+            cancel_event=cancel_event,
+            engine=engine,
+        ):
+            await out_q.put((host, res, True))
+
+    async def scan_partial() -> None:
+        while not host_q.empty() and not _cancelled(cancel_event):
+            host = host_q.get_nowait()
+
+            def sub_prog(val: float | None, host: str = host) -> None:
+                progress_map[host] = 1.0 if val is None else val
+                update_scan()
+
+            try:
+                res = await async_scan_port_list(
+                    host,
+                    partial[host],
+                    sub_prog,
+                    concurrency=concurrency,
+                    cache_ttl=0,
+                    family=family,
+                    timeout=timeout,
+                    with_services=with_services,
+                    with_banner=with_banner,
+                    with_latency=with_latency,
+                    engine=engine,
+                    scheduler=scheduler,
+                )
+            except Exception:
+                res = None
+            await out_q.put((host, res, False))
+
+    async def produce() -> None:
+        try:
+            await asyncio.gather(
+                scan_full(),
+                *(
+                    scan_partial()
+                    for _ in range(max(1, min(host_concurrency, len(partial))))
+                ),
+            )
+        finally:
+            out_q.put_nowait(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (item := await out_q.get()) is not None:
+            host, res, full = item
+            entry = previous.pop(host, None)
+            prev_info = auto_scan_info_from_dict(entry["info"]) if entry else None
+            if res is None:
+                continue
+            if full:
+                info = res if isinstance(res, AutoScanInfo) else AutoScanInfo(res)
+            else:
+                assert prev_info is not None
+                info = replace(
+                    prev_info,
+                    ports=_merge_ports(prev_info.ports, partial[host], cast(PortResult, res)),
+                )
+            _apply_rtt(info, host)
+            if with_os:
+                info.os_guess = _guess_os_from_ttl(host_ttls.get(host))
+            if with_ttl:
+                info.ttl = host_ttls.get(host)
+            if with_ping_latency:
+                info.ping_latency = host_lat.get(host)
+            if with_device_type:
+                info.device_type = _guess_device_type(info)
+            if with_risk_score:
+                info.compute_risk_score()
+            delta = _scan_delta(host, prev_info, info)
+            if delta is not None and not detailed:
+                delta.result = info.ports
+                delta.previous = prev_info.ports if prev_info is not None else None
+            churn = int(entry.get("churn", 0)) if entry else 0
+            AUTO_SCAN_STATE.set(
+                prefix + host,
+                {
+                    "info": auto_scan_info_to_dict(info),
+                    "full": now if full else entry["full"],  # type: ignore[index]
+                    "churn": (
+                        churn_sweeps
+                        if delta is not None and delta.kind == "changed"
+                        else max(0, churn - 1)
+                    ),
+                },
+                _AUTO_SCAN_STATE_TTL,
+            )
+            if delta is not None:
+                yield delta
+        await producer
+    finally:
+        if not producer.done():
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    if _cancelled(cancel_event):
+        return
+    for host, entry in previous.items():
+        if host in progress_map:
+            continue
+        AUTO_SCAN_STATE.delete(prefix + host)
+        delta = _scan_delta(host, auto_scan_info_from_dict(entry["info"]), None)
+        if delta is not None:
+            if not detailed and delta.previous is not None:
+                delta.previous = cast(AutoScanInfo, delta.previous).ports
+            yield delta
+    AUTO_SCAN_STATE.set(prefix, {"sweep": sweep}, _AUTO_SCAN_STATE_TTL)
+    if progress is not None:
+        progress(1.0)
+        progress(None)
+
+
+async def async_auto_scan_diff(
+    start: int,
+    end: int,
+    progress: Callable[[float | None], None] | None = None,
+    concurrency: int = _DEFAULT_CONCURRENCY,
+    host_concurrency: int = _DEFAULT_HOST_CONCURRENCY,
+    **kwargs: Any,
+) -> list[ScanDelta]:
+    """Return the deltas of :func:`async_auto_scan_diff_iter` as a list."""
+
+    return [
+        delta
+        async for delta in async_auto_scan_diff_iter(
+            start, end, progress, concurrency, host_concurrency, **kwargs
+        )
+    ]
+
+
 async def async_scan_hosts_iter(
     hosts: Iterable[str],
     start: int,
@@ -1785,10 +2308,16 @@ async def async_scan_hosts_iter(
     with_risk_score: bool = False,
     http_concurrency: int = _DEFAULT_HTTP_CONCURRENCY,
     cancel_event: Any | None = None,
+    engine: str | None = None,
 ) -> AsyncIterator[tuple[str, AutoScanResult]]:
-    """Yield scan results for ``hosts`` one at a time."""
+    """Yield scan results for ``hosts`` one at a time.
+
+    Port probes for all hosts share one scheduler as in
+    :func:`async_scan_targets`.
+    """
 
     host_list = list(dict.fromkeys(hosts))
+    scheduler = _shared_scheduler(engine, concurrency)
 
     port_count = (
         len(set(int(p) for p in ports)) if ports is not None else end - start + 1
@@ -1872,6 +2401,8 @@ async def async_scan_hosts_iter(
                 with_services=with_services,
                 with_banner=with_banner,
                 with_latency=with_latency,
+                engine=engine,
+                scheduler=scheduler,
             )
         else:
             result_ports = await async_scan_ports(
@@ -1886,6 +2417,8 @@ async def async_scan_hosts_iter(
                 with_services=with_services,
                 with_banner=with_banner,
                 with_latency=with_latency,
+                engine=engine,
+                scheduler=scheduler,
             )
 
         if not (
@@ -1903,6 +2436,7 @@ async def async_scan_hosts_iter(
             return host, result_ports
 
         info = AutoScanInfo(result_ports)
+        _apply_rtt(info, host)
         tasks: dict[str, asyncio.Task] = {}
         if with_hostname:
             tasks["hostname"] = asyncio.create_task(async_get_hostname(host))
@@ -2159,6 +2693,7 @@ async def async_scan_hosts_detailed(
         if _cancelled(cancel_event):
             break
         info = AutoScanInfo(ports_open)
+        _apply_rtt(info, host)
         if with_hostname and hostname_map is not None:
             info.hostname = hostname_map.get(host)
         if with_mac or with_vendor:
@@ -2215,6 +2750,176 @@ async def async_scan_hosts_detailed(
     return detailed
 
 
+def host_rtt_estimate(host: str) -> tuple[float, float] | None:
+    """Return the cached ``(srtt, rttvar)`` connect estimate for ``host``."""
+
+    state = RTT_CACHE.get(host, _RTT_CACHE_TTL)
+    if not state:
+        return None
+    return float(state[0]), float(state[1])
+
+
+def warm_rtt_estimates(results: Mapping[str, AutoScanResult]) -> None:
+    """Seed the RTT cache from earlier :class:`AutoScanInfo` results."""
+
+    for host, info in results.items():
+        if isinstance(info, AutoScanInfo) and info.rtt is not None:
+            rtt_var = info.rtt_var if info.rtt_var is not None else info.rtt / 2
+            RTT_CACHE.set(host, [info.rtt, rtt_var], _RTT_CACHE_TTL)
+
+
+def _host_estimator(host: str) -> RttEstimator:
+    """Return an :class:`RttEstimator` warmed from the RTT cache."""
+
+    state = host_rtt_estimate(host)
+    if state is None:
+        return RttEstimator()
+    return RttEstimator(srtt=state[0], rttvar=state[1])
+
+
+def _store_estimator(host: str, estimator: RttEstimator) -> None:
+    if estimator.srtt is not None:
+        RTT_CACHE.set(host, [estimator.srtt, estimator.rttvar], _RTT_CACHE_TTL)
+
+
+def _apply_rtt(info: AutoScanInfo, host: str) -> None:
+    state = host_rtt_estimate(host)
+    if state is not None:
+        info.rtt, info.rtt_var = state
+
+
+def _shared_scheduler(
+    engine: str | None, concurrency: int
+) -> ProbeScheduler | None:
+    """Return a scheduler shared by every host of a raw multi-host scan.
+
+    ``concurrency`` becomes the per-host cap unless left at the default, in
+    which case ``NET_SCAN_HOST_INFLIGHT`` applies. Stream scans return ``None``.
+    """
+
+    if (engine or _DEFAULT_SCAN_ENGINE).lower() != "raw":
+        return None
+    per_host = (
+        _DEFAULT_HOST_INFLIGHT if concurrency == _DEFAULT_CONCURRENCY else concurrency
+    )
+    return ProbeScheduler(
+        _DEFAULT_MAX_INFLIGHT,
+        per_host,
+        min_timeout=_DEFAULT_MIN_TIMEOUT,
+        min_window=_DEFAULT_MIN_WINDOW,
+        dead_after=_DEFAULT_DEAD_AFTER,
+    )
+
+
+async def _async_probe_ports(
+    addr: str,
+    family: socket.AddressFamily,
+    ports: Iterable[int],
+    progress: Callable[[float | None], None] | None,
+    concurrency: int,
+    *,
+    timeout: float,
+    with_banner: bool,
+    with_latency: bool,
+    engine: str | None = None,
+    scheduler: ProbeScheduler | None = None,
+    estimator: RttEstimator | None = None,
+) -> list[tuple[int, str | None, float | None]]:
+    """Connect to each of ``ports`` on the resolved ``addr``.
+
+    Returns ``(port, banner, latency)`` for open ports in completion order.
+    ``progress`` receives the completed fraction after every probe. A shared
+    ``scheduler`` takes over the raw engine's concurrency limits and
+    ``estimator`` carries the host's RTT state into and out of the scan.
+    """
+
+    port_list = list(ports)
+    if not port_list:
+        return []
+    engine = (engine or _DEFAULT_SCAN_ENGINE).lower()
+    if engine == "raw":
+        if scheduler is not None:
+            found = await scheduler.scan(
+                addr,
+                port_list,
+                family=family,
+                timeout=timeout,
+                max_timeout=max(timeout, _DEFAULT_MAX_TIMEOUT),
+                with_banner=with_banner,
+                progress=progress,
+                estimator=estimator,
+            )
+        else:
+            if concurrency == _DEFAULT_CONCURRENCY:
+                concurrency = _DEFAULT_RAW_CONCURRENCY
+            found = await connect_scan(
+                addr,
+                port_list,
+                family=family,
+                timeout=timeout,
+                max_timeout=max(timeout, _DEFAULT_MAX_TIMEOUT),
+                concurrency=concurrency,
+                min_timeout=min(_DEFAULT_MIN_TIMEOUT, timeout),
+                min_window=_DEFAULT_MIN_WINDOW,
+                with_banner=with_banner,
+                progress=progress,
+                estimator=estimator,
+            )
+        return [
+            (port, banner, rtt if with_latency else None)
+            for port, banner, rtt in found
+        ]
+    if engine != "stream":
+        raise ValueError(f"Unknown scan engine: {engine}")
+
+    open_ports: list[tuple[int, str | None, float | None]] = []
+    total = len(port_list)
+    completed = 0
+
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for p in port_list:
+        queue.put_nowait(p)
+
+    async def worker() -> None:
+        nonlocal completed
+        while not queue.empty():
+            try:
+                port = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            try:
+                start_ts = time.perf_counter()
+                conn = asyncio.open_connection(addr, port, family=family)
+                reader, writer = await asyncio.wait_for(conn, timeout=timeout)
+                latency = time.perf_counter() - start_ts if with_latency else None
+                banner = None
+                if with_banner:
+                    try:
+                        data = await asyncio.wait_for(reader.read(100), 0.1)
+                        banner = data.decode(errors="ignore").strip() or None
+                    except Exception:
+                        banner = None
+                writer.close()
+                await writer.wait_closed()
+                open_ports.append((port, banner, latency))
+            except Exception:
+                pass
+            finally:
+                completed += 1
+                if progress is not None:
+                    progress(completed / total)
+                queue.task_done()
+
+    workers = [
+        asyncio.create_task(worker()) for _ in range(max(1, min(concurrency, total)))
+    ]
+    await queue.join()
+    for w in workers:
+        w.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    return open_ports
+
+
 def scan_ports(
     host: str,
     start: int,
@@ -2303,6 +3008,8 @@ async def async_scan_ports(
     with_services: bool = False,
     with_banner: bool = False,
     with_latency: bool = False,
+    engine: str | None = None,
+    scheduler: ProbeScheduler | None = None,
 ) -> PortResult:
     """Asynchronously scan *host* and return a list of open ports.
 
@@ -2311,6 +3018,9 @@ async def async_scan_ports(
 
     ``family`` forces IPv4 or IPv6 scanning when set to ``socket.AF_INET`` or
     ``socket.AF_INET6``. ``timeout`` sets the connection timeout in seconds.
+    ``engine`` selects ``"raw"`` non-blocking sockets or ``"stream"``
+    connections and defaults to ``NET_SCAN_ENGINE``. Raw probes are issued
+    through ``scheduler`` when given so several scans share its limits.
     """
 
     cache_key = f"{host}|{start}|{end}|{_flags_key(with_services=with_services, with_banner=with_banner, with_latency=with_latency)}"
@@ -2323,52 +3033,22 @@ async def async_scan_ports(
             return cached
 
     addr, resolved_family = _resolve_host(host, family)
+    estimator = _host_estimator(host)
 
-    open_ports: list[tuple[int, str | None, float | None]] = []
-    total = end - start + 1
-    completed = 0
-
-    queue: asyncio.Queue[int] = asyncio.Queue()
-    for p in range(start, end + 1):
-        queue.put_nowait(p)
-
-    async def worker() -> None:
-        nonlocal completed
-        while not queue.empty():
-            try:
-                port = queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-            try:
-                start_ts = time.perf_counter()
-                conn = asyncio.open_connection(addr, port, family=resolved_family)
-                reader, writer = await asyncio.wait_for(conn, timeout=timeout)
-                latency = time.perf_counter() - start_ts if with_latency else None
-                banner = None
-                if with_banner:
-                    try:
-                        banner_bytes = await asyncio.wait_for(reader.read(100), 0.1)
-                        banner = banner_bytes.decode(errors="ignore").strip() or None
-                    except Exception:
-                        banner = None
-                writer.close()
-                await writer.wait_closed()
-                open_ports.append((port, banner, latency))
-            except Exception:
-                pass
-            finally:
-                completed += 1
-                if progress is not None:
-                    progress(completed / total)
-                queue.task_done()
-
-    workers = [
-        asyncio.create_task(worker()) for _ in range(max(1, min(concurrency, total)))
-    ]
-    await queue.join()
-    for w in workers:
-        w.cancel()
-    await asyncio.gather(*workers, return_exceptions=True)
+    open_ports = await _async_probe_ports(
+        addr,
+        resolved_family,
+        range(start, end + 1),
+        progress,
+        concurrency,
+        timeout=timeout,
+        with_banner=with_banner,
+        with_latency=with_latency,
+        engine=engine,
+        scheduler=scheduler,
+        estimator=estimator,
+    )
+    _store_estimator(host, estimator)
 
     if progress is not None:
         progress(None)
@@ -2448,6 +3128,7 @@ async def async_scan_targets(
     with_services: bool = False,
     with_banner: bool = False,
     with_latency: bool = False,
+    engine: str | None = None,
 ) -> Dict[str, PortResult]:
     """Asynchronously scan multiple hosts.
 
@@ -2455,9 +3136,14 @@ async def async_scan_targets(
     passed to :func:`async_scan_ports`. When ``progress`` is provided it receives
     updates aggregated across all hosts so the reported value steadily climbs
     from 0 to 1 as individual host scans complete.
+
+    With the raw ``engine`` every host's probes go through one shared
+    :class:`ProbeScheduler`, which bounds the sockets in flight across all
+    hosts, serves hosts round-robin and stops probing hosts that never answer.
     """
 
     host_list = list(hosts)
+    scheduler = _shared_scheduler(engine, concurrency)
     results: Dict[str, PortResult] = {}
     total = len(host_list)
 
@@ -2495,6 +3181,8 @@ async def async_scan_targets(
                     with_services=with_services,
                     with_banner=with_banner,
                     with_latency=with_latency,
+                    engine=engine,
+                    scheduler=scheduler,
                 )
             finally:
                 queue.task_done()
@@ -2552,6 +3240,9 @@ def auto_scan_info_to_dict(info: AutoScanInfo) -> Dict[str, Any]:
         result["ping_latency"] = info.ping_latency
     if info.ttl is not None:
         result["ttl"] = info.ttl
+    if info.rtt is not None:
+        result["rtt"] = info.rtt
+        result["rtt_var"] = info.rtt_var
     if info.http_info is not None:
         result["http"] = {
             str(p): {
@@ -2578,6 +3269,46 @@ def auto_scan_results_to_dict(results: Dict[str, AutoScanInfo]) -> Dict[str, Any
     return {host: auto_scan_info_to_dict(info) for host, info in results.items()}
 
 
+def auto_scan_info_from_dict(data: Dict[str, Any]) -> AutoScanInfo:
+    """Return an :class:`AutoScanInfo` from :func:`auto_scan_info_to_dict` output."""
+
+    payload = data.get("ports", [])
+    ports: PortResult
+    if isinstance(payload, dict):
+        if all(isinstance(v, dict) for v in payload.values()):
+            ports = {
+                int(p): PortInfo(v.get("service", "unknown"), v.get("banner"), v.get("latency"))
+                for p, v in payload.items()
+            }
+        else:
+            ports = {int(p): str(v) for p, v in payload.items()}
+    else:
+        ports = [int(p) for p in payload]
+
+    info = AutoScanInfo(
+        ports,
+        hostname=data.get("hostname"),
+        mac=data.get("mac"),
+        os_guess=data.get("os"),
+        ping_latency=data.get("ping_latency"),
+        ttl=data.get("ttl"),
+        vendor=data.get("vendor"),
+        device_type=data.get("device"),
+        rtt=data.get("rtt"),
+        rtt_var=data.get("rtt_var"),
+    )
+    if "connections" in data:
+        info.connections = {int(p): int(c) for p, c in data["connections"].items()}
+    if "http" in data:
+        info.http_info = {
+            int(p): HTTPInfo(h.get("server"), h.get("title"))
+            for p, h in data["http"].items()
+        }
+    if "risk" in data:
+        info.risk_score = data["risk"]
+    return info
+
+
 def scan_port_list(
     host: str,
     ports: Iterable[int],
@@ -2661,8 +3392,13 @@ async def async_scan_port_list(
     with_services: bool = False,
     with_banner: bool = False,
     with_latency: bool = False,
+    engine: str | None = None,
+    scheduler: ProbeScheduler | None = None,
 ) -> PortResult:
-    """Asynchronously scan ``ports`` on ``host``."""
+    """Asynchronously scan ``ports`` on ``host``.
+
+    ``engine`` and ``scheduler`` behave the same as in :func:`async_scan_ports`.
+    """
 
     port_list = sorted(set(int(p) for p in ports))
     if not port_list:
@@ -2680,52 +3416,22 @@ async def async_scan_port_list(
             return cached
 
     addr, resolved_family = await _async_resolve_host(host, family)
+    estimator = _host_estimator(host)
 
-    open_ports: list[tuple[int, str | None, float | None]] = []
-    total = len(port_list)
-    completed = 0
-
-    queue: asyncio.Queue[int] = asyncio.Queue()
-    for p in port_list:
-        queue.put_nowait(p)
-
-    async def worker() -> None:
-        nonlocal completed
-        while not queue.empty():
-            try:
-                port = queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-            try:
-                start_ts = time.perf_counter()
-                conn = asyncio.open_connection(addr, port, family=resolved_family)
-                reader, writer = await asyncio.wait_for(conn, timeout=timeout)
-                latency = time.perf_counter() - start_ts if with_latency else None
-                banner = None
-                if with_banner:
-                    try:
-                        data = await asyncio.wait_for(reader.read(100), 0.1)
-                        banner = data.decode(errors="ignore").strip() or None
-                    except Exception:
-                        banner = None
-                writer.close()
-                await writer.wait_closed()
-                open_ports.append((port, banner, latency))
-            except Exception:
-                pass
-            finally:
-                completed += 1
-                if progress is not None:
-                    progress(completed / total)
-                queue.task_done()
-
-    workers = [
-        asyncio.create_task(worker()) for _ in range(max(1, min(concurrency, total)))
-    ]
-    await queue.join()
-    for w in workers:
-        w.cancel()
-    await asyncio.gather(*workers, return_exceptions=True)
+    open_ports = await _async_probe_ports(
+        addr,
+        resolved_family,
+        port_list,
+        progress,
+        concurrency,
+        timeout=timeout,
+        with_banner=with_banner,
+        with_latency=with_latency,
+        engine=engine,
+        scheduler=scheduler,
+        estimator=estimator,
+    )
+    _store_estimator(host, estimator)
 
     if progress is not None:
         progress(None)
@@ -2745,6 +3451,56 @@ async def async_scan_port_list(
     return port_nums
 
 
+async def async_benchmark_scan_engines(
+    *,
+    listeners: int = 64,
+    ports: int = 4096,
+    engines: Iterable[str] = ("stream", "raw"),
+    concurrency: int | None = None,
+) -> Dict[str, float]:
+    """Return ports/sec per scan engine against a local listener farm.
+
+    ``listeners`` sockets are opened on ``127.0.0.1`` and mixed into a list of
+    ``ports`` probes whose remainder targets closed ports, so both accepted
+    and refused connects are measured. Each engine scans the same list with
+    caching disabled; ``concurrency`` defaults to each engine's own default.
+    """
+
+    farm: list[socket.socket] = []
+    try:
+        for _ in range(listeners):
+            srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            srv.bind(("127.0.0.1", 0))
+            srv.listen(1024)
+            farm.append(srv)
+        open_ports = {srv.getsockname()[1] for srv in farm}
+        targets = list(open_ports)
+        candidate = 20000
+        while len(targets) < ports and candidate < 65536:
+            if candidate not in open_ports:
+                targets.append(candidate)
+            candidate += 1
+
+        rates: Dict[str, float] = {}
+        for engine in engines:
+            started = time.perf_counter()
+            found = await async_scan_port_list(
+                "127.0.0.1",
+                targets,
+                concurrency=concurrency or _DEFAULT_CONCURRENCY,
+                cache_ttl=0,
+                engine=engine,
+            )
+            elapsed = time.perf_counter() - started
+            if not open_ports.issubset(set(cast(List[int], found))):
+                raise RuntimeError(f"{engine} engine missed open listeners")
+            rates[engine] = len(targets) / elapsed if elapsed > 0 else float("inf")
+        return rates
+    finally:
+        for srv in farm:
+            srv.close()
+
+
 def scan_top_ports(
     host: str,
     *,
@@ -2854,14 +3610,17 @@ async def async_scan_targets_list(
     with_services: bool = False,
     with_banner: bool = False,
     with_latency: bool = False,
+    engine: str | None = None,
 ) -> Dict[str, PortResult]:
     """Asynchronously scan ``ports`` on multiple ``hosts``.
 
     When ``progress`` is supplied it reflects combined progress across all hosts
-    so values advance smoothly from 0 to 1 until all scans finish.
+    so values advance smoothly from 0 to 1 until all scans finish. ``engine``
+    behaves the same as in :func:`async_scan_targets`.
     """
 
     host_list = list(hosts)
+    scheduler = _shared_scheduler(engine, concurrency)
     results: Dict[str, PortResult] = {}
     total = len(host_list)
 
@@ -2898,6 +3657,8 @@ async def async_scan_targets_list(
                     with_services=with_services,
                     with_banner=with_banner,
                     with_latency=with_latency,
+                    engine=engine,
+                    scheduler=scheduler,
                 )
             finally:
                 queue.task_done()
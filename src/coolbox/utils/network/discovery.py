@@ -0,0 +1,259 @@
+"""Host discovery without spawning ``ping`` processes.
+
+:class:`IcmpPinger` sends ICMP echo requests for every target over one socket
+per address family and matches replies back to their request by sequence
+number and a per-pinger token. It prefers unprivileged ``SOCK_DGRAM`` ICMP
+sockets (Linux ``net.ipv4.ping_group_range``, macOS) and falls back to raw
+sockets when the process is privileged. The reply TTL or hop limit is read
+from the IP header or ancillary data.
+
+When ICMP is unavailable :func:`ping_host` probes a handful of common TCP
+ports through :class:`~coolbox.utils.network.engine.ProbeScheduler`: any
+accepted or refused connection proves the host is up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import os
+import socket
+import struct
+import sys
+import time
+import weakref
+
+from .engine import ProbeScheduler
+
+__all__ = ["IcmpPinger", "TCP_PING_PORTS", "get_pinger", "ping_host"]
+
+# Ports tried by the TCP fallback, most commonly reachable first.
+TCP_PING_PORTS = (80, 443, 22, 445, 139, 3389, 8080, 53, 23, 21)
+
+_ECHO_REQUEST = {socket.AF_INET: 8, socket.AF_INET6: 128}
+_ECHO_REPLY = {socket.AF_INET: 0, socket.AF_INET6: 129}
+_PROTO = {socket.AF_INET: socket.IPPROTO_ICMP, socket.AF_INET6: socket.IPPROTO_ICMPV6}
+# Not exported by the socket module on every platform.
+_IP_RECVTTL = getattr(socket, "IP_RECVTTL", 12 if sys.platform.startswith("linux") else None)
+_IPV6_RECVHOPLIMIT = getattr(socket, "IPV6_RECVHOPLIMIT", None)
+_IPV6_HOPLIMIT = getattr(socket, "IPV6_HOPLIMIT", None)
+_HEADER = struct.Struct("!BBHHH")
+_TCP_PING_LIMIT = 4096
+_RCVBUF = 4 * 1024 * 1024
+
+_LOOP_STATE: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, tuple[IcmpPinger, ProbeScheduler]
+] = weakref.WeakKeyDictionary()
+
+
+def _checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+class IcmpPinger:
+    """Multiplex ICMP echo requests for many hosts over shared sockets.
+
+    A pinger is bound to the event loop that created it; use
+    :func:`get_pinger` to obtain the one for the running loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self._loop = loop or asyncio.get_running_loop()
+        self._socks: dict[int, socket.socket | None] = {}
+        self._raw: dict[int, bool] = {}
+        self._ident = int.from_bytes(os.urandom(2), "big")
+        self._token = os.urandom(8)
+        self._seq = 0
+        self._waiting: dict[
+            tuple[int, int], tuple[asyncio.Future[tuple[float, int | None]], str, float]
+        ] = {}
+
+    def available(self, family: int = socket.AF_INET) -> bool:
+        """Return ``True`` if ICMP echo can be sent for *family*."""
+
+        return self._socket(family) is not None
+
+    async def ping(
+        self, addr: str, family: int = socket.AF_INET, timeout: float = 1.0
+    ) -> tuple[float, int | None] | None:
+        """Return ``(rtt, ttl)`` for an echo reply from *addr* or ``None``."""
+
+        sock = self._socket(family)
+        if sock is None:
+            return None
+        seq = self._next_seq(family)
+        kind = _ECHO_REQUEST[family]
+        packet = _HEADER.pack(kind, 0, 0, self._ident, seq) + self._token
+        if family == socket.AF_INET:
+            # The kernel fills in the ICMPv6 checksum itself.
+            csum = _checksum(packet)
+            packet = _HEADER.pack(kind, 0, csum, self._ident, seq) + self._token
+        fut: asyncio.Future[tuple[float, int | None]] = self._loop.create_future()
+        key = (family, seq)
+        self._waiting[key] = (fut, addr, time.perf_counter())
+        try:
+            try:
+                sock.sendto(packet, (addr, 0))
+            except (BlockingIOError, InterruptedError):
+                await asyncio.sleep(0)
+                sock.sendto(packet, (addr, 0))
+            return await asyncio.wait_for(fut, timeout)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        finally:
+            self._waiting.pop(key, None)
+
+    def close(self) -> None:
+        for sock in self._socks.values():
+            if sock is None:
+                continue
+            if not self._loop.is_closed():
+                self._loop.remove_reader(sock.fileno())
+            sock.close()
+        self._socks.clear()
+        for fut, _addr, _ts in self._waiting.values():
+            if not fut.done():
+                fut.cancel()
+
+    # -- internals -------------------------------------------------------
+    def _next_seq(self, family: int) -> int:
+        for _ in range(0x10000):
+            self._seq = (self._seq + 1) & 0xFFFF
+            if (family, self._seq) not in self._waiting:
+                return self._seq
+        raise OSError("no free ICMP sequence numbers")
+
+    def _socket(self, family: int) -> socket.socket | None:
+        if family in self._socks:
+            return self._socks[family]
+        sock = None
+        proto = _PROTO.get(family)
+        if proto is not None:
+            for kind in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+                try:
+                    sock = socket.socket(family, kind, proto)
+                except (OSError, ValueError):
+                    continue
+                self._raw[family] = kind == socket.SOCK_RAW
+                break
+        if sock is not None:
+            sock.setblocking(False)
+            try:
+                # Replies for a whole sweep can arrive in one burst.
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF)
+            except OSError:
+                pass
+            try:
+                if family == socket.AF_INET and _IP_RECVTTL is not None:
+                    sock.setsockopt(socket.IPPROTO_IP, _IP_RECVTTL, 1)
+                elif family == socket.AF_INET6 and _IPV6_RECVHOPLIMIT is not None:
+                    sock.setsockopt(socket.IPPROTO_IPV6, _IPV6_RECVHOPLIMIT, 1)
+            except OSError:
+                pass
+            try:
+                self._loop.add_reader(sock.fileno(), self._on_readable, family, sock)
+            except NotImplementedError:
+                # Proactor loops cannot watch raw descriptors.
+                sock.close()
+                sock = None
+        self._socks[family] = sock
+        return sock
+
+    def _on_readable(self, family: int, sock: socket.socket) -> None:
+        while True:
+            try:
+                data, ancdata, _flags, src = sock.recvmsg(
+                    1024, socket.CMSG_SPACE(4)
+                )
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return
+            now = time.perf_counter()
+            ttl = None
+            for level, kind, value in ancdata:
+                if (level, kind) in (
+                    (socket.IPPROTO_IP, socket.IP_TTL),
+                    (socket.IPPROTO_IPV6, _IPV6_HOPLIMIT),
+                ) and len(value) >= 4:
+                    ttl = int.from_bytes(value[:4], sys.byteorder)
+            if family == socket.AF_INET and data and data[0] >> 4 == 4:
+                # Raw sockets (and macOS datagram sockets) include the IP header.
+                ihl = (data[0] & 0x0F) * 4
+                ttl = data[8]
+                data = data[ihl:]
+            if len(data) < _HEADER.size + len(self._token):
+                continue
+            kind, _code, _csum, ident, seq = _HEADER.unpack_from(data)
+            if kind != _ECHO_REPLY[family]:
+                continue
+            if data[_HEADER.size : _HEADER.size + len(self._token)] != self._token:
+                continue
+            if self._raw.get(family) and ident != self._ident:
+                continue
+            entry = self._waiting.get((family, seq))
+            if entry is None:
+                continue
+            fut, addr, started = entry
+            if fut.done() or not _same_address(src[0], addr):
+                continue
+            fut.set_result((now - started, ttl))
+
+
+def _same_address(a: str, b: str) -> bool:
+    try:
+        return ipaddress.ip_address(a.split("%", 1)[0]) == ipaddress.ip_address(
+            b.split("%", 1)[0]
+        )
+    except ValueError:
+        return a == b
+
+
+def _loop_state() -> tuple[IcmpPinger, ProbeScheduler]:
+    loop = asyncio.get_running_loop()
+    state = _LOOP_STATE.get(loop)
+    if state is None:
+        state = (
+            IcmpPinger(loop),
+            ProbeScheduler(_TCP_PING_LIMIT, len(TCP_PING_PORTS)),
+        )
+        _LOOP_STATE[loop] = state
+    return state
+
+
+def get_pinger() -> IcmpPinger:
+    """Return the :class:`IcmpPinger` shared by the running event loop."""
+
+    return _loop_state()[0]
+
+
+async def ping_host(
+    addr: str,
+    family: int = socket.AF_INET,
+    *,
+    timeout: float = 1.0,
+    engine: str = "auto",
+    tcp_ports: tuple[int, ...] = TCP_PING_PORTS,
+) -> tuple[bool, int | None, float | None]:
+    """Return ``(alive, ttl, rtt)`` for the resolved address *addr*.
+
+    *engine* selects ``"icmp"`` echo requests, ``"tcp"`` connect probes on
+    *tcp_ports*, or ``"auto"`` to use ICMP when a socket can be opened and TCP
+    otherwise. TCP probes carry no TTL.
+    """
+
+    pinger, scheduler = _loop_state()
+    if engine == "icmp" or (engine == "auto" and pinger.available(family)):
+        reply = await pinger.ping(addr, family, timeout)
+        if reply is None:
+            return False, None, None
+        return True, reply[1], reply[0]
+    if engine not in ("auto", "tcp"):
+        raise ValueError(f"Unknown ping engine: {engine}")
+    rtt = await scheduler.ping(addr, tcp_ports, family=family, timeout=timeout)
+    return rtt is not None, None, rtt
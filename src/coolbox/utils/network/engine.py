@@ -0,0 +1,615 @@
+"""Low-overhead TCP connect scanning built on bare non-blocking sockets.
+
+:func:`connect_scan` registers plain non-blocking sockets directly with the
+running event loop's selector. A probe costs one socket, one writer callback
+and one timer handle: no ``StreamReader``/``StreamWriter``, transport,
+protocol or per-port task is created. This keeps thousands of connection
+attempts in flight without the object churn of :func:`asyncio.open_connection`.
+
+:class:`ProbeScheduler` shares one socket budget between many hosts with a
+per-host cap and round-robin service. Event loops without ``add_writer`` (the
+Windows proactor loop) fall back to one ``loop.sock_connect`` task per probe.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import errno
+import socket
+import time
+from collections import deque
+from typing import Callable, Iterable
+
+try:  # pragma: no cover - not available on Windows
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+__all__ = [
+    "CongestionWindow",
+    "ProbeScheduler",
+    "RttEstimator",
+    "connect_scan",
+    "max_inflight",
+]
+
+_IN_PROGRESS = {
+    errno.EINPROGRESS,
+    errno.EWOULDBLOCK,
+    errno.EAGAIN,
+    getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK),
+}
+# Errors that carry a real reply from the target and therefore an RTT sample.
+_ANSWERED = {0, errno.ECONNREFUSED, getattr(errno, "WSAECONNREFUSED", errno.ECONNREFUSED)}
+_FD_HEADROOM = 64
+
+OpenPort = tuple[int, str | None, float]
+
+
+class RttEstimator:
+    """Smoothed round-trip time estimate following RFC 6298.
+
+    ``sample`` feeds a measured RTT in seconds; ``timeout`` derives the
+    connect timeout as ``srtt + k * rttvar``, or *initial* until the first
+    sample arrives. ``expired`` doubles the result after a timeout burst
+    (exponential backoff) until the next sample. Pass *srtt*/*rttvar* to
+    start from an earlier estimate.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.125,
+        beta: float = 0.25,
+        k: float = 4.0,
+        *,
+        srtt: float | None = None,
+        rttvar: float | None = None,
+        max_backoff: float = 64.0,
+    ) -> None:
+        self.alpha = alpha
+        self.beta = beta
+        self.k = k
+        self.srtt = srtt
+        if rttvar is None:
+            rttvar = srtt / 2 if srtt is not None else 0.0
+        self.rttvar = rttvar
+        self.backoff = 1.0
+        self.max_backoff = max_backoff
+        self.samples = 0
+
+    def sample(self, rtt: float) -> None:
+        if rtt < 0:
+            return
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - self.beta) * self.rttvar + self.beta * abs(self.srtt - rtt)
+            self.srtt = (1 - self.alpha) * self.srtt + self.alpha * rtt
+        self.backoff = 1.0
+        self.samples += 1
+
+    def expired(self) -> None:
+        self.backoff = min(self.backoff * 2, self.max_backoff)
+
+    def timeout(
+        self, initial: float, floor: float = 0.05, ceiling: float | None = None
+    ) -> float:
+        """Return the connect timeout clamped to ``[floor, ceiling]``.
+
+        *ceiling* defaults to *initial*, so the timeout never grows past the
+        caller's setting unless a larger ceiling is given.
+        """
+
+        if ceiling is None:
+            ceiling = initial
+        if self.srtt is None:
+            base = initial
+        else:
+            base = max(floor, self.srtt + self.k * self.rttvar)
+        return min(ceiling, base * self.backoff)
+
+
+class CongestionWindow:
+    """Additive-increase/multiplicative-decrease cap on probes in flight.
+
+    The window starts at *limit* (or *initial*), grows by ``1 / size`` per
+    answered probe and halves on a timeout burst, never leaving
+    ``[floor, limit]``.
+    """
+
+    def __init__(self, limit: int, floor: int = 1, initial: int | None = None) -> None:
+        self.limit = max(1, limit)
+        self.floor = max(1, min(floor, self.limit))
+        start = self.limit if initial is None else initial
+        self.value = float(max(self.floor, min(self.limit, start)))
+
+    @property
+    def size(self) -> int:
+        return int(self.value)
+
+    def grow(self) -> None:
+        self.value = min(float(self.limit), self.value + 1 / self.value)
+
+    def shrink(self) -> None:
+        self.value = max(float(self.floor), self.value / 2)
+
+
+def max_inflight(requested: int) -> int:
+    """Clamp *requested* concurrent sockets to the process descriptor limit."""
+
+    requested = max(1, int(requested))
+    if resource is None:
+        return requested
+    try:
+        soft, _hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (OSError, ValueError):  # pragma: no cover - exotic platforms
+        return requested
+    if soft == resource.RLIM_INFINITY:
+        return requested
+    return max(1, min(requested, soft - _FD_HEADROOM))
+
+
+def _supports_fd_watch(loop: asyncio.AbstractEventLoop) -> bool:
+    """Return ``True`` if *loop* can watch raw descriptors via ``add_writer``."""
+
+    proactor = getattr(asyncio, "ProactorEventLoop", None)
+    return not (proactor is not None and isinstance(loop, proactor))
+
+
+class _HostJob:
+    """Pending and in-flight probes for one target within a scheduler."""
+
+    __slots__ = (
+        "addr",
+        "family",
+        "pending",
+        "inflight",
+        "opened",
+        "total",
+        "completed",
+        "progress",
+        "done",
+        "estimator",
+        "timeout",
+        "max_timeout",
+        "window",
+        "recover_at",
+        "unanswered",
+        "answered",
+        "dead",
+        "queued",
+        "stop_on_answer",
+        "first_rtt",
+    )
+
+    def __init__(
+        self,
+        addr: str,
+        family: int,
+        ports: list[int],
+        progress: Callable[[float], None] | None,
+        done: asyncio.Future[None],
+        estimator: RttEstimator,
+        timeout: float,
+        max_timeout: float | None,
+        window: CongestionWindow,
+    ) -> None:
+        self.addr = addr
+        self.family = family
+        self.pending = deque(ports)
+        self.inflight = 0
+        self.opened: list[tuple[int, socket.socket, float]] = []
+        self.total = len(ports)
+        self.completed = 0
+        self.progress = progress
+        self.done = done
+        self.estimator = estimator
+        self.timeout = timeout
+        self.max_timeout = max_timeout
+        self.window = window
+        self.recover_at = 0.0
+        self.unanswered = 0
+        self.answered = 0
+        self.dead = False
+        self.queued = False
+        self.stop_on_answer = False
+        self.first_rtt: float | None = None
+
+
+_Probe = tuple[_HostJob, socket.socket, int, float, "asyncio.TimerHandle | asyncio.Task[None]"]
+
+
+class ProbeScheduler:
+    """Shared scheduler for ``(host, port)`` connect probes.
+
+    Every :meth:`scan` call adds a host job; probes from all jobs draw on one
+    pool of *limit* sockets (clamped by :func:`max_inflight`) and each job may
+    hold at most *per_host* of them. Jobs are served round-robin so a slow host
+    cannot starve the rest. A host whose first *dead_after* probes all time
+    out without a single accepted or refused connection is treated as dead and
+    its remaining ports are skipped; :meth:`mark_dead` does the same on
+    request. ``0`` disables the automatic check.
+
+    Each host keeps an :class:`RttEstimator` and a :class:`CongestionWindow`.
+    A burst of timeouts (at most one reaction per current timeout interval)
+    backs off the host's connect timeout and, once the host has answered at
+    all, halves its window down to *min_window*; answers grow it back.
+
+    A scheduler is bound to the event loop that runs its first scan.
+    """
+
+    def __init__(
+        self,
+        limit: int = 1000,
+        per_host: int = 256,
+        *,
+        min_timeout: float = 0.05,
+        min_window: int = 1,
+        dead_after: int = 0,
+    ) -> None:
+        self.limit = max_inflight(limit)
+        self.per_host = max(1, min(per_host, self.limit))
+        self.min_timeout = min_timeout
+        self.min_window = min_window
+        self.dead_after = dead_after
+        self._estimators: dict[str, RttEstimator] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._watch_fds = True
+        self._ready: deque[_HostJob] = deque()
+        self._inflight: dict[int, _Probe] = {}
+        self._jobs: dict[str, list[_HostJob]] = {}
+
+    @property
+    def active(self) -> int:
+        """Return the number of probes currently in flight."""
+
+        return len(self._inflight)
+
+    def mark_dead(self, addr: str) -> None:
+        """Stop probing every job targeting *addr*."""
+
+        for job in list(self._jobs.get(addr, ())):
+            self._kill(job)
+        self._fill()
+
+    async def scan(
+        self,
+        addr: str,
+        ports: Iterable[int],
+        *,
+        family: int = socket.AF_INET,
+        timeout: float = 0.5,
+        max_timeout: float | None = None,
+        with_banner: bool = False,
+        progress: Callable[[float], None] | None = None,
+        estimator: RttEstimator | None = None,
+    ) -> list[OpenPort]:
+        """Probe *ports* on *addr* and return ``(port, banner, rtt)`` for open ones.
+
+        *timeout* is used until the host answers; afterwards probe timeouts
+        follow its RTT, bounded by the scheduler's ``min_timeout`` and by
+        *max_timeout* (default *timeout*). *estimator* defaults to one shared
+        by every scan of *addr* on this scheduler. *progress* receives the
+        completed fraction after every probe.
+        """
+
+        port_list = list(ports)
+        if not port_list:
+            return []
+        job = self._submit(
+            addr, port_list, family, timeout, max_timeout, progress, estimator
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            await job.done
+            opened = job.opened
+            try:
+                if with_banner and opened:
+                    banners = await asyncio.gather(
+                        *(_read_banner(loop, sock) for _port, sock, _rtt in opened)
+                    )
+                else:
+                    banners = [None] * len(opened)
+            finally:
+                for _port, sock, _rtt in opened:
+                    sock.close()
+        finally:
+            self._finish(job)
+        return [(port, banner, rtt) for (port, _sock, rtt), banner in zip(opened, banners)]
+
+    async def ping(
+        self,
+        addr: str,
+        ports: Iterable[int],
+        *,
+        family: int = socket.AF_INET,
+        timeout: float = 0.5,
+    ) -> float | None:
+        """Return the RTT of the first connect answer from *addr* or ``None``.
+
+        An accepted or refused connection on any of *ports* proves the host is
+        up; the remaining probes are cancelled as soon as one answers.
+        """
+
+        port_list = list(ports)
+        if not port_list:
+            return None
+        job = self._submit(
+            addr, port_list, family, timeout, None, None, None, stop_on_answer=True
+        )
+        try:
+            await job.done
+        finally:
+            self._finish(job)
+        return job.first_rtt
+
+    def _submit(
+        self,
+        addr: str,
+        ports: list[int],
+        family: int,
+        timeout: float,
+        max_timeout: float | None,
+        progress: Callable[[float], None] | None,
+        estimator: RttEstimator | None,
+        *,
+        stop_on_answer: bool = False,
+    ) -> _HostJob:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._watch_fds = _supports_fd_watch(loop)
+        elif self._loop is not loop:
+            raise RuntimeError("ProbeScheduler is bound to a different event loop")
+        job = _HostJob(
+            addr,
+            family,
+            ports,
+            progress,
+            loop.create_future(),
+            estimator or self._estimators.setdefault(addr, RttEstimator()),
+            timeout,
+            max_timeout,
+            CongestionWindow(self.per_host, self.min_window),
+        )
+        job.stop_on_answer = stop_on_answer
+        self._jobs.setdefault(addr, []).append(job)
+        self._enqueue(job)
+        self._fill()
+        return job
+
+    def _finish(self, job: _HostJob) -> None:
+        if not job.dead and (job.pending or job.inflight):
+            # Cancelled while probes were outstanding.
+            self._kill(job)
+            for _port, sock, _rtt in job.opened:
+                sock.close()
+            self._fill()
+        jobs = self._jobs.get(job.addr)
+        if jobs is not None:
+            jobs.remove(job)
+            if not jobs:
+                del self._jobs[job.addr]
+
+    # -- scheduling ------------------------------------------------------
+    def _enqueue(self, job: _HostJob) -> None:
+        if (
+            not job.queued
+            and not job.dead
+            and job.pending
+            and job.inflight < job.window.size
+        ):
+            job.queued = True
+            self._ready.append(job)
+
+    def _fill(self) -> None:
+        while self._ready and len(self._inflight) < self.limit:
+            job = self._ready.popleft()
+            job.queued = False
+            if job.dead or not job.pending or job.inflight >= job.window.size:
+                continue
+            port = job.pending.popleft()
+            if not self._launch(job, port):
+                if self._inflight:
+                    # Out of descriptors; retry once a probe in flight finishes.
+                    job.pending.appendleft(port)
+                    job.queued = True
+                    self._ready.appendleft(job)
+                    break
+                self._record(job, None, port, 0.0, errno.EMFILE)
+            self._enqueue(job)
+
+    def _launch(self, job: _HostJob, port: int) -> bool:
+        try:
+            sock = socket.socket(job.family, socket.SOCK_STREAM)
+        except OSError:
+            return False
+        sock.setblocking(False)
+        loop = self._loop
+        assert loop is not None
+        wait = job.estimator.timeout(job.timeout, self.min_timeout, job.max_timeout)
+        started = time.perf_counter()
+        if not self._watch_fds:
+            fd = sock.fileno()
+            task = loop.create_task(self._sock_connect(fd, sock, job.addr, port, wait))
+            self._inflight[fd] = (job, sock, port, started, task)
+            job.inflight += 1
+            return True
+        try:
+            err = sock.connect_ex((job.addr, port))
+        except OSError as exc:
+            err = exc.errno or -1
+        if err not in _IN_PROGRESS:
+            # Immediate answers (loopback refusals) are recorded without
+            # re-entering _fill to keep the call stack flat.
+            self._record(job, sock, port, started, err)
+            return True
+        fd = sock.fileno()
+        handle = loop.call_later(wait, self._complete, fd, errno.ETIMEDOUT)
+        self._inflight[fd] = (job, sock, port, started, handle)
+        job.inflight += 1
+        loop.add_writer(fd, self._on_writable, fd)
+        return True
+
+    async def _sock_connect(
+        self, fd: int, sock: socket.socket, addr: str, port: int, wait: float
+    ) -> None:
+        loop = self._loop
+        assert loop is not None
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (addr, port)), wait)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            err = errno.ETIMEDOUT
+        except OSError as exc:
+            err = exc.errno or -1
+        else:
+            err = 0
+        self._complete(fd, err)
+
+    def _on_writable(self, fd: int) -> None:
+        entry = self._inflight.get(fd)
+        if entry is None:
+            return
+        try:
+            err = entry[1].getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        except OSError as exc:
+            err = exc.errno or -1
+        self._complete(fd, err)
+
+    def _release(self, fd: int, *, cancel: bool) -> _Probe | None:
+        entry = self._inflight.pop(fd, None)
+        if entry is None:
+            return None
+        job, _sock, _port, _started, waiter = entry
+        job.inflight -= 1
+        if self._watch_fds:
+            assert self._loop is not None
+            self._loop.remove_writer(fd)
+            waiter.cancel()
+        elif cancel:
+            waiter.cancel()
+        return entry
+
+    def _complete(self, fd: int, err: int) -> None:
+        entry = self._release(fd, cancel=False)
+        if entry is None:
+            return
+        job, sock, port, started, _waiter = entry
+        self._record(job, sock, port, started, err)
+        self._enqueue(job)
+        self._fill()
+
+    def _record(
+        self,
+        job: _HostJob,
+        sock: socket.socket | None,
+        port: int,
+        started: float,
+        err: int,
+    ) -> None:
+        now = time.perf_counter()
+        if err in _ANSWERED:
+            job.estimator.sample(now - started)
+            job.window.grow()
+            job.answered += 1
+        elif err == errno.ETIMEDOUT:
+            job.unanswered += 1
+            if now >= job.recover_at:
+                # React once per burst: probes launched before the backoff
+                # would otherwise collapse the window in a single interval.
+                job.estimator.expired()
+                if job.answered:
+                    job.window.shrink()
+                job.recover_at = now + job.estimator.timeout(
+                    job.timeout, self.min_timeout, job.max_timeout
+                )
+        if job.stop_on_answer and err in _ANSWERED and not job.dead:
+            if sock is not None:
+                sock.close()
+            job.first_rtt = now - started
+            self._kill(job)
+            return
+        if err == 0 and sock is not None and not job.dead:
+            job.opened.append((port, sock, now - started))
+        elif sock is not None:
+            sock.close()
+        if job.dead:
+            return
+        job.completed += 1
+        if job.progress is not None:
+            job.progress(job.completed / job.total)
+        if self.dead_after and not job.answered and job.unanswered >= self.dead_after:
+            self._kill(job)
+        elif job.completed >= job.total and not job.done.done():
+            job.done.set_result(None)
+
+    def _kill(self, job: _HostJob) -> None:
+        """Skip the remaining ports of *job* and cancel its probes in flight."""
+
+        if job.dead:
+            return
+        job.dead = True
+        job.completed += len(job.pending) + job.inflight
+        job.pending.clear()
+        for fd in [fd for fd, entry in self._inflight.items() if entry[0] is job]:
+            entry = self._release(fd, cancel=True)
+            if entry is not None:
+                entry[1].close()
+        if job.progress is not None:
+            job.progress(1.0)
+        if not job.done.done():
+            job.done.set_result(None)
+
+
+async def _read_banner(
+    loop: asyncio.AbstractEventLoop, sock: socket.socket, limit: int = 100
+) -> str | None:
+    try:
+        data = await asyncio.wait_for(loop.sock_recv(sock, limit), 0.1)
+    except Exception:
+        return None
+    return data.decode(errors="ignore").strip() or None
+
+
+async def connect_scan(
+    addr: str,
+    ports: Iterable[int],
+    *,
+    family: int = socket.AF_INET,
+    timeout: float = 0.5,
+    max_timeout: float | None = None,
+    concurrency: int = 1000,
+    min_timeout: float = 0.05,
+    min_window: int = 1,
+    with_banner: bool = False,
+    progress: Callable[[float], None] | None = None,
+    estimator: RttEstimator | None = None,
+) -> list[OpenPort]:
+    """Probe *ports* on the resolved address *addr* with TCP connects.
+
+    Returns ``(port, banner, rtt)`` tuples for every port that accepted the
+    connection. Up to *concurrency* probes (bounded by the descriptor limit)
+    are in flight at once, narrowed to no less than *min_window* while
+    timeouts pile up. Each probe's timeout adapts to the round-trip times
+    observed from earlier answers (accepted or refused connections), never
+    exceeding *max_timeout* (default *timeout*) nor dropping below
+    *min_timeout*. Pass an *estimator* to share RTT state between scans of
+    the same host.
+    """
+
+    scheduler = ProbeScheduler(
+        concurrency, concurrency, min_timeout=min_timeout, min_window=min_window
+    )
+    return await scheduler.scan(
+        addr,
+        ports,
+        family=family,
+        timeout=timeout,
+        max_timeout=max_timeout,
+        with_banner=with_banner,
+        progress=progress,
+        estimator=estimator,
+    )
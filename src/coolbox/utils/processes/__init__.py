@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from .cache import ProcessCache
 from .kill import kill_process, kill_process_tree
-from .monitor import ProcessEntry, ProcessWatcher
+from .monitor import ProcessEntry, ProcessTable, ProcessWatcher
 from .thread_manager import ThreadManager
 from .utils import (
     run_command,
@@ -17,6 +17,7 @@ from . import force_quit_watchdog
 __all__ = [
     "ProcessCache",
     "ProcessEntry",
+    "ProcessTable",
     "ProcessWatcher",
     "ThreadManager",
     "kill_process",
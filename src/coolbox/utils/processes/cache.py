@@ -4,14 +4,23 @@ This module maintains a cached snapshot of running processes and attempts to
 subscribe to OS-level spawn/exit notifications so the snapshot is only rebuilt
 when necessary. When the notification APIs are unavailable or return ambiguous
 results the cache falls back to full enumeration using :mod:`psutil`.
+
+On Linux the cache listens to ``NETLINK_CONNECTOR`` process events
+(fork/exec/exit), which needs ``CAP_NET_ADMIN``. Without it a thread polls the
+``/proc`` directory instead; ``procfs`` does not emit inotify events for
+process creation, so polling is the only unprivileged option.
 """
 
 from __future__ import annotations
 
+import errno
 import os
+import socket
+import struct
 import sys
 import threading
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import Any, TYPE_CHECKING, cast
 
 try:
@@ -28,25 +37,97 @@ if TYPE_CHECKING:
 else:  # pragma: no cover - runtime only alias
     PsutilProcess = psutil.Process
 
+# linux/connector.h and linux/cn_proc.h
+_NETLINK_CONNECTOR = 11
+_CN_IDX_PROC = 1
+_CN_VAL_PROC = 1
+_PROC_CN_MCAST_LISTEN = 1
+_NLMSG_ERROR = 2
+_NLMSG_DONE = 3
+_NLMSG_OVERRUN = 4
+_PROC_EVENT_FORK = 0x00000001
+_PROC_EVENT_EXEC = 0x00000002
+_PROC_EVENT_EXIT = 0x80000000
+_NLMSGHDR = struct.Struct("=IHHII")
+_CN_MSG = struct.Struct("=IIIIHH")
+_PROC_EVENT = struct.Struct("=IIQ")
+_PID_PAIR = struct.Struct("=II")
+_FORK_EVENT = struct.Struct("=IIII")
+
+
+def _proc_pids() -> set[int]:
+    """Return the PIDs currently listed under ``/proc``."""
+
+    return {int(name) for name in os.listdir("/proc") if name.isdigit()}
+
+
+def _parse_proc_events(data: bytes) -> tuple[set[int], set[int], bool]:
+    """Return ``(spawned, exited, overrun)`` from a netlink datagram.
+
+    Exec events count as spawned so their :class:`psutil.Process` is replaced.
+    Thread events are ignored; only thread-group leaders are processes.
+    """
+
+    spawned: set[int] = set()
+    exited: set[int] = set()
+    overrun = False
+    offset = 0
+    header = _NLMSGHDR.size + _CN_MSG.size
+    while offset + _NLMSGHDR.size <= len(data):
+        length, kind, _flags, _seq, _pid = _NLMSGHDR.unpack_from(data, offset)
+        if length < _NLMSGHDR.size:
+            break
+        if kind in (_NLMSG_ERROR, _NLMSG_OVERRUN):
+            overrun = True
+        elif kind == _NLMSG_DONE and length >= header + _PROC_EVENT.size:
+            event = offset + header
+            what = _PROC_EVENT.unpack_from(data, event)[0]
+            body = event + _PROC_EVENT.size
+            if what == _PROC_EVENT_FORK:
+                _ppid, _ptgid, pid, tgid = _FORK_EVENT.unpack_from(data, body)
+                if pid == tgid:
+                    spawned.add(tgid)
+                    exited.discard(tgid)
+            elif what == _PROC_EVENT_EXEC:
+                _pid, tgid = _PID_PAIR.unpack_from(data, body)
+                spawned.add(tgid)
+            elif what == _PROC_EVENT_EXIT:
+                pid, tgid = _PID_PAIR.unpack_from(data, body)
+                if pid == tgid:
+                    exited.add(tgid)
+                    spawned.discard(tgid)
+        offset += (length + 3) & ~3
+    return spawned, exited, overrun
+
 
 class ProcessCache:
     """Cache ``psutil`` process information.
 
     The cache starts with a full snapshot of running processes. On platforms
     that support it a background thread subscribes to OS notifications such as
-    ``kqueue`` (on BSD/macOS) or Windows process callbacks. These notifications
-    mark the cache as dirty when processes spawn or exit so callers only rebuild
-    the snapshot when required. If the notification mechanism fails or returns
-    ambiguous information the cache is invalidated and rebuilt on the next
-    access.
+    netlink proc events (Linux), ``kqueue`` (on BSD/macOS) or Windows process
+    callbacks. Linux events, and the ``/proc`` polling fallback used without
+    privileges, add and remove single entries; other notifications mark the
+    cache as dirty so callers only rebuild the snapshot when required. If the
+    notification mechanism fails or returns ambiguous information the cache is
+    invalidated and rebuilt on the next access.
+
+    ``watcher`` names the active mechanism (``"netlink"``, ``"poll"``,
+    ``"kqueue"``) or is ``None`` when every access after :meth:`invalidate`
+    re-enumerates.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, poll_interval: float = 1.0) -> None:
         self._lock = threading.RLock()
         self._procs: dict[int, PsutilProcess] = {}
+        self._view: Mapping[int, PsutilProcess] = MappingProxyType(self._procs)
         self._dirty = True
         self._watch_failed = False
         self._kq: Any | None = None
+        self._nl: socket.socket | None = None
+        self._stop = threading.Event()
+        self._poll_interval = poll_interval
+        self.watcher: str | None = None
         self._start_watchers()
 
     # -- public API -----------------------------------------------------
@@ -55,12 +136,14 @@ class ProcessCache:
 
         The snapshot is rebuilt only when flagged as dirty, either because an
         OS notification reported changes or a previous rebuild attempt failed.
+        The returned read-only view is never mutated; later changes publish a
+        new one.
         """
 
         with self._lock:
             if self._dirty:
                 self._rebuild()
-            return dict(self._procs)
+            return self._view
 
     def invalidate(self) -> None:
         """Mark the cached snapshot as stale."""
@@ -68,21 +151,64 @@ class ProcessCache:
         with self._lock:
             self._dirty = True
 
+    def close(self) -> None:
+        """Stop the background watcher; later snapshots rebuild on demand."""
+
+        self._stop.set()
+        for handle in (self._nl, self._kq):
+            if handle is not None:
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+        self._nl = self._kq = None
+        with self._lock:
+            self.watcher = None
+            self._dirty = True
+
     # -- internal helpers -----------------------------------------------
     def _rebuild(self) -> None:
         """Rebuild the cached snapshot by enumerating processes."""
 
         try:
-            self._procs = {p.pid: p for p in psutil.process_iter()}
+            self._publish({p.pid: p for p in psutil.process_iter()})
             self._dirty = False
         except Exception:
             # If enumeration fails keep stale data but try again later
             self._dirty = True
 
+    def _publish(self, procs: dict[int, PsutilProcess]) -> None:
+        self._procs = procs
+        self._view = MappingProxyType(procs)
+
+    def _apply(self, spawned: Iterable[int], exited: Iterable[int]) -> None:
+        """Add ``spawned`` and drop ``exited`` PIDs without re-enumerating."""
+
+        added: dict[int, PsutilProcess] = {}
+        gone = set(exited)
+        for pid in spawned:
+            try:
+                added[pid] = psutil.Process(pid)
+            except psutil.Error:
+                gone.add(pid)
+        with self._lock:
+            if self._dirty or not (added or gone):
+                return
+            procs = dict(self._procs)
+            for pid in gone:
+                procs.pop(pid, None)
+            procs.update(added)
+            self._publish(procs)
+
     # watcher threads ---------------------------------------------------
     def _start_watchers(self) -> None:
         try:
-            if sys.platform.startswith("darwin") or "bsd" in sys.platform:
+            if sys.platform.startswith("linux"):
+                try:
+                    self._start_netlink()
+                except OSError:
+                    self._start_proc_poll()
+            elif sys.platform.startswith("darwin") or "bsd" in sys.platform:
                 self._start_kqueue()
             elif os.name == "nt":
                 self._start_windows()
@@ -90,6 +216,66 @@ class ProcessCache:
             # If starting watchers fails we simply fall back to rebuilds
             self._watch_failed = True
 
+    def _start_netlink(self) -> None:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, _NETLINK_CONNECTOR)
+        try:
+            sock.bind((0, _CN_IDX_PROC))
+            payload = _CN_MSG.pack(_CN_IDX_PROC, _CN_VAL_PROC, 0, 0, 4, 0)
+            payload += struct.pack("=I", _PROC_CN_MCAST_LISTEN)
+            header = _NLMSGHDR.pack(
+                _NLMSGHDR.size + len(payload), _NLMSG_DONE, 0, 0, os.getpid()
+            )
+            sock.send(header + payload)
+        except OSError:
+            sock.close()
+            raise
+        self._nl = sock
+        self.watcher = "netlink"
+        threading.Thread(
+            target=self._netlink_loop, args=(sock,), name="ProcessCacheNetlink", daemon=True
+        ).start()
+
+    def _netlink_loop(self, sock: socket.socket) -> None:
+        while not self._stop.is_set():
+            try:
+                data = sock.recv(65536)
+            except OSError as exc:
+                if exc.errno == errno.ENOBUFS and not self._stop.is_set():
+                    # The kernel dropped events; only a rebuild is safe now.
+                    self.invalidate()
+                    continue
+                break
+            spawned, exited, overrun = _parse_proc_events(data)
+            if overrun:
+                self.invalidate()
+            else:
+                self._apply(spawned, exited)
+        if self._stop.is_set():
+            return
+        # The socket died underneath us; keep tracking changes by polling.
+        self.invalidate()
+        try:
+            self._start_proc_poll()
+        except Exception:
+            self._watch_failed = True
+            self.watcher = None
+
+    def _start_proc_poll(self) -> None:
+        if not os.path.isdir("/proc"):
+            raise RuntimeError("/proc is not mounted")
+        self.watcher = "poll"
+        threading.Thread(target=self._poll_loop, name="ProcessCachePoll", daemon=True).start()
+
+    def _poll_loop(self) -> None:
+        while not self._stop.wait(self._poll_interval):
+            try:
+                pids = _proc_pids()
+            except OSError:
+                self.invalidate()
+                continue
+            known = self._procs.keys()
+            self._apply(pids - known, known - pids)
+
     def _start_kqueue(self) -> None:
         import select
 
@@ -99,6 +285,7 @@ class ProcessCache:
             raise RuntimeError("kqueue support is unavailable on this platform")
 
         self._kq = kqueue_factory()
+        self.watcher = "kqueue"
         kq = cast(Any, self._kq)
         flags = getattr(select, "KQ_EV_ADD", 0) | getattr(select, "KQ_EV_ENABLE", 0)
         fflags = (
@@ -133,15 +320,13 @@ class ProcessCache:
                 break
             if not events:
                 continue
-            with self._lock:
-                for ev in events:
-                    pid = ev.ident
-                    note_exit = getattr(select, "KQ_NOTE_EXIT", 0)
-                    if ev.fflags & note_exit:
-                        self._procs.pop(pid, None)
-                    else:
-                        # For fork/exec we simply mark cache dirty and rebuild
-                        self._dirty = True
+            note_exit = getattr(select, "KQ_NOTE_EXIT", 0)
+            exited = {ev.ident for ev in events if ev.fflags & note_exit}
+            if len(exited) < len(events):
+                # For fork/exec we simply mark cache dirty and rebuild
+                self.invalidate()
+            else:
+                self._apply((), exited)
 
     def _start_windows(self) -> None:
         """Attempt to subscribe to Windows process notifications.
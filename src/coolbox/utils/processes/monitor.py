@@ -11,8 +11,11 @@ from concurrent.futures import ThreadPoolExecutor
 from queue import Queue, Empty, Full
 from dataclasses import dataclass, field
 from typing import Any, ClassVar, Protocol, TYPE_CHECKING
+from array import array
 from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
 import heapq
+import itertools
 import random
 import math
 try:
@@ -22,6 +25,8 @@ except ImportError:  # pragma: no cover - runtime dependency check
 
     psutil = ensure_psutil()
 
+from .procfs import ProcSample, ProcSampler
+
 if TYPE_CHECKING:
     from psutil import Process as ProcessType
 else:  # pragma: no cover - used only for type checking
@@ -190,6 +195,10 @@ AUTO_BATCH = os.getenv("FORCE_QUIT_AUTO_BATCH", "true").lower() in {"1", "true",
 MIN_BATCH_SIZE = int(os.getenv("FORCE_QUIT_MIN_BATCH", "25"))
 MAX_BATCH_SIZE = int(os.getenv("FORCE_QUIT_MAX_BATCH", "1000"))
 
+# Process sampling backend: ``auto`` reads ``/proc`` directly on Linux,
+# ``procfs`` requires it and ``psutil`` always uses ``psutil.process_iter``
+PROC_SAMPLER = os.getenv("FORCE_QUIT_SAMPLER", "auto").lower()
+
 # Adaptive interval tuning
 MIN_INTERVAL = float(os.getenv("FORCE_QUIT_MIN_INTERVAL", "0.5"))
 MAX_INTERVAL = float(os.getenv("FORCE_QUIT_MAX_INTERVAL", "10.0"))
@@ -200,53 +209,628 @@ MIN_WORKERS = int(os.getenv("FORCE_QUIT_MIN_WORKERS", "2"))
 MAX_WORKERS = int(os.getenv("FORCE_QUIT_MAX_WORKERS", "16"))
 
 
-@dataclass(slots=True)
+# Columns of :class:`ProcessTable`. Float and integer metrics are stored in
+# typed arrays, flags as bytes and the few string fields in plain lists.
+_FLOAT_FIELDS = (
+    "cpu",
+    "mem",
+    "start",
+    "cpu_time",
+    "io_rate",
+    "delta_cpu",
+    "delta_mem",
+    "delta_io",
+    "ema_cpu",
+    "ema_mem",
+    "ema_io",
+    "baseline_cpu",
+    "baseline_mem",
+    "baseline_io",
+    "baseline_cpu_var",
+    "baseline_mem_var",
+    "baseline_io_var",
+    "baseline_cpu_mad",
+    "baseline_mem_mad",
+    "baseline_io_mad",
+    "last_score",
+    "score_sum",
+)
+_INT_FIELDS = ("pid", "threads", "read_bytes", "write_bytes", "files", "conns")
+_FLAG_FIELDS = (
+    "changed",
+    "trending_cpu",
+    "trending_mem",
+    "trending_io",
+    "stable",
+    "normal",
+    "level",
+)
+_TEXT_FIELDS = ("name", "user", "status")
+
+LEVELS = ("normal", "warning", "critical")
+_LEVEL_CODES = {name: code for code, name in enumerate(LEVELS)}
+
+
+def _slope(values: list[float]) -> float:
+    """Return the least-squares slope of *values* over their indices."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    sum_x = n * (n - 1) / 2
+    sum_x2 = (n - 1) * n * (2 * n - 1) / 6
+    sum_y = sum(values)
+    sum_xy = sum(i * v for i, v in enumerate(values))
+    denom = n * sum_x2 - sum_x * sum_x
+    if denom == 0:
+        return 0.0
+    return (n * sum_xy - sum_x * sum_y) / denom
+
+
+class _Ring:
+    """Per-row ring buffers laid out back to back in one ``array('d')``.
+
+    Row ``r`` owns ``data[r * width:(r + 1) * width]`` and uses the first
+    ``cap`` slots of it. Because a ring only wraps once it is full, the
+    occupied slots are always ``data[base:base + count]``.
+    """
+
+    __slots__ = ("width", "data", "head", "count")
+
+    def __init__(self, rows: int, width: int) -> None:
+        self.width = max(1, width)
+        self.data = array("d", [0.0]) * (rows * self.width)
+        self.head = array("i", [0]) * rows
+        self.count = array("i", [0]) * rows
+
+    def grow(self, rows: int) -> None:
+        self.data.extend(array("d", [0.0]) * (rows * self.width))
+        self.head.extend(array("i", [0]) * rows)
+        self.count.extend(array("i", [0]) * rows)
+
+    def widen(self, width: int, caps: array[int]) -> None:
+        """Re-layout every row for rings of up to *width* slots."""
+        rows = len(self.head)
+        saved = [self.values(row, caps[row]) for row in range(rows)]
+        self.width = width
+        self.data = array("d", [0.0]) * (rows * width)
+        for row, values in enumerate(saved):
+            self.reset(row, caps[row], values)
+
+    def reset(self, row: int, cap: int, values: Iterable[float] = ()) -> None:
+        self.head[row] = 0
+        self.count[row] = 0
+        for value in list(values)[-cap:] if cap > 0 else ():
+            self.append(row, cap, value)
+
+    def append(self, row: int, cap: int, value: float) -> None:
+        if cap <= 0:
+            return
+        head = self.head[row]
+        self.data[row * self.width + head] = value
+        head += 1
+        self.head[row] = 0 if head >= cap else head
+        if self.count[row] < cap:
+            self.count[row] += 1
+
+    def values(self, row: int, cap: int) -> list[float]:
+        """Return the samples of *row* from oldest to newest."""
+        count = self.count[row]
+        if not count:
+            return []
+        base = row * self.width
+        start = (self.head[row] - count) % cap
+        if start + count <= cap:
+            return self.data[base + start : base + start + count].tolist()
+        return (
+            self.data[base + start : base + cap].tolist()
+            + self.data[base : base + start + count - cap].tolist()
+        )
+
+    def total(self, row: int) -> float:
+        base = row * self.width
+        return sum(self.data[base : base + self.count[row]])
+
+
+class RingView:
+    """Read-mostly, deque-like view of one row of a sample ring."""
+
+    __slots__ = ("_table", "_ring", "_row", "_cap")
+
+    def __init__(
+        self, table: ProcessTable, ring: str, row: int, cap: array[int]
+    ) -> None:
+        self._table = table
+        self._ring = ring
+        self._row = row
+        self._cap = cap
+
+    @property
+    def maxlen(self) -> int:
+        return self._cap[self._row]
+
+    def append(self, value: float) -> None:
+        ring: _Ring = getattr(self._table, self._ring)
+        ring.append(self._row, self._cap[self._row], value)
+
+    def clear(self) -> None:
+        ring: _Ring = getattr(self._table, self._ring)
+        ring.reset(self._row, self._cap[self._row])
+
+    def __len__(self) -> int:
+        ring: _Ring = getattr(self._table, self._ring)
+        return ring.count[self._row]
+
+    def __iter__(self) -> Iterator[float]:
+        ring: _Ring = getattr(self._table, self._ring)
+        return iter(ring.values(self._row, self._cap[self._row]))
+
+    def __getitem__(self, index: int) -> float:
+        ring: _Ring = getattr(self._table, self._ring)
+        return ring.values(self._row, self._cap[self._row])[index]
+
+    def __repr__(self) -> str:
+        return f"RingView({list(self)!r}, maxlen={self.maxlen})"
+
+
+class ProcessTable:
+    """Struct-of-arrays storage behind :class:`ProcessEntry` views.
+
+    Every metric is a typed ``array`` column indexed by row and the CPU, I/O,
+    memory and change-score histories are ring-buffer matrices, so thousands
+    of processes cost a handful of contiguous buffers rather than a dataclass
+    and four deques each. ``index`` maps PIDs to rows; released rows go on a
+    free list and are reused by the next :meth:`add`.
+
+    :meth:`score_changes`, :meth:`compute_trends` and :meth:`update_levels`
+    sweep a batch of rows per call with the columns bound once, which is how
+    :class:`ProcessWatcher` evaluates a whole cycle. The methods of the same
+    name on :class:`ProcessEntry` run the kernels over a single row.
+    """
+
+    def __init__(
+        self, capacity: int = 64, sample_width: int = 5, score_width: int = 1
+    ) -> None:
+        self.capacity = 0
+        self.columns: dict[str, Any] = {}
+        for name in _FLOAT_FIELDS:
+            self.columns[name] = array("d")
+        for name in _INT_FIELDS:
+            self.columns[name] = array("q")
+        for name in _FLAG_FIELDS:
+            self.columns[name] = array("b")
+        for name in _TEXT_FIELDS:
+            self.columns[name] = []
+        self.max_samples = array("i")
+        self.score_cap = array("i")
+        self.samples = _Ring(0, sample_width)
+        self.io_samples = _Ring(0, sample_width)
+        self.mem_samples = _Ring(0, sample_width)
+        self.recent_scores = _Ring(0, score_width)
+        self.index: dict[int, int] = {}
+        self._free: list[int] = []
+        self._views: list[ProcessEntry | None] = []
+        self._grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, pid: object) -> bool:
+        return pid in self.index
+
+    def _grow(self, rows: int) -> None:
+        start = self.capacity
+        for name in _FLOAT_FIELDS:
+            self.columns[name].extend(array("d", [0.0]) * rows)
+        for name in _INT_FIELDS:
+            self.columns[name].extend(array("q", [0]) * rows)
+        for name in _FLAG_FIELDS:
+            self.columns[name].extend(array("b", [0]) * rows)
+        for name in _TEXT_FIELDS:
+            self.columns[name].extend([""] * rows)
+        self.max_samples.extend(array("i", [0]) * rows)
+        self.score_cap.extend(array("i", [0]) * rows)
+        for ring in self._rings():
+            ring.grow(rows)
+        self._views.extend([None] * rows)
+        self.capacity = start + rows
+        # Pop from the end so the lowest free row is reused first.
+        self._free.extend(range(self.capacity - 1, start - 1, -1))
+
+    def _rings(self) -> tuple[_Ring, _Ring, _Ring, _Ring]:
+        return self.samples, self.io_samples, self.mem_samples, self.recent_scores
+
+    def _ensure_caps(self, max_samples: int, score_cap: int) -> None:
+        for ring in (self.samples, self.io_samples, self.mem_samples):
+            if max_samples > ring.width:
+                ring.widen(max_samples, self.max_samples)
+        if score_cap > self.recent_scores.width:
+            self.recent_scores.widen(score_cap, self.score_cap)
+
+    def _alloc(self, pid: int) -> int:
+        if pid in self.index:
+            self.release(pid)
+        if not self._free:
+            self._grow(self.capacity)
+        row = self._free.pop()
+        self.index[pid] = row
+        return row
+
+    def add(
+        self,
+        pid: int,
+        name: str,
+        cpu: float,
+        mem: float,
+        user: str,
+        start: float,
+        status: str,
+        cpu_time: float,
+        threads: int,
+        read_bytes: int,
+        write_bytes: int,
+        files: int,
+        conns: int,
+        io_rate: float = 0.0,
+        *,
+        samples: Iterable[float] = (),
+        io_samples: Iterable[float] = (),
+        mem_samples: Iterable[float] = (),
+        recent_scores: Iterable[float] = (),
+        max_samples: int = 5,
+    ) -> ProcessEntry:
+        """Store a new process in a free row and return its view.
+
+        Adding a PID that already has a row releases the old row first.
+        """
+        row = self._alloc(pid)
+        col = self.columns
+        for key, value in (
+            ("cpu", cpu),
+            ("mem", mem),
+            ("start", start),
+            ("cpu_time", cpu_time),
+            ("io_rate", io_rate),
+            ("ema_cpu", cpu),
+            ("ema_mem", mem),
+            ("ema_io", io_rate),
+            ("baseline_cpu", cpu),
+            ("baseline_mem", mem),
+            ("baseline_io", io_rate),
+            ("pid", pid),
+            ("threads", threads),
+            ("read_bytes", read_bytes),
+            ("write_bytes", write_bytes),
+            ("files", files),
+            ("conns", conns),
+            ("name", name),
+            ("user", user),
+            ("status", status),
+        ):
+            col[key][row] = value
+        for key in (
+            "delta_cpu",
+            "delta_mem",
+            "delta_io",
+            "baseline_cpu_var",
+            "baseline_mem_var",
+            "baseline_io_var",
+            "baseline_cpu_mad",
+            "baseline_mem_mad",
+            "baseline_io_mad",
+            "last_score",
+            "score_sum",
+        ):
+            col[key][row] = 0.0
+        for key in _FLAG_FIELDS:
+            col[key][row] = 0
+        score_cap = max(0, ProcessEntry.change_agg_window)
+        self._ensure_caps(max_samples, score_cap)
+        self.max_samples[row] = max_samples
+        self.score_cap[row] = score_cap
+        self.samples.reset(row, max_samples, samples)
+        self.io_samples.reset(row, max_samples, io_samples)
+        self.mem_samples.reset(row, max_samples, mem_samples)
+        self.recent_scores.reset(row, score_cap, recent_scores)
+        view = ProcessEntry._view(self, row)
+        self._views[row] = view
+        return view
+
+    def get(self, pid: int) -> ProcessEntry | None:
+        """Return the view stored for *pid*, if any."""
+        row = self.index.get(pid)
+        return None if row is None else self._views[row]
+
+    def adopt(self, entry: ProcessEntry) -> ProcessEntry:
+        """Move *entry* into this table, keeping the same view object."""
+        if entry._table is self:
+            return entry
+        src, src_row = entry._table, entry._row
+        row = self._alloc(entry.pid)
+        self._copy_row(src, src_row, row)
+        if src.index.get(entry.pid) == src_row:
+            src.release(entry.pid, detach=False)
+        entry._table = self
+        entry._row = row
+        self._views[row] = entry
+        return entry
+
+    def release(self, pid: int, *, detach: bool = True) -> None:
+        """Free the row of *pid* for reuse.
+
+        With *detach* the row's view is first moved into a private one-row
+        table so holders of the view (such as the UI snapshot) keep reading
+        the last values instead of whatever process reuses the row.
+        """
+        row = self.index.pop(pid, None)
+        if row is None:
+            return
+        view = self._views[row]
+        self._views[row] = None
+        if view is not None and detach:
+            ProcessTable(
+                1, self.samples.width, self.recent_scores.width
+            ).adopt(view)
+        self._free.append(row)
+
+    def _copy_row(self, src: "ProcessTable", src_row: int, row: int) -> None:
+        for key, column in self.columns.items():
+            column[row] = src.columns[key][src_row]
+        max_samples = src.max_samples[src_row]
+        score_cap = src.score_cap[src_row]
+        self._ensure_caps(max_samples, score_cap)
+        self.max_samples[row] = max_samples
+        self.score_cap[row] = score_cap
+        for ring, src_ring in zip(self._rings(), src._rings()):
+            cap = score_cap if ring is self.recent_scores else max_samples
+            ring.reset(row, cap, src_ring.values(src_row, cap))
+
+    def add_samples(self, rows: Iterable[int]) -> None:
+        """Append each row's current cpu, io and memory to its histories."""
+        col = self.columns
+        cpu, io, mem = col["cpu"], col["io_rate"], col["mem"]
+        caps = self.max_samples
+        samples, io_samples, mem_samples = self.samples, self.io_samples, self.mem_samples
+        for row in rows:
+            cap = caps[row]
+            samples.append(row, cap, cpu[row])
+            io_samples.append(row, cap, io[row])
+            mem_samples.append(row, cap, mem[row])
+
+    def score_changes(
+        self,
+        rows: Sequence[int],
+        cpu: Sequence[float] | None = None,
+        mem: Sequence[float] | None = None,
+        io: Sequence[float] | None = None,
+    ) -> list[bool]:
+        """Score metric drift for *rows* and fold it into their baselines.
+
+        *cpu*, *mem* and *io* hold the new reading per row and default to the
+        values already stored in the rows. Returns, per row, whether the
+        aggregated score reached ``ProcessEntry.change_score_threshold``.
+        """
+        col = self.columns
+        if cpu is None:
+            cpu = [col["cpu"][row] for row in rows]
+        if mem is None:
+            mem = [col["mem"][row] for row in rows]
+        if io is None:
+            io = [col["io_rate"][row] for row in rows]
+        cls = ProcessEntry
+        alpha = cls.change_alpha
+        keep = 1 - alpha
+        ratio = cls.change_ratio
+        std_mult = cls.change_std_mult
+        mad_mult = cls.change_mad_mult
+        decay = cls.change_decay
+        threshold = cls.change_score_threshold
+        cpu_floor = max(0.01, cls.cpu_threshold)
+        mem_floor = max(0.01, cls.mem_threshold)
+        io_floor = max(0.01, cls.io_threshold)
+        b_cpu, b_mem, b_io = col["baseline_cpu"], col["baseline_mem"], col["baseline_io"]
+        v_cpu, v_mem, v_io = (
+            col["baseline_cpu_var"],
+            col["baseline_mem_var"],
+            col["baseline_io_var"],
+        )
+        m_cpu, m_mem, m_io = (
+            col["baseline_cpu_mad"],
+            col["baseline_mem_mad"],
+            col["baseline_io_mad"],
+        )
+        last_score, score_sum = col["last_score"], col["score_sum"]
+        scores, caps = self.recent_scores, self.score_cap
+        changed: list[bool] = []
+        for row, c, m, i in zip(rows, cpu, mem, io):
+            cpu_thr = max(
+                cpu_floor,
+                b_cpu[row] * ratio,
+                v_cpu[row] ** 0.5 * std_mult,
+                m_cpu[row] * mad_mult,
+            )
+            mem_thr = max(
+                mem_floor,
+                b_mem[row] * ratio,
+                v_mem[row] ** 0.5 * std_mult,
+                m_mem[row] * mad_mult,
+            )
+            io_thr = max(
+                io_floor,
+                b_io[row] * ratio,
+                v_io[row] ** 0.5 * std_mult,
+                m_io[row] * mad_mult,
+            )
+            d_cpu = c - b_cpu[row]
+            d_mem = m - b_mem[row]
+            d_io = i - b_io[row]
+            score = abs(d_cpu) / cpu_thr + abs(d_mem) / mem_thr + abs(d_io) / io_thr
+            b_cpu[row] += alpha * d_cpu
+            v_cpu[row] = keep * v_cpu[row] + alpha * d_cpu * d_cpu
+            m_cpu[row] = keep * m_cpu[row] + alpha * abs(d_cpu)
+            b_mem[row] += alpha * d_mem
+            v_mem[row] = keep * v_mem[row] + alpha * d_mem * d_mem
+            m_mem[row] = keep * m_mem[row] + alpha * abs(d_mem)
+            b_io[row] += alpha * d_io
+            v_io[row] = keep * v_io[row] + alpha * d_io * d_io
+            m_io[row] = keep * m_io[row] + alpha * abs(d_io)
+            last_score[row] = score
+            scores.append(row, caps[row], score)
+            total = score_sum[row] * decay + score
+            score_sum[row] = total
+            changed.append(max(scores.total(row), total) >= threshold)
+        return changed
+
+    def compute_trends(
+        self,
+        rows: Iterable[int],
+        cpu_window: int,
+        mem_window: int,
+        io_window: int,
+        cpu_thresh: float,
+        mem_thresh: float,
+        io_thresh: float,
+    ) -> None:
+        """Update trending flags of *rows* from slope and EMA deviation."""
+        col = self.columns
+        alpha = ProcessEntry.ema_alpha
+        keep = 1 - alpha
+        ema_cpu, ema_mem, ema_io = col["ema_cpu"], col["ema_mem"], col["ema_io"]
+        t_cpu, t_mem, t_io = col["trending_cpu"], col["trending_mem"], col["trending_io"]
+        caps = self.max_samples
+        for row in rows:
+            cap = caps[row]
+            for ring, window, ema, flag, thresh in (
+                (self.samples, cpu_window, ema_cpu, t_cpu, cpu_thresh),
+                (self.mem_samples, mem_window, ema_mem, t_mem, mem_thresh),
+                (self.io_samples, io_window, ema_io, t_io, io_thresh),
+            ):
+                values = ring.values(row, cap)
+                if len(values) >= window:
+                    recent = values[-window:]
+                    slope = _slope(recent) * (len(recent) - 1)
+                else:
+                    slope = 0.0
+                if values:
+                    ema[row] = alpha * values[-1] + keep * ema[row]
+                    diff = values[-1] - ema[row]
+                else:
+                    diff = 0.0
+                flag[row] = max(slope, diff) >= thresh
+
+    def update_levels(
+        self,
+        rows: Iterable[int],
+        warn_cpu: float,
+        warn_mem: float,
+        warn_io: float,
+        crit_cpu: float,
+        crit_mem: float,
+    ) -> None:
+        """Classify *rows* as normal, warning or critical."""
+        col = self.columns
+        cpu, mem, io, level = col["cpu"], col["mem"], col["io_rate"], col["level"]
+        crit_io = warn_io * 2
+        for row in rows:
+            c, m, i = cpu[row], mem[row], io[row]
+            if c >= crit_cpu or m >= crit_mem or i >= crit_io:
+                level[row] = 2
+            elif c >= warn_cpu or m >= warn_mem or i >= warn_io:
+                level[row] = 1
+            else:
+                level[row] = 0
+
+
+class _Field:
+    """Descriptor exposing one :class:`ProcessTable` column on a view."""
+
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: ProcessEntry | None, owner: type | None = None) -> Any:
+        if obj is None:
+            return self
+        return obj._table.columns[self.name][obj._row]
+
+    def __set__(self, obj: ProcessEntry, value: Any) -> None:
+        obj._table.columns[self.name][obj._row] = value
+
+
+class _Flag(_Field):
+    __slots__ = ()
+
+    def __get__(self, obj: ProcessEntry | None, owner: type | None = None) -> Any:
+        if obj is None:
+            return self
+        return bool(obj._table.columns[self.name][obj._row])
+
+    def __set__(self, obj: ProcessEntry, value: Any) -> None:
+        obj._table.columns[self.name][obj._row] = 1 if value else 0
+
+
+class _Level(_Field):
+    __slots__ = ()
+
+    def __get__(self, obj: ProcessEntry | None, owner: type | None = None) -> Any:
+        if obj is None:
+            return self
+        return LEVELS[obj._table.columns["level"][obj._row]]
+
+    def __set__(self, obj: ProcessEntry, value: str) -> None:
+        obj._table.columns["level"][obj._row] = _LEVEL_CODES[value]
+
+
 class ProcessEntry:
-    """Snapshot of a running process."""
-
-    pid: int
-    name: str
-    cpu: float
-    mem: float
-    user: str
-    start: float
-    status: str
-    cpu_time: float
-    threads: int
-    read_bytes: int
-    write_bytes: int
-    files: int
-    conns: int
-    io_rate: float = 0.0
-    samples: deque[float] = field(default_factory=deque)
-    io_samples: deque[float] = field(default_factory=deque)
-    mem_samples: deque[float] = field(default_factory=deque)
-    max_samples: int = 5
-    delta_cpu: float = 0.0
-    delta_mem: float = 0.0
-    delta_io: float = 0.0
-    ema_cpu: float = 0.0
-    ema_mem: float = 0.0
-    ema_io: float = 0.0
-    baseline_cpu: float = 0.0
-    baseline_mem: float = 0.0
-    baseline_io: float = 0.0
-    baseline_cpu_var: float = 0.0
-    baseline_mem_var: float = 0.0
-    baseline_io_var: float = 0.0
-    baseline_cpu_mad: float = 0.0
-    baseline_mem_mad: float = 0.0
-    baseline_io_mad: float = 0.0
-    level: str = "normal"
-    changed: bool = False
-    trending_cpu: bool = False
-    trending_mem: bool = False
-    trending_io: bool = False
-    stable: bool = False
-    normal: bool = False
-    recent_scores: deque[float] = field(default_factory=deque)
-    last_score: float = 0.0
-    score_sum: float = 0.0
+    """Snapshot of a running process.
+
+    An entry is a thin view over one row of a :class:`ProcessTable`; reading
+    or assigning a field goes straight to the table's column. Constructing an
+    entry directly allocates a private one-row table, which
+    :meth:`ProcessTable.adopt` can later move into a shared one.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    pid = _Field()
+    name = _Field()
+    cpu = _Field()
+    mem = _Field()
+    user = _Field()
+    start = _Field()
+    status = _Field()
+    cpu_time = _Field()
+    threads = _Field()
+    read_bytes = _Field()
+    write_bytes = _Field()
+    files = _Field()
+    conns = _Field()
+    io_rate = _Field()
+    delta_cpu = _Field()
+    delta_mem = _Field()
+    delta_io = _Field()
+    ema_cpu = _Field()
+    ema_mem = _Field()
+    ema_io = _Field()
+    baseline_cpu = _Field()
+    baseline_mem = _Field()
+    baseline_io = _Field()
+    baseline_cpu_var = _Field()
+    baseline_mem_var = _Field()
+    baseline_io_var = _Field()
+    baseline_cpu_mad = _Field()
+    baseline_mem_mad = _Field()
+    baseline_io_mad = _Field()
+    last_score = _Field()
+    score_sum = _Field()
+    level = _Level()
+    changed = _Flag()
+    trending_cpu = _Flag()
+    trending_mem = _Flag()
+    trending_io = _Flag()
+    stable = _Flag()
+    normal = _Flag()
+
     change_score_threshold: ClassVar[float] = CHANGE_SCORE_THRESHOLD
     change_agg_window: ClassVar[int] = CHANGE_AGG_WINDOW
     change_alpha: ClassVar[float] = CHANGE_ALPHA
@@ -259,25 +843,87 @@ class ProcessEntry:
     io_threshold: ClassVar[float] = CHANGE_IO_THRESHOLD
     ema_alpha: ClassVar[float] = 0.3
 
-    def __post_init__(self) -> None:
-        self.samples = deque(self.samples, maxlen=self.max_samples)
-        self.io_samples = deque(self.io_samples, maxlen=self.max_samples)
-        self.mem_samples = deque(self.mem_samples, maxlen=self.max_samples)
-        self.recent_scores = deque(self.recent_scores, maxlen=self.change_agg_window)
-        self.last_score = 0.0
-        self.score_sum = 0.0
-        self.ema_cpu = self.cpu
-        self.ema_mem = self.mem
-        self.ema_io = self.io_rate
-        self.baseline_cpu = self.cpu
-        self.baseline_mem = self.mem
-        self.baseline_io = self.io_rate
-        self.baseline_cpu_var = 0.0
-        self.baseline_mem_var = 0.0
-        self.baseline_io_var = 0.0
-        self.baseline_cpu_mad = 0.0
-        self.baseline_mem_mad = 0.0
-        self.baseline_io_mad = 0.0
+    def __init__(
+        self,
+        pid: int,
+        name: str,
+        cpu: float,
+        mem: float,
+        user: str,
+        start: float,
+        status: str,
+        cpu_time: float,
+        threads: int,
+        read_bytes: int,
+        write_bytes: int,
+        files: int,
+        conns: int,
+        io_rate: float = 0.0,
+        samples: Iterable[float] = (),
+        io_samples: Iterable[float] = (),
+        mem_samples: Iterable[float] = (),
+        max_samples: int = 5,
+        delta_cpu: float = 0.0,
+        delta_mem: float = 0.0,
+        delta_io: float = 0.0,
+        level: str = "normal",
+        changed: bool = False,
+        trending_cpu: bool = False,
+        trending_mem: bool = False,
+        trending_io: bool = False,
+        stable: bool = False,
+        normal: bool = False,
+        recent_scores: Iterable[float] = (),
+    ) -> None:
+        table = ProcessTable(1, max_samples, max(1, self.change_agg_window))
+        view = table.add(
+            pid,
+            name,
+            cpu,
+            mem,
+            user,
+            start,
+            status,
+            cpu_time,
+            threads,
+            read_bytes,
+            write_bytes,
+            files,
+            conns,
+            io_rate,
+            samples=samples,
+            io_samples=io_samples,
+            mem_samples=mem_samples,
+            recent_scores=recent_scores,
+            max_samples=max_samples,
+        )
+        self._table = table
+        self._row = view._row
+        table._views[self._row] = self
+        self.delta_cpu = delta_cpu
+        self.delta_mem = delta_mem
+        self.delta_io = delta_io
+        self.level = level
+        self.changed = changed
+        self.trending_cpu = trending_cpu
+        self.trending_mem = trending_mem
+        self.trending_io = trending_io
+        self.stable = stable
+        self.normal = normal
+
+    @classmethod
+    def _view(cls, table: ProcessTable, row: int) -> "ProcessEntry":
+        view = cls.__new__(cls)
+        view._table = table
+        view._row = row
+        return view
+
+    def __repr__(self) -> str:
+        return (
+            f"ProcessEntry(pid={self.pid}, name={self.name!r}, cpu={self.cpu}, "
+            f"mem={self.mem}, user={self.user!r}, status={self.status!r}, "
+            f"level={self.level!r})"
+        )
 
     def __lt__(self, other: "ProcessEntry") -> bool:
         """Order entries by average CPU then memory then PID."""
@@ -293,22 +939,48 @@ class ProcessEntry:
             other.pid,
         )
 
+    @property
+    def max_samples(self) -> int:
+        return self._table.max_samples[self._row]
+
+    @property
+    def samples(self) -> RingView:
+        return RingView(self._table, "samples", self._row, self._table.max_samples)
+
+    @property
+    def io_samples(self) -> RingView:
+        return RingView(self._table, "io_samples", self._row, self._table.max_samples)
+
+    @property
+    def mem_samples(self) -> RingView:
+        return RingView(self._table, "mem_samples", self._row, self._table.max_samples)
+
+    @property
+    def recent_scores(self) -> RingView:
+        return RingView(self._table, "recent_scores", self._row, self._table.score_cap)
+
     def add_sample(self, cpu: float, io: float, mem: float) -> None:
-        self.samples.append(cpu)
-        self.io_samples.append(io)
-        self.mem_samples.append(mem)
+        table, row = self._table, self._row
+        cap = table.max_samples[row]
+        table.samples.append(row, cap, cpu)
+        table.io_samples.append(row, cap, io)
+        table.mem_samples.append(row, cap, mem)
 
     @property
     def avg_cpu(self) -> float:
-        if not self.samples:
+        table, row = self._table, self._row
+        count = table.samples.count[row]
+        if not count:
             return self.cpu
-        return sum(self.samples) / len(self.samples)
+        return table.samples.total(row) / count
 
     @property
     def avg_io(self) -> float:
-        if not self.io_samples:
+        table, row = self._table, self._row
+        count = table.io_samples.count[row]
+        if not count:
             return self.io_rate
-        return sum(self.io_samples) / len(self.io_samples)
+        return table.io_samples.total(row) / count
 
     def compute_trends(
         self,
@@ -320,120 +992,21 @@ class ProcessEntry:
         io_thresh: float,
     ) -> None:
         """Update trending flags using slope and exponential moving average."""
-
-        def slope(values: list[float]) -> float:
-            n = len(values)
-            if n < 2:
-                return 0.0
-            sum_x = n * (n - 1) / 2
-            sum_x2 = (n - 1) * n * (2 * n - 1) / 6
-            sum_y = sum(values)
-            sum_xy = sum(i * v for i, v in enumerate(values))
-            denom = n * sum_x2 - sum_x * sum_x
-            if denom == 0:
-                return 0.0
-            return (n * sum_xy - sum_x * sum_y) / denom
-
-        if len(self.samples) >= cpu_window:
-            recent = list(self.samples)[-cpu_window:]
-            cpu_slope = slope(recent) * (len(recent) - 1)
-        else:
-            cpu_slope = 0.0
-        if len(self.mem_samples) >= mem_window:
-            recent_m = list(self.mem_samples)[-mem_window:]
-            mem_slope = slope(recent_m) * (len(recent_m) - 1)
-        else:
-            mem_slope = 0.0
-        if len(self.io_samples) >= io_window:
-            recent_io = list(self.io_samples)[-io_window:]
-            io_slope = slope(recent_io) * (len(recent_io) - 1)
-        else:
-            io_slope = 0.0
-
-        if self.samples:
-            self.ema_cpu = self.ema_alpha * self.samples[-1] + (1 - self.ema_alpha) * self.ema_cpu
-            cpu_diff = self.samples[-1] - self.ema_cpu
-        else:
-            cpu_diff = 0.0
-        if self.mem_samples:
-            self.ema_mem = self.ema_alpha * self.mem_samples[-1] + (1 - self.ema_alpha) * self.ema_mem
-            mem_diff = self.mem_samples[-1] - self.ema_mem
-        else:
-            mem_diff = 0.0
-        if self.io_samples:
-            self.ema_io = self.ema_alpha * self.io_samples[-1] + (1 - self.ema_alpha) * self.ema_io
-            io_diff = self.io_samples[-1] - self.ema_io
-        else:
-            io_diff = 0.0
-
-        self.trending_cpu = max(cpu_slope, cpu_diff) >= cpu_thresh
-        self.trending_mem = max(mem_slope, mem_diff) >= mem_thresh
-        self.trending_io = max(io_slope, io_diff) >= io_thresh
-
-    def _change_score(self, other: "ProcessEntry") -> float:
-        cpu_std = self.baseline_cpu_var ** 0.5
-        mem_std = self.baseline_mem_var ** 0.5
-        io_std = self.baseline_io_var ** 0.5
-        cpu_mad = self.baseline_cpu_mad
-        mem_mad = self.baseline_mem_mad
-        io_mad = self.baseline_io_mad
-        cpu_thr = max(
-            0.01,
-            self.cpu_threshold,
-            self.baseline_cpu * self.change_ratio,
-            cpu_std * self.change_std_mult,
-            cpu_mad * self.change_mad_mult,
-        )
-        mem_thr = max(
-            0.01,
-            self.mem_threshold,
-            self.baseline_mem * self.change_ratio,
-            mem_std * self.change_std_mult,
-            mem_mad * self.change_mad_mult,
-        )
-        io_thr = max(
-            0.01,
-            self.io_threshold,
-            self.baseline_io * self.change_ratio,
-            io_std * self.change_std_mult,
-            io_mad * self.change_mad_mult,
-        )
-        score = (
-            abs(other.cpu - self.baseline_cpu) / cpu_thr
-            + abs(other.mem - self.baseline_mem) / mem_thr
-            + abs(other.io_rate - self.baseline_io) / io_thr
-        )
-        self._update_baseline(other)
-        self.last_score = score
-        return score
-
-    def _update_baseline(self, other: "ProcessEntry") -> None:
-        alpha = self.change_alpha
-        diff = other.cpu - self.baseline_cpu
-        self.baseline_cpu += alpha * diff
-        self.baseline_cpu_var = (
-            (1 - alpha) * self.baseline_cpu_var + alpha * diff * diff
-        )
-        self.baseline_cpu_mad = (
-            (1 - alpha) * self.baseline_cpu_mad + alpha * abs(diff)
-        )
-        diff = other.mem - self.baseline_mem
-        self.baseline_mem += alpha * diff
-        self.baseline_mem_var = (
-            (1 - alpha) * self.baseline_mem_var + alpha * diff * diff
-        )
-        self.baseline_mem_mad = (
-            (1 - alpha) * self.baseline_mem_mad + alpha * abs(diff)
-        )
-        diff = other.io_rate - self.baseline_io
-        self.baseline_io += alpha * diff
-        self.baseline_io_var = (
-            (1 - alpha) * self.baseline_io_var + alpha * diff * diff
-        )
-        self.baseline_io_mad = (
-            (1 - alpha) * self.baseline_io_mad + alpha * abs(diff)
+        self._table.compute_trends(
+            (self._row,),
+            cpu_window,
+            mem_window,
+            io_window,
+            cpu_thresh,
+            mem_thresh,
+            io_thresh,
         )
 
+    def _score_against(self, other: "ProcessEntry") -> bool:
+        return self._table.score_changes(
+            (self._row,), (other.cpu,), (other.mem,), (other.io_rate,)
+        )[0]
+
     def changed_since(self, other: "ProcessEntry") -> bool:
         if any(
             [
@@ -446,11 +1019,7 @@ class ProcessEntry:
             ]
         ):
             return True
-        score = self._change_score(other)
-        self.recent_scores.append(score)
-        self.score_sum = self.score_sum * self.change_decay + score
-        total = sum(self.recent_scores)
-        return max(total, self.score_sum) >= self.change_score_threshold
+        return self._score_against(other)
 
     def changed_basic(self, other: "ProcessEntry") -> bool:
         """Return True if basic metrics changed since ``other``."""
@@ -463,11 +1032,7 @@ class ProcessEntry:
             ]
         ):
             return True
-        score = self._change_score(other)
-        self.recent_scores.append(score)
-        self.score_sum = self.score_sum * self.change_decay + score
-        total = sum(self.recent_scores)
-        return max(total, self.score_sum) >= self.change_score_threshold
+        return self._score_against(other)
 
     def update_level(
         self,
@@ -478,20 +1043,9 @@ class ProcessEntry:
         crit_mem: float,
     ) -> None:
         """Classify the entry as normal, warning or critical."""
-        if (
-            self.cpu >= crit_cpu
-            or self.mem >= crit_mem
-            or self.io_rate >= warn_io * 2
-        ):
-            self.level = "critical"
-        elif (
-            self.cpu >= warn_cpu
-            or self.mem >= warn_mem
-            or self.io_rate >= warn_io
-        ):
-            self.level = "warning"
-        else:
-            self.level = "normal"
+        self._table.update_levels(
+            (self._row,), warn_cpu, warn_mem, warn_io, crit_cpu, crit_mem
+        )
 
 
 class ProcessWatcher(threading.Thread):
@@ -509,7 +1063,9 @@ class ProcessWatcher(threading.Thread):
     expensive details every ``stable_skip`` cycles, further reducing overhead.
     ``ratio_window`` controls how many recent change ratios are averaged when
     tuning refresh intervals, smoothing out brief spikes. Processes owned by
-    any usernames in ``exclude_users`` are skipped entirely.
+    any usernames in ``exclude_users`` are skipped entirely. Entries are views
+    over rows of one shared :class:`ProcessTable`; rows are released (and the
+    views detached) when their process disappears.
 
     Parameters
     ----------
@@ -616,8 +1172,16 @@ class ProcessWatcher(threading.Thread):
         max_batch_size: int = MAX_BATCH_SIZE,
         min_interval: float = MIN_INTERVAL,
         max_interval: float = MAX_INTERVAL,
+        sampler: str = PROC_SAMPLER,
     ) -> None:
         super().__init__(daemon=True)
+        if sampler not in {"auto", "procfs", "psutil"}:
+            raise ValueError(f"Unknown process sampler: {sampler}")
+        if sampler == "procfs" and not ProcSampler.available():
+            raise RuntimeError("procfs sampler requires Linux /proc")
+        self._sampler = (
+            ProcSampler() if sampler != "psutil" and ProcSampler.available() else None
+        )
         self.queue = queue
         self.min_interval = max(0.1, float(min_interval))
         self.max_interval = max(self.min_interval, float(max_interval))
@@ -655,6 +1219,7 @@ class ProcessWatcher(threading.Thread):
         self._executor = ThreadPoolExecutor(max_workers=workers)
         self._cpu_count = psutil.cpu_count(logical=True) or (os.cpu_count() or 1)
         self.sample_size = max(1, sample_size)
+        self._table = ProcessTable(sample_width=self.sample_size)
         self.process_count = 0
         self._last_detail_count = 0
         self._stable_cycles = max(1, int(stable_cycles))
@@ -1155,8 +1720,23 @@ class ProcessWatcher(threading.Thread):
                 results[pid] = val
         return results
 
-    def _next_batch(self, attrs: list[str]) -> tuple[list[ProcessType], bool]:
+    def _next_batch(
+        self, attrs: list[str]
+    ) -> tuple[list[ProcessType] | list[ProcSample], bool]:
         """Return the next batch of processes and whether a full cycle ended."""
+        if self._sampler is not None:
+            if self._proc_iter is None:
+                self._proc_pids = self._sampler.pids()
+                self.process_count = len(self._proc_pids)
+                self._new_pids = set(self._proc_pids)
+                self._proc_iter = iter(self._proc_pids)
+                self._processed_batches = 0
+                self._total_batches = max(1, math.ceil(self.process_count / self.batch_size))
+            batch = list(itertools.islice(self._proc_iter, self.batch_size))
+            cycle_end = len(batch) < self.batch_size
+            if cycle_end:
+                self._proc_iter = None
+            return self._sampler.records(batch), cycle_end
         if self._proc_iter is None:
             self._proc_pids = psutil.pids()
             self.process_count = len(self._proc_pids)
@@ -1175,6 +1755,49 @@ class ProcessWatcher(threading.Thread):
             cycle_end = True
         return procs, cycle_end
 
+    def _basic_info(
+        self, proc: ProcessType | ProcSample
+    ) -> tuple[int, str, str, int, float, str, int, int, int] | None:
+        """Return ``(pid, name, user, rss, start, status, threads, read, write)``.
+
+        Returns ``None`` when the process vanished or cannot be inspected.
+        """
+
+        if isinstance(proc, ProcSample):
+            return (
+                proc.pid,
+                proc.name,
+                proc.username,
+                proc.rss,
+                proc.create_time,
+                proc.status,
+                proc.num_threads,
+                proc.read_bytes,
+                proc.write_bytes,
+            )
+        try:
+            with proc.oneshot():
+                info = proc.info
+                io = info.get("io_counters")
+                if io:
+                    read_bytes = io.read_bytes
+                    write_bytes = io.write_bytes
+                else:
+                    read_bytes = write_bytes = 0
+                return (
+                    info["pid"],
+                    info.get("name", ""),
+                    info.get("username") or "",
+                    info["memory_info"].rss,
+                    info.get("create_time", 0.0),
+                    info.get("status", ""),
+                    info.get("num_threads", 0),
+                    read_bytes,
+                    write_bytes,
+                )
+        except (psutil.NoSuchProcess, psutil.AccessDenied, KeyError, AttributeError):
+            return None
+
     def _maybe_sample_cpu(
         self,
         proc: SampledProcess,
@@ -1316,9 +1939,11 @@ class ProcessWatcher(threading.Thread):
             if hasattr(psutil.Process(), "io_counters"):
                 basic_attrs.append("io_counters")
 
+            table = self._table
             proc_data: dict[int, tuple[
-                ProcessType,
+                ProcessType | ProcSample,
                 ProcessEntry | None,
+                ProcessEntry,
                 float,
                 int,
                 int,
@@ -1333,38 +1958,58 @@ class ProcessWatcher(threading.Thread):
             procs, cycle_end = self._next_batch(basic_attrs)
             self._processed_batches += 1
             for proc in procs:
-                try:
-                    with proc.oneshot():
-                        pid = proc.info["pid"]
-                        name = proc.info.get("name", "")
-                        user = proc.info.get("username") or ""
-                        if self.hide_system and user.lower() in {"root", "system", "localsystem"}:
-                            continue
-                        if user.lower() in self.exclude_users:
-                            continue
-                        if self._should_ignore_process(name):
-                            continue
-                        mem = proc.info["memory_info"].rss / (1024 * 1024)
-                        start = proc.info.get("create_time", 0.0)
-                        if self.ignore_age and time.time() - start < self.ignore_age:
-                            continue
-                        status = proc.info.get("status", "")
-                        threads = proc.info.get("num_threads", 0)
-                        io = proc.info.get("io_counters")
-                        if io:
-                            read_bytes = io.read_bytes
-                            write_bytes = io.write_bytes
-                        else:
-                            read_bytes = write_bytes = 0
-                except (psutil.NoSuchProcess, psutil.AccessDenied, KeyError):
+                basic = self._basic_info(proc)
+                if basic is None:
                     continue
+                (
+                    pid,
+                    name,
+                    user,
+                    rss,
+                    start,
+                    status,
+                    threads,
+                    read_bytes,
+                    write_bytes,
+                ) = basic
+                if self.hide_system and user.lower() in {"root", "system", "localsystem"}:
+                    continue
+                if user.lower() in self.exclude_users:
+                    continue
+                if self._should_ignore_process(name):
+                    continue
+                if self.ignore_age and time.time() - start < self.ignore_age:
+                    continue
+                mem = rss / (1024 * 1024)
 
                 prev = self._snapshot.get(pid)
                 if not self._should_skip_cpu(pid, proc, prev, now):
                     sample_pids.add(pid)
+                # Rows are allocated here on the monitor thread; the pool
+                # workers in ``collect`` only write into their own row.
+                if prev is None:
+                    entry = table.add(
+                        pid,
+                        name,
+                        0.0,
+                        round(mem, 1),
+                        user,
+                        start,
+                        status,
+                        0.0,
+                        threads,
+                        read_bytes,
+                        write_bytes,
+                        0,
+                        0,
+                        max_samples=self.sample_size,
+                    )
+                else:
+                    entry = table.adopt(prev)
                 proc_data[pid] = (
                     proc,
                     prev,
+                    entry,
                     mem,
                     read_bytes,
                     write_bytes,
@@ -1376,13 +2021,19 @@ class ProcessWatcher(threading.Thread):
                 )
 
             cpu_map: dict[int, float] = {}
-            if len(sample_pids) >= self.bulk_cpu_threshold:
+            if self._sampler is not None:
+                # The sweep already read every CPU time from /proc.
+                cpu_map = {
+                    p.pid: p.cpu_time for p in procs if isinstance(p, ProcSample)
+                }
+            elif len(sample_pids) >= self.bulk_cpu_threshold:
                 cpu_map = self._scan_proc_stat(sample_pids)
 
             def collect(
                 data: tuple[
-                    ProcessType,
+                    ProcessType | ProcSample,
                     ProcessEntry | None,
+                    ProcessEntry,
                     float,
                     int,
                     int,
@@ -1392,11 +2043,17 @@ class ProcessWatcher(threading.Thread):
                     str,
                     int,
                 ]
-            ) -> tuple[ProcessEntry, bool, bool] | None:
-                """Return updated entry, change flag and per-entry trending flag."""
+            ) -> tuple[ProcessEntry, bool | None, bool] | None:
+                """Write fresh metrics into the entry's row.
+
+                Returns the entry, whether its identity fields changed
+                (``None`` for a new process) and whether it may count
+                towards the cycle's trending total.
+                """
                 (
                     proc,
                     prev,
+                    entry,
                     mem,
                     read_bytes,
                     write_bytes,
@@ -1407,7 +2064,6 @@ class ProcessWatcher(threading.Thread):
                     threads,
                 ) = data
                 pid = proc.pid
-                trending_flag = False
                 try:
                     cpu_time, cpu, io_rate = self._maybe_sample_cpu(
                         proc,
@@ -1421,174 +2077,96 @@ class ProcessWatcher(threading.Thread):
                 except (psutil.Error, ProcessLookupError, AttributeError):
                     return None
 
-                if prev is not None and cpu_time == prev.cpu_time and cpu == prev.cpu:
-                    changed = prev.changed_basic(
-                        ProcessEntry(
-                            pid=pid,
-                            name=name,
-                            cpu=prev.cpu,
-                            mem=round(mem, 1),
-                            user=user,
-                            start=start,
-                            status=status,
-                            cpu_time=prev.cpu_time,
-                            threads=threads,
-                            read_bytes=read_bytes,
-                            write_bytes=write_bytes,
-                            files=prev.files,
-                            conns=prev.conns,
-                            io_rate=prev.io_rate,
-                            samples=deque(prev.samples),
-                            io_samples=deque(prev.io_samples),
-                            max_samples=self.sample_size,
-                        )
-                    )
-                    delta_mem = round(mem - prev.mem, 1)
-                    prev.mem = round(mem, 1)
-                    prev.user = user
-                    prev.start = start
-                    prev.status = status
-                    prev.cpu_time = cpu_time
-                    prev.threads = threads
-                    prev.read_bytes = read_bytes
-                    prev.write_bytes = write_bytes
-                    prev.delta_cpu = 0.0
-                    prev.delta_mem = delta_mem
-                    prev.delta_io = 0.0
-                    prev.changed = changed
-                    prev.add_sample(prev.cpu, prev.io_rate, prev.mem)
-                    prev.compute_trends(
-                        self._trend_window,
-                        self._trend_window,
-                        self._trend_io_window,
-                        self._trend_cpu,
-                        self._trend_mem,
-                        self._trend_io,
-                    )
-                    prev.update_level(
-                        self.warn_cpu,
-                        self.warn_mem,
-                        self.warn_io,
-                        self.cpu_alert,
-                        self.mem_alert,
-                    )
-                    return prev, changed, trending_flag
+                if prev is None:
+                    entry.cpu_time = cpu_time
+                    entry.add_sample(entry.cpu, entry.io_rate, entry.mem)
+                    return entry, None, True
 
-                if prev is not None:
-                    self._cpu_skip_counts[pid] = 0
-                    changed = prev.changed_basic(
-                        ProcessEntry(
-                            pid=pid,
-                            name=name,
-                            cpu=round(cpu, 1),
-                            mem=round(mem, 1),
-                            user=user,
-                            start=start,
-                            status=status,
-                            cpu_time=cpu_time,
-                            threads=threads,
-                            read_bytes=read_bytes,
-                            write_bytes=write_bytes,
-                            files=prev.files,
-                            conns=prev.conns,
-                            io_rate=round(io_rate, 1),
-                            samples=deque(prev.samples),
-                            io_samples=deque(prev.io_samples),
-                            max_samples=self.sample_size,
-                        )
-                    )
-                    delta_cpu = round(cpu - prev.cpu, 1)
-                    delta_mem = round(mem - prev.mem, 1)
-                    delta_io = round(io_rate - prev.io_rate, 1)
-                    prev.cpu = round(cpu, 1)
-                    prev.mem = round(mem, 1)
-                    prev.user = user
-                    prev.start = start
-                    prev.status = status
-                    prev.cpu_time = cpu_time
-                    prev.threads = threads
-                    prev.read_bytes = read_bytes
-                    prev.write_bytes = write_bytes
-                    prev.io_rate = round(io_rate, 1)
-                    prev.delta_cpu = delta_cpu
-                    prev.delta_mem = delta_mem
-                    prev.delta_io = delta_io
-                    prev.changed = changed
-                    prev.add_sample(prev.cpu, prev.io_rate, prev.mem)
-                    prev.compute_trends(
-                        self._trend_window,
-                        self._trend_window,
-                        self._trend_io_window,
-                        self._trend_cpu,
-                        self._trend_mem,
-                        self._trend_io,
-                    )
-                    prev.update_level(
-                        self.warn_cpu,
-                        self.warn_mem,
-                        self.warn_io,
-                        self.cpu_alert,
-                        self.mem_alert,
-                    )
-                    if (
-                        prev.trending_cpu
-                        or prev.trending_mem
-                        or prev.trending_io
-                    ):
-                        trending_flag = True
-                    return prev, changed, trending_flag
-
-                entry = ProcessEntry(
-                    pid=pid,
-                    name=name,
-                    cpu=0.0,
-                    mem=round(mem, 1),
-                    user=user,
-                    start=start,
-                    status=status,
-                    cpu_time=cpu_time,
-                    threads=threads,
-                    read_bytes=read_bytes,
-                    write_bytes=write_bytes,
-                    files=0,
-                    conns=0,
-                    io_rate=0.0,
-                    samples=deque(),
-                    io_samples=deque(),
-                    max_samples=self.sample_size,
+                basic_changed = (
+                    name != entry.name
+                    or user != entry.user
+                    or status != entry.status
+                    or threads != entry.threads
                 )
+                sampled = not (cpu_time == entry.cpu_time and cpu == entry.cpu)
+                if sampled:
+                    self._cpu_skip_counts[pid] = 0
+                    entry.delta_cpu = round(cpu - entry.cpu, 1)
+                    entry.delta_io = round(io_rate - entry.io_rate, 1)
+                    entry.cpu = round(cpu, 1)
+                    entry.io_rate = round(io_rate, 1)
+                else:
+                    entry.delta_cpu = 0.0
+                    entry.delta_io = 0.0
+                entry.delta_mem = round(mem - entry.mem, 1)
+                entry.mem = round(mem, 1)
+                entry.user = user
+                entry.start = start
+                entry.status = status
+                entry.cpu_time = cpu_time
+                entry.threads = threads
+                entry.read_bytes = read_bytes
+                entry.write_bytes = write_bytes
                 entry.add_sample(entry.cpu, entry.io_rate, entry.mem)
-                entry.compute_trends(
-                    self._trend_window,
-                    self._trend_window,
-                    self._trend_io_window,
-                    self._trend_cpu,
-                    self._trend_mem,
-                    self._trend_io,
-                )
-                entry.update_level(
-                    self.warn_cpu,
-                    self.warn_mem,
-                    self.warn_io,
-                    self.cpu_alert,
-                    self.mem_alert,
-                )
-                if entry.trending_cpu or entry.trending_mem or entry.trending_io:
-                    trending_flag = True
-                entry.changed = True
-                self._normal_counts[pid] = 0
-                return entry, True, trending_flag
+                return entry, basic_changed, sampled
 
             heap: list[tuple[tuple[float, float, int], ProcessEntry, bool]] = []
             entries: list[tuple[ProcessEntry, bool]] = []
             detail_candidates: list[ProcessEntry] = []
             now_ts = time.monotonic()
 
-            for result in self._executor.map(collect, proc_data.values()):
-                if not result:
-                    continue
-                entry, changed_flag, trending_flag = result
-                if trending_flag:
+            results: list[tuple[ProcessEntry, bool | None, bool]] = []
+            for data, result in zip(
+                proc_data.values(), self._executor.map(collect, proc_data.values())
+            ):
+                if result:
+                    results.append(result)
+                elif data[1] is None:
+                    table.release(data[2].pid, detach=False)
+
+            # Score, trend and classify the whole batch in column sweeps.
+            rows = [entry._row for entry, _basic, _count in results]
+            score_rows = [
+                entry._row for entry, basic_changed, _count in results
+                if basic_changed is False
+            ]
+            scored = dict(zip(score_rows, table.score_changes(score_rows)))
+            table.compute_trends(
+                rows,
+                self._trend_window,
+                self._trend_window,
+                self._trend_io_window,
+                self._trend_cpu,
+                self._trend_mem,
+                self._trend_io,
+            )
+            table.update_levels(
+                rows,
+                self.warn_cpu,
+                self.warn_mem,
+                self.warn_io,
+                self.cpu_alert,
+                self.mem_alert,
+            )
+            trending_col = (
+                table.columns["trending_cpu"],
+                table.columns["trending_mem"],
+                table.columns["trending_io"],
+            )
+            changed_col = table.columns["changed"]
+            fresh: list[ProcessEntry] = []
+            for entry, basic_changed, counts in results:
+                row = entry._row
+                if basic_changed is None:
+                    fresh.append(entry)
+                    self._normal_counts[entry.pid] = 0
+                    changed_flag = True
+                elif basic_changed:
+                    changed_flag = True
+                else:
+                    changed_flag = scored[row]
+                changed_col[row] = changed_flag
+                if counts and any(col[row] for col in trending_col):
                     trending += 1
                 if self.limit:
                     score = (entry.avg_cpu, entry.mem, entry.pid)
@@ -1643,6 +2221,9 @@ class ProcessWatcher(threading.Thread):
                 ) and not skip_stable:
                     detail_candidates.append(entry)
                 self._snapshot[entry.pid] = entry
+            for entry in fresh:
+                if self._snapshot.get(entry.pid) is not entry:
+                    table.release(entry.pid, detach=False)
             if not self.limit:
                 entries.sort(key=lambda ec: (ec[0].cpu, ec[0].mem), reverse=True)
 
@@ -1815,6 +2396,7 @@ class ProcessWatcher(threading.Thread):
                     self.queue.put_nowait((updates, removed, progress))
                 for pid in removed:
                     self._snapshot.pop(pid, None)
+                    self._table.release(pid)
                     self._detail_ts.pop(pid, None)
                     self._conn_cache.pop(pid, None)
                     self._file_cache.pop(pid, None)
@@ -2029,6 +2611,7 @@ class ProcessWatcher(threading.Thread):
 
 __all__ = [
     "ProcessEntry",
+    "ProcessTable",
     "ProcessWatcher",
     "MovingAverage",
 ]
@@ -0,0 +1,371 @@
+"""Batch process sampling straight from Linux ``/proc``.
+
+:class:`ProcSampler` reads ``/proc/<pid>/stat``, ``statm`` and ``io`` into a
+reused buffer and stores the parsed values in preallocated arrays, avoiding
+the per-process :class:`psutil.Process` objects, ``oneshot`` caches and
+``info`` dictionaries of :func:`psutil.process_iter`. Identity fields (name
+and owner) only change across ``exec``/``setuid``, so they are cached per PID
+and re-read from ``status`` and ``cmdline`` only when the stat start time or
+command name differs from the cached copy.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from array import array
+from collections import namedtuple
+from collections.abc import Iterable
+
+try:
+    import pwd
+except ImportError:  # pragma: no cover - Windows
+    pwd = None  # type: ignore[assignment]
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - runtime dependency check
+    from coolbox.ensure_deps import ensure_psutil
+
+    psutil = ensure_psutil()
+
+__all__ = ["ProcSample", "ProcSampler", "benchmark_samplers"]
+
+_MemInfo = namedtuple("_MemInfo", "rss")
+_IoCounters = namedtuple("_IoCounters", "read_bytes write_bytes")
+
+# psutil's status strings for the ``state`` field of ``/proc/<pid>/stat``.
+_STATUS = {
+    "R": psutil.STATUS_RUNNING,
+    "S": psutil.STATUS_SLEEPING,
+    "D": psutil.STATUS_DISK_SLEEP,
+    "T": psutil.STATUS_STOPPED,
+    "t": psutil.STATUS_TRACING_STOP,
+    "Z": psutil.STATUS_ZOMBIE,
+    "X": psutil.STATUS_DEAD,
+    "x": psutil.STATUS_DEAD,
+    "K": getattr(psutil, "STATUS_WAKE_KILL", "wake-kill"),
+    "W": getattr(psutil, "STATUS_WAKING", "waking"),
+    "I": getattr(psutil, "STATUS_IDLE", "idle"),
+    "P": getattr(psutil, "STATUS_PARKED", "parked"),
+}
+# Field offsets after the ``(comm)`` entry of ``/proc/<pid>/stat``.
+_STATE, _UTIME, _STIME, _THREADS, _STARTTIME = 0, 11, 12, 17, 19
+# The kernel truncates ``comm`` to 15 characters.
+_COMM_LEN = 15
+_BUF_SIZE = 4096
+
+
+class ProcSample:
+    """One process as read by :class:`ProcSampler`.
+
+    Implements the small psutil surface :class:`ProcessWatcher` needs
+    (``pid``, ``cpu_times``, ``memory_info``, ``io_counters``) from values
+    captured during the sweep, so no further syscalls are made.
+    """
+
+    __slots__ = (
+        "pid",
+        "name",
+        "username",
+        "create_time",
+        "status",
+        "num_threads",
+        "cpu_time",
+        "rss",
+        "read_bytes",
+        "write_bytes",
+    )
+
+    def __init__(
+        self,
+        pid: int,
+        name: str,
+        username: str,
+        create_time: float,
+        status: str,
+        num_threads: int,
+        cpu_time: float,
+        rss: int,
+        read_bytes: int,
+        write_bytes: int,
+    ) -> None:
+        self.pid = pid
+        self.name = name
+        self.username = username
+        self.create_time = create_time
+        self.status = status
+        self.num_threads = num_threads
+        self.cpu_time = cpu_time
+        self.rss = rss
+        self.read_bytes = read_bytes
+        self.write_bytes = write_bytes
+
+    def cpu_times(self) -> tuple[float]:
+        return (self.cpu_time,)
+
+    def memory_info(self) -> _MemInfo:
+        return _MemInfo(self.rss)
+
+    def io_counters(self) -> _IoCounters:
+        return _IoCounters(self.read_bytes, self.write_bytes)
+
+
+class ProcSampler:
+    """Sample many processes per call from ``/proc`` without psutil objects.
+
+    :meth:`sample` fills the parallel arrays ``pid``, ``cpu_time``, ``rss``,
+    ``threads``, ``read_bytes``, ``write_bytes`` and ``create_time`` (plus the
+    ``name``, ``user`` and ``status`` lists) from index ``0`` up to
+    :attr:`count`. The arrays grow on demand and are reused between calls, so
+    callers must copy anything they keep; :meth:`records` does that.
+    """
+
+    def __init__(self, proc_root: str = "/proc", capacity: int = 1024) -> None:
+        self.proc_root = proc_root
+        self.count = 0
+        self._capacity = 0
+        self.pid = array("l")
+        self.cpu_time = array("d")
+        self.rss = array("Q")
+        self.threads = array("l")
+        self.read_bytes = array("Q")
+        self.write_bytes = array("Q")
+        self.create_time = array("d")
+        self.name: list[str] = []
+        self.user: list[str] = []
+        self.status: list[str] = []
+        self._grow(max(1, capacity))
+        self._buf = bytearray(_BUF_SIZE)
+        self._view = memoryview(self._buf)
+        self._clk_tck = float(os.sysconf("SC_CLK_TCK"))
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        self._boot_time = self._read_boot_time()
+        # pid -> (starttime, comm, name, uid, username, io_readable)
+        self._ident: dict[int, tuple[int, bytes, str, int, str, bool]] = {}
+        self._users: dict[int, str] = {}
+
+    @staticmethod
+    def available(proc_root: str = "/proc") -> bool:
+        """Return ``True`` when ``/proc`` has the Linux per-process layout."""
+
+        return sys.platform.startswith("linux") and os.path.exists(
+            os.path.join(proc_root, "self", "stat")
+        )
+
+    def pids(self) -> list[int]:
+        """Return all PIDs and forget cached identities of exited ones."""
+
+        pids = [int(name) for name in os.listdir(self.proc_root) if name.isdigit()]
+        if len(self._ident) > len(pids):
+            alive = set(pids)
+            for pid in [p for p in self._ident if p not in alive]:
+                del self._ident[pid]
+        return pids
+
+    def sample(self, pids: Iterable[int]) -> int:
+        """Read *pids* into the arrays and return how many were sampled.
+
+        Processes that exit mid-sweep, or whose ``stat`` cannot be read, are
+        skipped.
+        """
+
+        count = 0
+        for pid in pids:
+            if count >= self._capacity:
+                self._grow(self._capacity * 2)
+            if self._read(pid, count):
+                count += 1
+        self.count = count
+        return count
+
+    def records(self, pids: Iterable[int]) -> list[ProcSample]:
+        """Sample *pids* and return them as :class:`ProcSample` objects."""
+
+        count = self.sample(pids)
+        pid, name, user = self.pid, self.name, self.user
+        create, status, threads = self.create_time, self.status, self.threads
+        cpu, rss, rd, wr = self.cpu_time, self.rss, self.read_bytes, self.write_bytes
+        return [
+            ProcSample(
+                pid[i], name[i], user[i], create[i], status[i],
+                threads[i], cpu[i], rss[i], rd[i], wr[i],
+            )
+            for i in range(count)
+        ]
+
+    # -- internals -------------------------------------------------------
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self._capacity
+        for arr in (
+            self.pid,
+            self.cpu_time,
+            self.rss,
+            self.threads,
+            self.read_bytes,
+            self.write_bytes,
+            self.create_time,
+        ):
+            arr.extend(array(arr.typecode, bytes(arr.itemsize * extra)))
+        for lst in (self.name, self.user, self.status):
+            lst.extend([""] * extra)
+        self._capacity = capacity
+
+    def _read_boot_time(self) -> float:
+        try:
+            with open(os.path.join(self.proc_root, "stat"), "rb") as f:
+                for line in f:
+                    if line.startswith(b"btime"):
+                        return float(line.split()[1])
+        except OSError:
+            pass
+        return psutil.boot_time()
+
+    def _read_file(self, path: str) -> int:
+        """Read up to ``_BUF_SIZE`` bytes of *path* into the shared buffer."""
+
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.readv(fd, [self._buf])
+        finally:
+            os.close(fd)
+
+    def _username(self, uid: int) -> str:
+        user = self._users.get(uid)
+        if user is None:
+            try:
+                user = pwd.getpwuid(uid).pw_name if pwd is not None else str(uid)
+            except KeyError:
+                user = str(uid)
+            self._users[uid] = user
+        return user
+
+    def _identity(
+        self, pid: int, base: str, start: int, comm: bytes
+    ) -> tuple[int, bytes, str, int, str, bool]:
+        ident = self._ident.get(pid)
+        if ident is not None and ident[0] == start and ident[1] == comm:
+            return ident
+        name = comm.decode("utf-8", "replace")
+        uid = ident[3] if ident is not None and ident[0] == start else -1
+        try:
+            n = self._read_file(base + "status")
+            data = self._buf[:n]
+            at = data.find(b"\nUid:")
+            if at >= 0:
+                uid = int(data[at + 5 :].split(None, 1)[0])
+            if len(comm) >= _COMM_LEN:
+                # Like psutil, recover the full name from argv[0].
+                n = self._read_file(base + "cmdline")
+                argv0 = bytes(self._buf[:n]).split(b"\0", 1)[0]
+                exe = os.path.basename(argv0).decode("utf-8", "replace")
+                if exe.startswith(name):
+                    name = exe
+        except (OSError, ValueError):
+            pass
+        user = self._username(uid) if uid >= 0 else ""
+        ident = (start, comm, name, uid, user, True)
+        self._ident[pid] = ident
+        return ident
+
+    def _read(self, pid: int, i: int) -> bool:
+        base = f"{self.proc_root}/{pid}/"
+        try:
+            n = self._read_file(base + "stat")
+        except OSError:
+            return False
+        buf = self._buf
+        lpar = buf.find(b"(", 0, n)
+        rpar = buf.rfind(b")", 0, n)
+        if lpar < 0 or rpar < 0:
+            return False
+        fields = bytes(self._view[rpar + 2 : n]).split()
+        try:
+            start = int(fields[_STARTTIME])
+            cpu = (int(fields[_UTIME]) + int(fields[_STIME])) / self._clk_tck
+            threads = int(fields[_THREADS])
+            state = fields[_STATE].decode()
+        except (IndexError, ValueError):
+            return False
+        ident = self._identity(pid, base, start, bytes(self._view[lpar + 1 : rpar]))
+        try:
+            # ``statm`` is what psutil reports; the ``stat`` rss field can lag.
+            n = self._read_file(base + "statm")
+            rss = int(bytes(self._view[:n]).split(None, 2)[1]) * self._page_size
+        except (OSError, IndexError, ValueError):
+            return False
+        read_bytes = write_bytes = 0
+        if ident[5]:
+            try:
+                n = self._read_file(base + "io")
+            except PermissionError:
+                # Not ours to read; remember so the next sweep skips the open.
+                self._ident[pid] = ident[:5] + (False,)
+            except OSError:
+                pass
+            else:
+                data = bytes(self._view[:n])
+                at = data.find(b"\nread_bytes:")
+                if at >= 0:
+                    rest = data[at + 12 :].split(None, 3)
+                    try:
+                        read_bytes = int(rest[0])
+                        write_bytes = int(rest[2])
+                    except (IndexError, ValueError):
+                        pass
+        self.pid[i] = pid
+        self.cpu_time[i] = cpu
+        self.rss[i] = rss
+        self.threads[i] = threads
+        self.read_bytes[i] = read_bytes
+        self.write_bytes[i] = write_bytes
+        self.create_time[i] = self._boot_time + start / self._clk_tck
+        self.name[i] = ident[2]
+        self.user[i] = ident[4]
+        self.status[i] = _STATUS.get(state, state)
+        return True
+
+
+def benchmark_samplers(rounds: int = 5) -> dict[str, float]:
+    """Return mean seconds per full sweep for the psutil and ``/proc`` paths.
+
+    The psutil sweep mirrors :class:`ProcessWatcher`'s attribute set. The
+    result also carries ``processes`` (the count seen by the last ``/proc``
+    sweep) and ``speedup``. Requires Linux.
+    """
+
+    if not ProcSampler.available():
+        raise RuntimeError("benchmark_samplers requires Linux /proc")
+    attrs = [
+        "pid",
+        "name",
+        "username",
+        "create_time",
+        "memory_info",
+        "status",
+        "num_threads",
+        "io_counters",
+        "cpu_times",
+    ]
+    sampler = ProcSampler()
+    sampler.records(sampler.pids())  # warm the identity cache like a live watcher
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for proc in psutil.process_iter(attrs=attrs):
+            with proc.oneshot():
+                proc.info.get("memory_info")
+    psutil_time = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        records = sampler.records(sampler.pids())
+    procfs_time = (time.perf_counter() - start) / rounds
+
+    return {
+        "processes": float(len(records)),
+        "psutil": psutil_time,
+        "procfs": procfs_time,
+        "speedup": psutil_time / procfs_time if procfs_time else 0.0,
+    }
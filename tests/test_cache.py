@@ -31,7 +31,13 @@ def test_cache_prune_refresh(tmp_path):
 def test_cache_stats(tmp_path):
     file = tmp_path / "cache.json"
     cache = CacheManager[int](file)
-    assert cache.stats() == {"hits": 0, "misses": 0}
+    assert cache.stats() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "entries": 0,
+        "bytes": 0,
+    }
     cache.set("a", 1, ttl=1)
     assert cache.get("a") == 1
     assert cache.get("b") is None
@@ -87,9 +93,12 @@ def test_cache_reset_stats(tmp_path):
     cache.set("a", 1, ttl=1)
     cache.get("a")
     cache.get("b")
-    assert cache.stats() != {"hits": 0, "misses": 0}
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
     cache.reset_stats()
-    assert cache.stats() == {"hits": 0, "misses": 0}
+    stats = cache.stats()
+    assert stats["hits"] == 0 and stats["misses"] == 0
+    assert stats["entries"] == 1 and stats["bytes"] > 0
 
 
 def test_cache_keys_values_items(tmp_path):
@@ -102,3 +111,102 @@ def test_cache_keys_values_items(tmp_path):
     assert list(cache) == ["a"]
     assert cache.values() == [1]
     assert cache.items() == [("a", 1)]
+
+
+def test_cache_log_backend_appends(tmp_path):
+    file = tmp_path / "cache.log"
+    cache = CacheManager[int](file, backend="log")
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    cache.delete("a")
+    lines = file.read_text().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[-1]) == {"k": "a", "d": 1}
+
+    reopened = CacheManager[int](file, backend="log")
+    assert reopened.get("a") is None
+    assert reopened.get("b") == 2
+
+
+def test_cache_log_backend_picks_up_other_writers(tmp_path):
+    file = tmp_path / "cache.log"
+    first = CacheManager[int](file, backend="log")
+    second = CacheManager[int](file, backend="log")
+    first.set("a", 1, ttl=10)
+    second.set("b", 2, ttl=10)
+    assert second.get("a") == 1
+    assert first.get("b") == 2
+
+
+def test_cache_log_backend_compaction(tmp_path):
+    from coolbox.utils.files.cache import LogStructuredBackend
+
+    file = tmp_path / "cache.log"
+    backend = LogStructuredBackend[int](file, compact_min=8, compact_ratio=2, background=False)
+    cache = CacheManager[int](file, backend=backend)
+    for i in range(20):
+        cache.set("a", i, ttl=10)
+    assert len(file.read_text().splitlines()) < 20
+    assert CacheManager[int](file, backend="log").get("a") == 19
+
+
+def test_cache_log_backend_reads_legacy_json(tmp_path):
+    file = tmp_path / "cache.json"
+    file.write_text(json.dumps({"a": {"timestamp": time.time(), "ttl": 10, "value": 1}}))
+    cache = CacheManager[int](file, backend="log")
+    assert cache.get("a") == 1
+    cache.set("b", 2, ttl=10)
+    assert CacheManager[int](file, backend="log").get("b") == 2
+    cache.clear()
+    assert not file.exists()
+
+
+def test_cache_lru_eviction(tmp_path):
+    file = tmp_path / "cache.json"
+    cache = CacheManager[int](file, max_entries=2)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=10)
+    assert set(cache.keys()) == {"a", "c"}
+    assert cache.stats()["evictions"] == 1
+    assert set(json.loads(file.read_text())) == {"a", "c"}
+
+
+def test_cache_lfu_eviction(tmp_path):
+    file = tmp_path / "cache.log"
+    cache = CacheManager[int](file, backend="log", max_entries=2, eviction="lfu")
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    for _ in range(3):
+        cache.get("b")
+    cache.get("a")
+    cache.set("c", 3, ttl=10)
+    assert set(cache.keys()) == {"b", "c"}
+    assert CacheManager[int](file, backend="log").get("a") is None
+
+
+def test_cache_max_bytes(tmp_path):
+    file = tmp_path / "cache.json"
+    cache = CacheManager[str](file, max_bytes=400)
+    for i in range(10):
+        cache.set(str(i), "x" * 100, ttl=10)
+    stats = cache.stats()
+    assert 0 < stats["bytes"] <= 400
+    assert stats["evictions"] == 10 - stats["entries"]
+    assert cache.get("9") == "x" * 100
+
+
+def test_cache_sqlite_backend_shares_keys(tmp_path):
+    file = tmp_path / "cache.json"
+    first = CacheManager[int](file, backend="sqlite")
+    second = CacheManager[int](file, backend="sqlite")
+    first.set("a", 1, ttl=10)
+    first.set("b", 2, ttl=10)
+    assert second.get("a") == 1
+    second.delete("a")
+    assert first.get("a") is None
+    assert first.get("b") == 2
+    second.clear()
+    assert first.get("b") is None
+    assert (tmp_path / "cache.db").exists()
@@ -1865,6 +1865,7 @@ def test_async_ping_cache(monkeypatch):
         return "ttl=64", 0
 
     monkeypatch.setattr(network, "_run_async_ex", fake_run)
+    monkeypatch.setattr(network, "_PING_ENGINE", "subprocess")
 
     res1 = asyncio.run(network._async_ping_host("1.1.1.1", return_ttl=True))
     res2 = asyncio.run(network._async_ping_host("1.1.1.1", return_ttl=True))
@@ -1874,6 +1875,32 @@ def test_async_ping_cache(monkeypatch):
     assert calls == 1
 
 
+def test_async_ping_host_socket_engine(monkeypatch):
+    from coolbox.utils.network import discovery
+
+    network.clear_ping_cache()
+    ok, ttl = asyncio.run(network._async_ping_host("127.0.0.1", return_ttl=True))
+    assert ok
+    if asyncio.run(_icmp_available()):
+        assert ttl and network._guess_os_from_ttl(ttl)
+    else:
+        assert ttl is None
+
+    with socketserver.TCPServer(("127.0.0.1", 0), _Handler) as server:
+        port = server.server_address[1]
+        alive = asyncio.run(
+            discovery.ping_host("127.0.0.1", engine="tcp", tcp_ports=(port,))
+        )
+    assert alive[0] and alive[1] is None and alive[2] is not None
+    network.clear_ping_cache()
+
+
+async def _icmp_available() -> bool:
+    from coolbox.utils.network import discovery
+
+    return discovery.get_pinger().available()
+
+
 def test_ping_host_success(monkeypatch):
     monkeypatch.setattr(network, "_run_ex", lambda cmd, **k: ("", 0))
     assert network._ping_host("1.1.1.1") is True
@@ -2285,3 +2312,258 @@ def test_async_scan_hosts_iter(monkeypatch):
 
     assert hosts == ["h1", "h2"]
     assert updates[-2:] == [1.0, None]
+
+
+def test_async_scan_ports_engines_agree():
+    with socketserver.TCPServer(("localhost", 0), _Handler) as server:
+        port = server.server_address[1]
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            results = {
+                engine: asyncio.run(
+                    network.async_scan_ports(
+                        "localhost", port - 2, port + 2, cache_ttl=0, engine=engine
+                    )
+                )
+                for engine in ("raw", "stream")
+            }
+        finally:
+            server.shutdown()
+            thread.join()
+    assert results["raw"] == results["stream"] == [port]
+
+
+def test_raw_engine_adapts_timeout():
+    from coolbox.utils.network.engine import RttEstimator
+
+    est = RttEstimator()
+    assert est.timeout(0.5) == 0.5
+    for _ in range(10):
+        est.sample(0.001)
+    assert est.timeout(0.5, floor=0.01) < 0.05
+
+
+def test_auto_scan_diff_iter_reports_deltas(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        network, "AUTO_SCAN_STATE", network.CacheManager(tmp_path / "state.json")
+    )
+    live = {"h1": {22, 80}, "h2": {443}}
+    probed: dict[str, int] = {}
+
+    async def fake_detect(progress=None, **kw):
+        if progress:
+            progress(None)
+        return list(live)
+
+    async def fake_scan_port_list(host, ports, progress=None, **kw):
+        ports = list(ports)
+        probed[host] = len(ports)
+        if progress:
+            progress(None)
+        return sorted(live[host] & set(ports))
+
+    monkeypatch.setattr(network, "async_detect_local_hosts", fake_detect)
+    monkeypatch.setattr(network, "async_scan_port_list", fake_scan_port_list)
+
+    def sweep() -> dict[str, network.ScanDelta]:
+        deltas = asyncio.run(
+            network.async_auto_scan_diff(1, 1024, sample=0.0, rotate=8)
+        )
+        return {d.host: d for d in deltas}
+
+    first = sweep()
+    assert {h: (d.kind, d.opened) for h, d in first.items()} == {
+        "h1": ("added", [22, 80]),
+        "h2": ("added", [443]),
+    }
+    assert probed == {"h1": 1024, "h2": 1024}
+
+    probed.clear()
+    assert sweep() == {}
+    # Known hosts only re-probe their open ports plus one rotation slice.
+    assert 0 < probed["h1"] <= 1024 // 8 + 2
+
+    live["h1"] = {22}
+    del live["h2"]
+    third = sweep()
+    assert third["h1"].kind == "changed" and third["h1"].closed == [80]
+    assert third["h1"].result == [22] and third["h1"].previous == [22, 80]
+    assert third["h2"].kind == "removed" and third["h2"].closed == [443]
+
+    info = network.AutoScanInfo({22: network.PortInfo("ssh", "OpenSSH")}, hostname="h")
+    info.risk_score = 3
+    round_trip = network.auto_scan_info_from_dict(network.auto_scan_info_to_dict(info))
+    assert round_trip == info and round_trip.risk_score == 3
+
+
+def test_congestion_window_aimd_and_backoff():
+    from coolbox.utils.network.engine import CongestionWindow, RttEstimator
+
+    window = CongestionWindow(16, floor=2)
+    assert window.size == 16
+    window.shrink()
+    window.shrink()
+    assert window.size == 4
+    for _ in range(3):
+        window.shrink()
+    assert window.size == 2
+    for _ in range(20):
+        window.grow()
+    assert 2 < window.size < 16
+
+    est = RttEstimator(srtt=0.01, rttvar=0.005)
+    assert est.timeout(0.5) == pytest.approx(0.05)
+    est.expired()
+    est.expired()
+    assert est.timeout(0.5) == pytest.approx(0.2)
+    assert est.timeout(0.5, ceiling=0.1) == 0.1
+    est.sample(0.01)
+    assert est.timeout(0.5) == pytest.approx(0.05)
+    assert RttEstimator().timeout(0.5, ceiling=2.0) == 0.5
+
+
+def test_scan_records_rtt_estimate(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        network, "RTT_CACHE", network.CacheManager(tmp_path / "rtt.json")
+    )
+    with socketserver.TCPServer(("127.0.0.1", 0), _Handler) as server:
+        port = server.server_address[1]
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run(
+                network.async_scan_ports(
+                    "127.0.0.1", port - 2, port + 2, cache_ttl=0, engine="raw"
+                )
+            )
+        finally:
+            server.shutdown()
+            thread.join()
+
+    estimate = network.host_rtt_estimate("127.0.0.1")
+    assert estimate is not None
+    srtt, rttvar = estimate
+    assert 0 <= srtt < 0.5 and rttvar >= 0
+
+    warm = network._host_estimator("127.0.0.1")
+    assert warm.srtt == srtt
+
+    info = network.AutoScanInfo([port])
+    network._apply_rtt(info, "127.0.0.1")
+    assert network.auto_scan_info_to_dict(info)["rtt"] == srtt
+
+    network.clear_rtt_cache()
+    network.warm_rtt_estimates({"10.0.0.9": network.AutoScanInfo([], rtt=0.2)})
+    assert network.host_rtt_estimate("10.0.0.9") == (0.2, 0.1)
+
+
+def test_probe_scheduler_shares_budget_fairly():
+    from coolbox.utils.network.engine import ProbeScheduler
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(16)
+    port = listener.getsockname()[1]
+    order: list[int] = []
+    peak = 0
+
+    async def run() -> list[list[int]]:
+        nonlocal peak
+        scheduler = ProbeScheduler(6, 2)
+
+        def track(idx: int):
+            def update(_val: float) -> None:
+                nonlocal peak
+                order.append(idx)
+                peak = max(peak, scheduler.active)
+
+            return update
+
+        found = await asyncio.gather(
+            *(
+                scheduler.scan("127.0.0.1", range(port - 20, port + 1), progress=track(i))
+                for i in range(3)
+            )
+        )
+        return [[p for p, _b, _rtt in res] for res in found]
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        listener.close()
+
+    assert results == [[port]] * 3
+    assert peak <= 6
+    # Every host gets a turn before any host finishes its ports.
+    assert set(order[:12]) == {0, 1, 2}
+
+
+def test_probe_scheduler_mark_dead_stops_host():
+    from coolbox.utils.network.engine import ProbeScheduler
+
+    updates: list[float] = []
+
+    async def run():
+        scheduler = ProbeScheduler(4, 4)
+
+        def update(val: float) -> None:
+            updates.append(val)
+            if len(updates) == 5:
+                scheduler.mark_dead("127.0.0.1")
+
+        res = await scheduler.scan("127.0.0.1", range(1, 1001), progress=update)
+        return res, scheduler.active
+
+    res, active = asyncio.run(run())
+
+    assert res == []
+    assert active == 0
+    assert len(updates) == 6
+    assert updates[-1] == 1.0
+
+
+def test_async_scan_targets_shared_scheduler(monkeypatch):
+    created = []
+    real = network._shared_scheduler
+
+    def spy(engine, concurrency):
+        sched = real(engine, concurrency)
+        created.append(sched)
+        return sched
+
+    monkeypatch.setattr(network, "_shared_scheduler", spy)
+    with socketserver.TCPServer(("127.0.0.1", 0), _Handler) as server:
+        port = server.server_address[1]
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        updates: list[float | None] = []
+        try:
+            res = asyncio.run(
+                network.async_scan_targets(
+                    ["127.0.0.1", "localhost"],
+                    port - 1,
+                    port + 1,
+                    updates.append,
+                    cache_ttl=0,
+                    family=socket.AF_INET,
+                    engine="raw",
+                )
+            )
+        finally:
+            server.shutdown()
+            thread.join()
+
+    assert res == {"127.0.0.1": [port], "localhost": [port]}
+    assert len(created) == 1 and created[0] is not None
+    assert created[0].active == 0
+    assert updates[-2:] == [1.0, None]
+
+
+@pytest.mark.slow
+def test_benchmark_scan_engines():
+    rates = asyncio.run(
+        network.async_benchmark_scan_engines(listeners=8, ports=512)
+    )
+    assert set(rates) == {"stream", "raw"}
+    assert all(rate > 0 for rate in rates.values())
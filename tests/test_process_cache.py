@@ -1,7 +1,11 @@
+import os
+import struct
 import subprocess
 import sys
 import time
 
+import pytest
+
 from coolbox.utils import ProcessCache
 
 
@@ -20,3 +24,70 @@ def test_process_cache_updates_on_invalidate():
     time.sleep(0.01)
     snap2 = cache.snapshot()
     assert proc.pid not in snap2
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_process_cache_snapshot_is_read_only():
+    cache = ProcessCache()
+    try:
+        snap = cache.snapshot()
+        assert os.getpid() in snap
+        with pytest.raises(TypeError):
+            snap[0] = None  # type: ignore[index]
+    finally:
+        cache.close()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux watchers")
+@pytest.mark.parametrize("force_poll", [False, True])
+def test_process_cache_tracks_spawn_and_exit_incrementally(monkeypatch, force_poll):
+    if force_poll:
+        def denied(self):
+            raise PermissionError("CAP_NET_ADMIN required")
+
+        monkeypatch.setattr(ProcessCache, "_start_netlink", denied)
+    cache = ProcessCache(poll_interval=0.05)
+    try:
+        assert cache.watcher in ({"poll"} if force_poll else {"netlink", "poll"})
+        before = cache.snapshot()
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(1)"])
+        try:
+            assert _wait_for(lambda: proc.pid in cache.snapshot())
+            assert proc.pid not in before
+        finally:
+            proc.wait()
+        assert _wait_for(lambda: proc.pid not in cache.snapshot())
+        assert not cache._dirty
+    finally:
+        cache.close()
+
+
+def test_parse_proc_events_fork_exec_exit():
+    from coolbox.utils.processes import cache as cache_mod
+
+    def message(what, *fields):
+        body = cache_mod._PROC_EVENT.pack(what, 0, 0) + struct.pack(f"={len(fields)}I", *fields)
+        cn = cache_mod._CN_MSG.pack(1, 1, 0, 0, len(body), 0) + body
+        size = cache_mod._NLMSGHDR.size + len(cn)
+        pad = b"\0" * (-size % 4)
+        return cache_mod._NLMSGHDR.pack(size, cache_mod._NLMSG_DONE, 0, 0, 0) + cn + pad
+
+    data = (
+        message(cache_mod._PROC_EVENT_FORK, 1, 1, 100, 100)
+        + message(cache_mod._PROC_EVENT_FORK, 1, 1, 101, 100)  # thread
+        + message(cache_mod._PROC_EVENT_EXEC, 200, 200)
+        + message(cache_mod._PROC_EVENT_EXIT, 300, 300, 0, 0)
+        + message(cache_mod._PROC_EVENT_EXIT, 301, 300, 0, 0)  # thread exit
+    )
+    spawned, exited, overrun = cache_mod._parse_proc_events(data)
+    assert spawned == {100, 200}
+    assert exited == {300}
+    assert not overrun
@@ -54,7 +54,7 @@ def test_next_batch(monkeypatch):
     monkeypatch.setattr("psutil.process_iter", fake_iter)
 
     q = make_queue()
-    watcher = ProcessWatcher(q, batch_size=3)
+    watcher = ProcessWatcher(q, batch_size=3, sampler="psutil")
     try:
         batch, end = watcher._next_batch([])
         assert batch == objs[:3]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import os
+import sys
+from queue import Queue
+
+import psutil
+import pytest
+
+from coolbox.utils.process_monitor import ProcessWatcher
+from coolbox.utils.processes import procfs
+from coolbox.utils.processes.procfs import ProcSample, ProcSampler, benchmark_samplers
+
+linux_only = pytest.mark.skipif(
+    not ProcSampler.available(), reason="requires Linux /proc"
+)
+
+
+def _fake_proc(root, pid, *, comm="worker", start=100, uid=0, io=True):
+    proc = root / str(pid)
+    proc.mkdir(exist_ok=True)
+    rest = ["S"] + ["0"] * 10 + ["250", "150"] + ["0"] * 4 + ["3", "0", str(start), "0", "0"]
+    (proc / "stat").write_text(f"{pid} ({comm}) " + " ".join(rest) + "\n")
+    (proc / "statm").write_text("100 25 5 1 0 20 0\n")
+    (proc / "status").write_text(f"Name:\t{comm}\nUmask:\t0022\nUid:\t{uid}\t{uid}\t{uid}\t{uid}\n")
+    (proc / "cmdline").write_bytes(b"/usr/bin/" + comm.encode() + b"-full-name\0--flag\0")
+    if io:
+        (proc / "io").write_text(
+            "rchar: 1\nwchar: 2\nsyscr: 3\nsyscw: 4\nread_bytes: 4096\n"
+            "write_bytes: 8192\ncancelled_write_bytes: 0\n"
+        )
+    return proc
+
+
+@pytest.fixture
+def fake_root(tmp_path):
+    (tmp_path / "stat").write_text("cpu  1 2 3 4\nbtime 1000\n")
+    (tmp_path / "self").mkdir()
+    (tmp_path / "self" / "stat").write_text("")
+    return tmp_path
+
+
+@linux_only
+def test_sampler_parses_proc_files(fake_root):
+    _fake_proc(fake_root, 10, comm="odd (name) x")
+    _fake_proc(fake_root, 11, io=False)
+    sampler = ProcSampler(str(fake_root), capacity=1)
+    records = {r.pid: r for r in sampler.records(sorted(sampler.pids()))}
+    assert set(records) == {10, 11}
+    rec = records[10]
+    clk = os.sysconf("SC_CLK_TCK")
+    assert rec.name == "odd (name) x"
+    assert rec.status == psutil.STATUS_SLEEPING
+    assert rec.num_threads == 3
+    assert rec.cpu_time == pytest.approx(400 / clk)
+    assert rec.rss == 25 * os.sysconf("SC_PAGE_SIZE")
+    assert rec.create_time == pytest.approx(1000 + 100 / clk)
+    assert (rec.read_bytes, rec.write_bytes) == (4096, 8192)
+    assert rec.username == "root"
+    assert records[11].io_counters() == (0, 0)
+    assert sampler.count == 2
+
+
+@linux_only
+def test_sampler_caches_identity_until_start_time_changes(fake_root, monkeypatch):
+    _fake_proc(fake_root, 20, comm="a-very-long-comm")  # 16 chars >= 15
+    sampler = ProcSampler(str(fake_root))
+    reads: list[str] = []
+    real = ProcSampler._read_file
+
+    def spy(self, path):
+        reads.append(os.path.basename(path))
+        return real(self, path)
+
+    monkeypatch.setattr(ProcSampler, "_read_file", spy)
+    (rec,) = sampler.records([20])
+    assert rec.name == "a-very-long-comm-full-name"
+    assert reads.count("status") == 1 and reads.count("cmdline") == 1
+
+    reads.clear()
+    sampler.records([20])
+    assert "status" not in reads and "cmdline" not in reads
+
+    # A recycled PID has a new start time and is re-identified.
+    _fake_proc(fake_root, 20, comm="short", start=999, uid=424242)
+    reads.clear()
+    (rec,) = sampler.records([20])
+    assert reads.count("status") == 1
+    assert rec.name == "short"
+    assert rec.username == "424242"
+
+
+@linux_only
+def test_sampler_matches_psutil_for_current_process():
+    sampler = ProcSampler()
+    (rec,) = sampler.records([os.getpid()])
+    proc = psutil.Process()
+    assert rec.name == proc.name()
+    assert rec.username == proc.username()
+    assert rec.create_time == pytest.approx(proc.create_time(), abs=0.05)
+    assert rec.num_threads == proc.num_threads()
+    assert rec.cpu_time <= sum(proc.cpu_times()[:2]) + 0.05
+    assert abs(rec.rss - proc.memory_info().rss) < 16 * 1024 * 1024
+    assert sampler.records([2**22 + 12345]) == []
+
+
+@linux_only
+def test_watcher_uses_procfs_batches():
+    watcher = ProcessWatcher(Queue(), batch_size=2, sampler="procfs")
+    try:
+        batch, end = watcher._next_batch([])
+        assert all(isinstance(p, ProcSample) for p in batch)
+        assert watcher.process_count >= len(batch)
+        seen = {p.pid for p in batch}
+        while not end:
+            batch, end = watcher._next_batch([])
+            seen.update(p.pid for p in batch)
+        assert os.getpid() in seen
+        basic = watcher._basic_info(next(iter(watcher._sampler.records([os.getpid()]))))
+        assert basic is not None and basic[0] == os.getpid()
+    finally:
+        watcher.stop()
+
+
+def test_watcher_rejects_unknown_sampler():
+    with pytest.raises(ValueError):
+        ProcessWatcher(Queue(), sampler="bogus")
+
+
+def test_watcher_psutil_sampler_disables_procfs():
+    watcher = ProcessWatcher(Queue(), sampler="psutil")
+    try:
+        assert watcher._sampler is None
+    finally:
+        watcher.stop()
+
+
+@linux_only
+def test_benchmark_samplers_reports_both_paths():
+    result = benchmark_samplers(rounds=1)
+    assert result["processes"] >= 1
+    assert result["psutil"] > 0 and result["procfs"] > 0
+    assert result["speedup"] == pytest.approx(result["psutil"] / result["procfs"])
+
+
+@pytest.mark.skipif(sys.platform.startswith("linux"), reason="non-Linux only")
+def test_sampler_unavailable_off_linux():
+    assert not procfs.ProcSampler.available()
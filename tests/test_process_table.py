@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from coolbox.utils.process_monitor import ProcessEntry, ProcessTable
+
+
+def _add(table: ProcessTable, pid: int, cpu: float = 0.0, mem: float = 10.0) -> ProcessEntry:
+    return table.add(pid, f"p{pid}", cpu, mem, "u", 0.0, "running", 0.0, 1, 0, 0, 0, 0)
+
+
+def test_rows_are_reused_from_free_list() -> None:
+    table = ProcessTable(capacity=2)
+    first = _add(table, 1)
+    _add(table, 2)
+    row = first._row
+    table.release(1)
+    assert 1 not in table
+    reused = _add(table, 3)
+    assert reused._row == row
+    assert table.capacity == 2
+    _add(table, 4)
+    assert table.capacity == 4
+    assert len(table) == 3
+
+
+def test_released_view_keeps_last_values() -> None:
+    table = ProcessTable(capacity=1)
+    entry = _add(table, 1, cpu=5.0)
+    entry.add_sample(1.0, 0.0, 10.0)
+    entry.add_sample(2.0, 0.0, 10.0)
+    table.release(1)
+    _add(table, 2, cpu=50.0)
+    assert entry._table is not table
+    assert entry.pid == 1
+    assert entry.cpu == 5.0
+    assert list(entry.samples) == [1.0, 2.0]
+
+
+def test_adopt_moves_standalone_entry() -> None:
+    entry = ProcessEntry(
+        pid=7,
+        name="p",
+        cpu=1.0,
+        mem=2.0,
+        user="u",
+        start=0.0,
+        status="",
+        cpu_time=0.0,
+        threads=1,
+        read_bytes=0,
+        write_bytes=0,
+        files=0,
+        conns=0,
+        samples=range(8),
+        max_samples=6,
+    )
+    entry.trending_mem = True
+    table = ProcessTable(sample_width=3)
+    assert table.adopt(entry) is entry
+    assert table.get(7) is entry
+    assert entry.trending_mem
+    assert list(entry.samples) == [2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+    entry.add_sample(8.0, 0.0, 0.0)
+    assert list(entry.samples)[-1] == 8.0
+    assert len(entry.samples) == 6
+
+
+def test_batch_kernels_match_single_entries() -> None:
+    table = ProcessTable()
+    batch = [_add(table, pid, cpu=float(pid)) for pid in range(1, 6)]
+    singles = [
+        ProcessEntry(
+            pid=pid,
+            name=f"p{pid}",
+            cpu=float(pid),
+            mem=10.0,
+            user="u",
+            start=0.0,
+            status="running",
+            cpu_time=0.0,
+            threads=1,
+            read_bytes=0,
+            write_bytes=0,
+            files=0,
+            conns=0,
+        )
+        for pid in range(1, 6)
+    ]
+    rows = [entry._row for entry in batch]
+    for step in range(6):
+        for batch_entry, single in zip(batch, singles):
+            for entry in (batch_entry, single):
+                entry.cpu = entry.pid * (step + 1)
+                entry.mem = 10.0 + step * entry.pid * 20
+                entry.add_sample(entry.cpu, entry.io_rate, entry.mem)
+        changed = table.score_changes(rows)
+        table.compute_trends(rows, 3, 3, 3, 2.0, 10.0, 1.0)
+        table.update_levels(rows, 10.0, 100.0, 1.0, 20.0, 300.0)
+        for flag, batch_entry, single in zip(changed, batch, singles):
+            assert flag == single._score_against(single)
+            single.compute_trends(3, 3, 3, 2.0, 10.0, 1.0)
+            single.update_level(10.0, 100.0, 1.0, 20.0, 300.0)
+            assert batch_entry.baseline_cpu == single.baseline_cpu
+            assert batch_entry.score_sum == single.score_sum
+            assert batch_entry.trending_cpu == single.trending_cpu
+            assert batch_entry.trending_mem == single.trending_mem
+            assert batch_entry.level == single.level
+    assert batch[-1].level == "critical"